@@ -1,8 +1,17 @@
 from .collector import Collector
 from .kpynetic import Kpynetic
 from .calculator import Calculator
-from .fitter import Fitter
+from .fitter import Fitter, Dataset
+from .sampler import Sampler
+from .sensitivity import Sensitivity
+from .control import RateControl
+from .descriptor import Descriptor
+from .impedance import Impedance
+from .transient import Transient
 from .coordinator import Coordinator
+from .screener import Screener
+from .volcano import Volcano
+from .pruner import Pruner
 from .grapher import Grapher
 from .writer import Writer
 from .tools import Tool
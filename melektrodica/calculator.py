@@ -14,6 +14,7 @@ import warnings
 import numpy as np
 from scipy.optimize import fsolve
 
+from .constants import F, k_B
 from .kpynetic import Kpynetic
 from .writer import Writer
 
@@ -60,6 +61,33 @@ class BaseConcentration:
     fval : None or other
         Placeholder for a computed function value during calculations
         (e.g., objective function value).
+    state : None or numpy.ndarray
+        Converged state variables at each potential.
+    rates : None or numpy.ndarray
+        Forward and negative backward rates of each reaction at each potential, set
+        by `linearize`.
+    dnudc : None or numpy.ndarray
+        Derivatives of the reaction rates with respect to the concentrations of every
+        species, set by `linearize`.
+    dnudx : None or numpy.ndarray
+        Derivatives of the reaction rates with respect to the state variables, set by
+        `linearize`.
+    dfdx : None or numpy.ndarray
+        Jacobian of the steady-state equations with respect to the state variables,
+        set by `linearize`.
+    forward : None or numpy.ndarray
+        Forward rate of each reaction at each potential, of shape
+        (n_potentials, n_reactions), set by `solver`.
+    backward : None or numpy.ndarray
+        Backward rate of each reaction at each potential, set by `solver`.
+    nu : None or numpy.ndarray
+        Net rate of each reaction at each potential, set by `solver`.
+    j_partial : None or numpy.ndarray
+        Partial current density of each reaction at each potential, whose sum is
+        ``j``, set by `solver`.
+    production : None or numpy.ndarray
+        Net formation rate of each product at each potential, of shape
+        (n_potentials, n_products), set by `solver`.
     """
 
     def __init__(self, kpy):
@@ -118,10 +146,21 @@ class BaseConcentration:
         self.theta = None
         self.j = None
         self.fval = None
-
-    def solver(self):
+        self.n_solved = 0
+        self.state = None
+        self.rates = None
+        self.dnudc = None
+        self.dnudx = None
+        self.dfdx = None
+        self.forward = None
+        self.backward = None
+        self.nu = None
+        self.j_partial = None
+        self.production = None
+
+    def solver(self, callback=None, initial=None):
         """
-        solver(self)
+        solver(self, callback=None, initial=None)
 
         Solves a system of equations for steady-state reaction kinetics and computes
         reactant, product, and adsorbed species concentrations as well as the
@@ -132,12 +171,27 @@ class BaseConcentration:
         debugging purposes. If convergence issues occur, an exception is raised
         for the specific potential value.
 
+        Parameters
+        ----------
+        callback : callable, optional
+            Called as ``callback(i, j)`` after the steady state at the ``i``-th
+            potential has been found, with ``j`` the current density at that
+            potential. If it returns ``True`` the sweep stops early and the
+            remaining potentials are left at zero. The number of solved potentials
+            is stored in ``n_solved``.
+        initial : numpy.ndarray, optional
+            Initial guess of the state variables at the first potential, for
+            instance the steady state of a similar model. Default is None, the
+            guess of `initialize`.
+
         Returns
         -------
         self : object
             The instance of the class with updated attributes for steady-state
             reactant, product, adsorbed species concentrations, computed current
-            densities, and other intermediate results.
+            densities, and other intermediate results. The forward and backward rates
+            of the converged states are kept, and the net rates, partial currents and
+            production rates derived from them, see `decompose`.
         """
 
         with warnings.catch_warnings(record=True) as w:
@@ -152,8 +206,15 @@ class BaseConcentration:
         self.theta = np.zeros(
             (len(self.operation.potential), len(self.species.adsorbed))
         )
+        self.potential = self.operation.potential
         self.j = np.zeros(len(self.potential))
         self.fval, initio = self.initialize()
+        if initial is not None:
+            initio = np.array(initial, dtype=float)
+        self.state = np.zeros((len(self.potential), len(initio)))
+        self.forward = np.zeros((len(self.potential), len(self.reactions.list)))
+        self.backward = np.zeros((len(self.potential), len(self.reactions.list)))
+        self.n_solved = 0
         for i, potential in enumerate(self.operation.potential):
             solution = fsolve(
                 self.steady_state, initio, args=potential, xtol=1e-9, maxfev=2000
@@ -162,8 +223,13 @@ class BaseConcentration:
                 self.unzip_variables(solution)
             )
             self.fval[i] = self.steady_state(solution, potential)
-            self.j[i] = self.current(solution, potential)
+            self.state[i] = solution
+            self.forward[i], self.backward[i] = self.fluxes(solution, potential)
+            self.j[i] = F * np.dot(self.reactions.ne, self.forward[i] - self.backward[i])
             initio = solution
+            self.n_solved = i + 1
+            if callback is not None and callback(i, self.j[i]):
+                break
 
         for warning in w:
             if issubclass(warning.category, RuntimeWarning):
@@ -172,8 +238,295 @@ class BaseConcentration:
                 )
                 if "The iteration is not making good progress" in str(warning.message):
                     raise RuntimeError(f"Convergence failed at potential {potential}")
+        return self.decompose()
+
+    def decompose(self):
+        """
+        Net rates, partial currents and production rates from the converged forward
+        and backward rates.
+
+        .. math::
+
+            \\nu_i = \\overrightarrow{\\nu_i} - \\overleftarrow{\\nu_i}, \\quad
+            j_i = F n_i \\nu_i, \\quad
+            r_k = \\sum_i \\upsilon_{ik} \\nu_i
+
+        Returns
+        -------
+        self : object
+            The instance with ``nu``, ``j_partial`` and ``production`` set.
+        """
+        start = len(self.species.reactants)
+        products = slice(start, start + len(self.species.products))
+        self.nu = self.forward - self.backward
+        self.j_partial = F * self.nu * self.reactions.ne
+        self.production = self.nu @ self.reactions.upsilon[:, products]
         return self
 
+    def fluxes(self, variables, potential):
+        """
+        Forward and backward rates of every reaction given by their rate laws.
+
+        Parameters
+        ----------
+        variables : numpy.ndarray
+            State variables.
+        potential : float
+            Applied potential.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The forward and backward rates of each reaction.
+        """
+        c_reactants, c_products, theta = self.unzip_variables(variables)
+        rates = self.Kpy.rate_constants(potential) * self.Kpy.power_law(
+            self.Kpy.concentrate(c_reactants, c_products, theta),
+            self.reactions.upsilon,
+        )
+        return rates[0], -rates[1]
+
+    def product_index(self, products=None):
+        """
+        Positions of a selection of products.
+
+        Parameters
+        ----------
+        products : list of str, optional
+            Names of the products. Default is None, every product.
+
+        Returns
+        -------
+        list of int
+            The positions of the products in ``production``.
+        """
+        if products is None:
+            return list(range(len(self.species.products)))
+        return [self.species.products.index(product) for product in products]
+
+    def selectivity(self, products=None):
+        """
+        Selectivity of each product among a selection of products.
+
+        Parameters
+        ----------
+        products : list of str, optional
+            Names of the products compared, for instance without the protons released.
+            Default is None, every product.
+
+        Returns
+        -------
+        numpy.ndarray
+            The fraction of the formation rate of each product, of shape
+            (n_potentials, n_selected).
+        """
+        production = self.production[:, self.product_index(products)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return production / np.sum(production, axis=1, keepdims=True)
+
+    def faradaic_efficiency(self, electrons, products=None):
+        """
+        Faradaic efficiency of each product.
+
+        .. math::
+
+            FE_k = \\frac{z_k F r_k}{j}
+
+        Parameters
+        ----------
+        electrons : array_like
+            Electrons released per molecule of each product, :math:`z_k`, negative for
+            reduction products, as the number of electrons of the reactions.
+        products : list of str, optional
+            Names of the products, in the order of ``electrons``. Default is None,
+            every product.
+
+        Returns
+        -------
+        numpy.ndarray
+            The Faradaic efficiencies, of shape (n_potentials, n_selected).
+        """
+        production = self.production[:, self.product_index(products)]
+        charge = F * np.asarray(electrons, dtype=float) * production
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return charge / self.j[:, None]
+
+    def linearize(self):
+        """
+        Linearizes the steady-state equations at every solved potential.
+
+        With the state variables :math:`\\mathbf{x}` and the residual of the steady state
+        :math:`\\mathbf{f} = \\boldsymbol{\\upsilon}^T \\boldsymbol{\\nu} - \\mathbf{rhs}`,
+        the Jacobian is
+
+        .. math::
+
+            \\frac{\\partial \\mathbf{f}}{\\partial \\mathbf{x}} =
+                \\boldsymbol{\\upsilon}^T \\frac{\\partial \\boldsymbol{\\nu}}{\\partial \\mathbf{c}}
+                \\frac{\\partial \\mathbf{c}}{\\partial \\mathbf{x}}
+                - \\frac{\\partial \\, \\mathbf{rhs}}{\\partial \\mathbf{x}}
+
+        where :math:`\\mathbf{c}` are the concentrations of every species, empty sites
+        included. The rate derivatives are analytic, see `Kpynetic.rate_jacobian`.
+
+        Returns
+        -------
+        self : object
+            The instance with ``rates``, ``dnudc``, ``dnudx`` and ``dfdx`` set for
+            the ``n_solved`` potentials.
+        """
+        upsilon = self.reactions.upsilon
+        dcdx = self.concentration_jacobian()
+        self.rates = np.zeros((self.n_solved, 2, len(upsilon)))
+        self.dnudc = np.zeros((self.n_solved, len(upsilon), dcdx.shape[0]))
+        for i in range(self.n_solved):
+            c_reactants, c_products, theta = self.unzip_variables(self.state[i])
+            k_rate = self.Kpy.rate_constants(self.operation.potential[i])
+            concentration = self.Kpy.concentrate(c_reactants, c_products, theta)
+            self.rates[i] = k_rate * self.Kpy.power_law(concentration, upsilon)
+            self.dnudc[i] = self.Kpy.rate_jacobian(k_rate, concentration, upsilon)
+        self.dnudx = self.dnudc @ dcdx
+        self.dfdx = (
+                np.einsum("rm,nrk->nmk", self.reactions.upsilonx, self.dnudx)
+                - self.right_hand_side_jacobian()
+        )
+        return self
+
+    def sensitivity(self, dlnkf, dlnkb):
+        """
+        Steady-state sensitivities to perturbations of the rate constants.
+
+        For parameters :math:`\\mathbf{p}` acting on the logarithm of the rate
+        constants, the implicit function theorem applied to the steady state gives
+
+        .. math::
+
+            \\frac{d \\mathbf{x}}{d \\mathbf{p}} =
+                -\\left(\\frac{\\partial \\mathbf{f}}{\\partial \\mathbf{x}}\\right)^{-1}
+                \\boldsymbol{\\upsilon}^T \\frac{\\partial \\boldsymbol{\\nu}}{\\partial \\mathbf{p}},
+            \\quad
+            \\frac{\\partial \\nu_i}{\\partial \\mathbf{p}} =
+                \\overrightarrow{\\nu_i} \\frac{\\partial \\ln \\overrightarrow{k_i}}{\\partial \\mathbf{p}}
+                - \\overleftarrow{\\nu_i} \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial \\mathbf{p}}
+
+        solved for every potential and parameter in one batched linear solve. Requires
+        `linearize`.
+
+        Parameters
+        ----------
+        dlnkf : numpy.ndarray
+            Derivatives of the logarithm of the forward rate constants, broadcastable
+            to (n_potentials, n_reactions, n_parameters).
+        dlnkb : numpy.ndarray
+            Derivatives of the logarithm of the backward rate constants, with the same
+            shape.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The total derivatives of the state variables, of shape
+            (n_potentials, n_states, n_parameters), and of the reaction rates, of shape
+            (n_potentials, n_reactions, n_parameters).
+        """
+        dnu = self.rates[:, 0, :, None] * dlnkf + self.rates[:, 1, :, None] * dlnkb
+        return self.response(dnu)
+
+    def response(self, dnu, drhs=None):
+        """
+        Steady-state response to explicit perturbations of the rates and of the
+        right-hand side.
+
+        .. math::
+
+            \\frac{d \\mathbf{x}}{d \\mathbf{p}} =
+                -\\left(\\frac{\\partial \\mathbf{f}}{\\partial \\mathbf{x}}\\right)^{-1}
+                \\left(\\boldsymbol{\\upsilon}^T \\frac{\\partial \\boldsymbol{\\nu}}{\\partial \\mathbf{p}}
+                - \\frac{\\partial \\, \\mathbf{rhs}}{\\partial \\mathbf{p}}\\right), \\quad
+            \\frac{d \\boldsymbol{\\nu}}{d \\mathbf{p}} =
+                \\frac{\\partial \\boldsymbol{\\nu}}{\\partial \\mathbf{p}}
+                + \\frac{\\partial \\boldsymbol{\\nu}}{\\partial \\mathbf{x}}
+                \\frac{d \\mathbf{x}}{d \\mathbf{p}}
+
+        Requires `linearize`.
+
+        Parameters
+        ----------
+        dnu : numpy.ndarray
+            Explicit derivatives of the reaction rates, of shape
+            (n_potentials, n_reactions, n_parameters).
+        drhs : numpy.ndarray, optional
+            Explicit derivatives of the right-hand side, broadcastable to
+            (n_potentials, n_states, n_parameters). Default is None, no dependence.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The total derivatives of the state variables and of the reaction rates.
+        """
+        df = np.einsum("rm,nrp->nmp", self.reactions.upsilonx, dnu)
+        if drhs is not None:
+            df = df - drhs
+        dx = -np.linalg.solve(self.dfdx, df)
+        return dx, dnu + self.dnudx @ dx
+
+    def current_sensitivity(self, dlnkf, dlnkb):
+        """
+        Steady-state sensitivities of the current density.
+
+        .. math::
+
+            \\frac{d J}{d \\mathbf{p}} = F \\sum_i n_i \\frac{d \\nu_i}{d \\mathbf{p}}
+
+        Parameters
+        ----------
+        dlnkf : numpy.ndarray
+            Derivatives of the logarithm of the forward rate constants, see `sensitivity`.
+        dlnkb : numpy.ndarray
+            Derivatives of the logarithm of the backward rate constants.
+
+        Returns
+        -------
+        numpy.ndarray
+            The derivatives of the current density, of shape
+            (n_potentials, n_parameters).
+        """
+        _, dnu = self.sensitivity(dlnkf, dlnkb)
+        return F * np.einsum("r,nrp->np", self.reactions.ne, dnu)
+
+    def potential_derivatives(self):
+        """
+        Derivatives of the logarithm of the rate constants with respect to the
+        potential.
+
+        .. math::
+
+            \\frac{\\partial \\ln \\overrightarrow{k_i}}{\\partial \\eta} = \\frac{n_i\\beta_i}{k_BT}, \\quad
+            \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial \\eta} = -\\frac{n_i(1-\\beta_i)}{k_BT}
+
+        with the sign of the electrode.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The derivatives of the forward and backward rate constants of each reaction.
+        """
+        kT = k_B * self.operation.temperature
+        electronic = self.Kpy.electrode * self.reactions.ne / kT
+        return electronic * self.reactions.beta, -electronic * (1 - self.reactions.beta)
+
+    def mass_matrix(self, site_density, height=None):
+        """
+        Diagonal of the mass matrix of the transient equations.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not overridden in a subclass.
+        """
+        raise NotImplementedError(
+            "The method mass_matrix must be implemented by the subclass"
+        )
+
     def initialize(self):
         """
         Raises
@@ -211,6 +564,47 @@ class BaseConcentration:
             "The method unzip_variables must be implemented by the subclass"
         )
 
+    def concentration_jacobian(self):
+        """
+        Derivatives of the concentrations of every species with respect to the state
+        variables.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not overridden in a subclass.
+        """
+        raise NotImplementedError(
+            "The method concentration_jacobian must be implemented by the subclass"
+        )
+
+    def right_hand_side_jacobian(self):
+        """
+        Derivatives of the right-hand side with respect to the state variables.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not overridden in a subclass.
+        """
+        raise NotImplementedError(
+            "The method right_hand_side_jacobian must be implemented by the subclass"
+        )
+
+    def inlet_jacobian(self):
+        """
+        Derivatives of the concentrations and of the right-hand side with respect to
+        the initial concentrations of the bulk species.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not overridden in a subclass.
+        """
+        raise NotImplementedError(
+            "The method inlet_jacobian must be implemented by the subclass"
+        )
+
     def right_hand_side(self, c_reactants, c_products, theta):
         """
         Computes the right-hand side of a system of ordinary differential equations (ODEs).
@@ -270,6 +664,38 @@ class BaseConcentration:
         self.Kpy.foverpotential(potential, c_reactants, c_products, theta)
         return self.Kpy.dcdt(self.Kpy.nu, self.reactions.upsilonx) - rhs
 
+    def jacobian(self, variables, potential):
+        """
+        Jacobian of the steady-state equations at any state and potential.
+
+        .. math::
+
+            \\frac{\\partial \\mathbf{f}}{\\partial \\mathbf{x}} =
+                \\boldsymbol{\\upsilon}^T \\frac{\\partial \\boldsymbol{\\nu}}{\\partial \\mathbf{c}}
+                \\frac{\\partial \\mathbf{c}}{\\partial \\mathbf{x}}
+                - \\frac{\\partial \\, \\mathbf{rhs}}{\\partial \\mathbf{x}}
+
+        Parameters
+        ----------
+        variables : numpy.ndarray
+            State variables.
+        potential : float
+            Applied potential.
+
+        Returns
+        -------
+        numpy.ndarray
+            The Jacobian, of shape (n_states, n_states).
+        """
+        c_reactants, c_products, theta = self.unzip_variables(variables)
+        k_rate = self.Kpy.rate_constants(potential)
+        concentration = self.Kpy.concentrate(c_reactants, c_products, theta)
+        dnudc = self.Kpy.rate_jacobian(k_rate, concentration, self.reactions.upsilon)
+        return (
+                self.reactions.upsilonx.T @ dnudc @ self.concentration_jacobian()
+                - self.right_hand_side_jacobian()
+        )
+
     def current(self, variables, potential):
         """
         Calculates the current for a given set of variables and potential using
@@ -398,6 +824,211 @@ class StaticConcentration(BaseConcentration):
         """
         return np.zeros(len(theta))
 
+    def concentration_jacobian(self):
+        """
+        Derivatives of the concentrations with respect to the coverages.
+
+        Bulk concentrations are fixed and the empty sites follow from the site
+        balance, so
+
+        .. math::
+
+            \\frac{\\partial \\mathbf{c}}{\\partial \\boldsymbol{\\theta}} =
+                \\begin{bmatrix} \\mathbf{0} \\\\ \\mathbf{I} \\\\ -\\mathbf{n_s} \\end{bmatrix}
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of shape (n_species, n_adsorbed).
+        """
+        n_bulk = len(self.species.reactants) + len(self.species.products)
+        return np.vstack(
+            [
+                np.zeros((n_bulk, len(self.species.adsorbed))),
+                np.eye(len(self.species.adsorbed)),
+                -self.species.ns_catalyst,
+            ]
+        )
+
+    def right_hand_side_jacobian(self):
+        """
+        Derivatives of the right-hand side, zero for fixed bulk concentrations.
+
+        Returns
+        -------
+        np.ndarray
+            Zero matrix of shape (n_adsorbed, n_adsorbed).
+        """
+        return np.zeros((len(self.species.adsorbed), len(self.species.adsorbed)))
+
+    def inlet_jacobian(self):
+        """
+        Derivatives with respect to the initial concentrations of the bulk species,
+        which are the bulk concentrations themselves.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The derivatives of the concentrations, of shape (n_species, n_bulk), and
+            of the right-hand side, zero, of shape (n_adsorbed, n_bulk).
+        """
+        n_bulk = len(self.species.reactants) + len(self.species.products)
+        dcdc0 = np.zeros((self.concentration_jacobian().shape[0], n_bulk))
+        dcdc0[:n_bulk] = np.eye(n_bulk)
+        return dcdc0, np.zeros((len(self.species.adsorbed), n_bulk))
+
+    def mass_matrix(self, site_density, height=None):
+        """
+        Diagonal of the mass matrix of the transient equations,
+        :math:`\\Gamma \\, d\\boldsymbol{\\theta}/dt = \\boldsymbol{\\upsilon}_a^T \\boldsymbol{\\nu}`.
+
+        Parameters
+        ----------
+        site_density : float
+            Density of active sites :math:`\\Gamma`, in moles per unit area of the
+            current density.
+        height : float, optional
+            Not used, the bulk concentrations are fixed.
+
+        Returns
+        -------
+        np.ndarray
+            The site density for each adsorbed species.
+        """
+        return np.full(len(self.species.adsorbed), float(site_density))
+
+
+class LinearConcentration(StaticConcentration):
+    """
+    Closed-form steady state of mechanisms that are first order in the surface.
+
+    When every side of every reaction involves at most one adsorbed species or
+    empty site, with unit coefficient, the rates at fixed bulk concentrations are
+    affine in the coverages,
+
+    .. math::
+
+        \\boldsymbol{\\nu}(\\eta) = \\boldsymbol{\\alpha}(\\eta)
+            + \\mathbf{B}(\\eta)\\, \\boldsymbol{\\theta}
+
+    so the steady state
+    :math:`\\boldsymbol{\\upsilon}_x^T \\mathbf{B}\\, \\boldsymbol{\\theta} =
+    -\\boldsymbol{\\upsilon}_x^T \\boldsymbol{\\alpha}` is one linear system per
+    potential. The systems of every potential are solved together, without
+    iterations. The affine coefficients follow from the rate laws at zero coverage
+    and at unit coverage of each adsorbed species.
+    """
+
+    @staticmethod
+    def applies(kpy):
+        """
+        Whether the steady state of a model is linear in the coverages.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+
+        Returns
+        -------
+        bool
+            True for fixed bulk concentrations and reactions first order in the
+            adsorbed species and empty sites.
+        """
+        if kpy.parameters.cstr:
+            return False
+        n_bulk = len(kpy.species.reactants) + len(kpy.species.products)
+        surface = kpy.reactions.upsilon[:, n_bulk:]
+        for side in [-surface * (surface < 0), surface * (surface > 0)]:
+            if np.any((side != 0) & (side != 1)) or np.any(side.sum(axis=1) > 1):
+                return False
+        return True
+
+    def affine_rates(self):
+        """
+        Affine coefficients of the rate laws in the coverages.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The forward and backward rate laws at zero coverage, of shape
+            (2, n_reactions), and their derivatives with respect to the coverages,
+            of shape (2, n_reactions, n_adsorbed).
+        """
+        upsilon = self.reactions.upsilon
+        orders = np.stack([-upsilon * (upsilon < 0), upsilon * (upsilon > 0)])
+        n_adsorbed = len(self.species.adsorbed)
+        points = np.vstack([np.zeros(n_adsorbed), np.eye(n_adsorbed)])
+        c_reactants, c_products = self.species.c0_reactants, self.species.c0_products
+        concentration = np.array([
+            self.Kpy.concentrate(c_reactants, c_products, theta) for theta in points
+        ])
+        laws = np.prod(concentration[:, None, None, :] ** orders, axis=-1)
+        return laws[0], np.moveaxis(laws[1:] - laws[0], 0, -1)
+
+    def solver(self, callback=None, initial=None):
+        """
+        Solves the steady states of every potential as one batch of linear systems.
+
+        Falls back to the iterative solver of `StaticConcentration`, with a warning
+        logged, if a system is singular.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Called as ``callback(i, j)`` for each potential in order, see
+            `BaseConcentration.solver`.
+        initial : numpy.ndarray, optional
+            Not needed, kept for compatibility with `BaseConcentration.solver`.
+
+        Returns
+        -------
+        self : object
+            The instance with its attributes updated, see `BaseConcentration.solver`.
+        """
+        self.potential = self.operation.potential
+        k_rate = (
+                self.Kpy.pre_exp
+                * self.Kpy.experimental_part
+                * np.exp(
+                    -self.Kpy.get_arguments(self.potential)
+                    / k_B / self.operation.temperature
+                )
+        )
+        laws, slopes = self.affine_rates()
+        alpha = k_rate[:, 0] * laws[0] - k_rate[:, 1] * laws[1]
+        b = k_rate[:, 0, :, None] * slopes[0] - k_rate[:, 1, :, None] * slopes[1]
+        upsilon = self.reactions.upsilonx
+        try:
+            theta = np.linalg.solve(
+                np.einsum("rs,prn->psn", upsilon, b), -(alpha @ upsilon)[..., None]
+            )[..., 0]
+        except np.linalg.LinAlgError:
+            self.Kpy.writer.logger.warning(
+                "LinearConcentration: singular system, solved iteratively"
+            )
+            return super().solver(callback, initial)
+
+        n_potentials = len(self.potential)
+        self.theta = theta
+        self.state = theta.copy()
+        self.c_reactants = np.tile(self.species.c0_reactants, (n_potentials, 1))
+        self.c_products = np.tile(self.species.c0_products, (n_potentials, 1))
+        self.forward = k_rate[:, 0] * (laws[0] + theta @ slopes[0].T)
+        self.backward = k_rate[:, 1] * (laws[1] + theta @ slopes[1].T)
+        self.fval = (self.forward - self.backward) @ upsilon
+        self.j = F * (self.forward - self.backward) @ self.reactions.ne
+        self.n_solved = n_potentials
+        if callback is not None:
+            for i in range(n_potentials):
+                if callback(i, self.j[i]):
+                    self.n_solved = i + 1
+                    for name in ["theta", "state", "c_reactants", "c_products",
+                                 "forward", "backward", "fval", "j"]:
+                        getattr(self, name)[i + 1:] = 0
+                    break
+        return self.decompose()
+
 
 class DynamicConcentration(BaseConcentration):
     """
@@ -527,6 +1158,89 @@ class DynamicConcentration(BaseConcentration):
             ]
         )
 
+    def concentration_jacobian(self):
+        """
+        Derivatives of the concentrations with respect to the state variables.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of shape (n_species, n_states), the identity for the state variables
+            followed by the site balance of the empty sites.
+        """
+        n_bulk = len(self.species.reactants) + len(self.species.products)
+        n_states = n_bulk + len(self.species.adsorbed)
+        empty = np.hstack(
+            [np.zeros((len(self.species.catalyst), n_bulk)), -self.species.ns_catalyst]
+        )
+        return np.vstack([np.eye(n_states), empty])
+
+    def right_hand_side_jacobian(self):
+        """
+        Derivatives of the right-hand side with respect to the state variables.
+
+        Returns
+        -------
+        np.ndarray
+            Diagonal matrix with the flow term of the bulk species and zeros for the
+            coverages.
+        """
+        n_bulk = len(self.species.reactants) + len(self.species.products)
+        flow = np.full(n_bulk, self.operation.Fv / self.operation.Ac)
+        return np.diag(np.concatenate([flow, np.zeros(len(self.species.adsorbed))]))
+
+    def inlet_jacobian(self):
+        """
+        Derivatives with respect to the inlet concentrations of the bulk species,
+        which only enter the flow term.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The derivatives of the concentrations, zero, of shape (n_species, n_bulk),
+            and of the right-hand side, of shape (n_states, n_bulk).
+        """
+        dcdx = self.concentration_jacobian()
+        n_bulk = len(self.species.reactants) + len(self.species.products)
+        drhs = np.zeros((dcdx.shape[1], n_bulk))
+        drhs[:n_bulk] = -self.operation.Fv / self.operation.Ac * np.eye(n_bulk)
+        return np.zeros((dcdx.shape[0], n_bulk)), drhs
+
+    def mass_matrix(self, site_density, height=None):
+        """
+        Diagonal of the mass matrix of the transient equations, the reactor volume
+        per unit of catalyst area for the bulk species and the site density for the
+        adsorbed species.
+
+        Parameters
+        ----------
+        site_density : float
+            Density of active sites, in moles per unit area of the current density.
+        height : float
+            Volume of the reactor per unit of catalyst area.
+
+        Returns
+        -------
+        np.ndarray
+            The diagonal of the mass matrix.
+
+        Raises
+        ------
+        ValueError
+            If the height of the reactor is not given.
+        """
+        if height is None:
+            raise ValueError(
+                "The reactor height (volume per catalyst area) is required for a CSTR."
+            )
+        n_bulk = len(self.species.reactants) + len(self.species.products)
+        return np.concatenate(
+            [
+                np.full(n_bulk, float(height)),
+                np.full(len(self.species.adsorbed), float(site_density)),
+            ]
+        )
+
 
 class Calculator:
     """
@@ -551,9 +1265,10 @@ class Calculator:
         Denotes all species involved in the system, retrieved from the data object.
     reactions : type inferred from data.reactions
         Denotes all reactions in the current system, retrieved from the data object.
-    strategy : DynamicConcentration or StaticConcentration
+    strategy : DynamicConcentration, StaticConcentration or LinearConcentration
         The computational strategy applied, either dynamic or static concentration,
-        depending on the `cstr` setting in operation.
+        depending on the `cstr` setting in operation, solved in closed form when the
+        static steady state is linear in the coverages.
     results : type inferred from strategy.solver()
         The output generated by executing the solver of the defined strategy.
 
@@ -607,7 +1322,8 @@ class Calculator:
 
         strategy : object
             Dynamic or static concentration calculation strategy determined based on whether
-            CSTR operation is specified in the `operation`.
+            CSTR operation is specified in the `operation`, linear when the static
+            steady state is linear in the coverages.
 
         results : object
             Solution results obtained by applying the selected strategy's solver method.
@@ -629,8 +1345,11 @@ class Calculator:
 
         if self.operation.cstr:
             self.strategy = DynamicConcentration(self.Kpy)
+        elif LinearConcentration.applies(self.Kpy):
+            self.strategy = LinearConcentration(self.Kpy)
         else:
             self.strategy = StaticConcentration(self.Kpy)
+        self.writer.message(f"Strategy: {type(self.strategy).__name__}")
 
         # def strategy_solver(self):
         self.results = self.strategy.solver()
@@ -8,6 +8,7 @@
 
 """
 
+import copy
 import os
 import numpy as np
 import re
@@ -309,6 +310,32 @@ class DataSpecies:
                 )
             writer.message("Formation energies processed")
 
+    def subset(self, adsorbed):
+        """
+        Copy of the species data restricted to some adsorbed species.
+
+        Parameters
+        ----------
+        adsorbed : array_like of bool
+            Mask of the adsorbed species kept.
+
+        Returns
+        -------
+        DataSpecies
+            The reduced species data, with the same bulk species and catalysts.
+        """
+        adsorbed = np.asarray(adsorbed, dtype=bool)
+        species = copy.deepcopy(self)
+        species.adsorbed = np.array(self.adsorbed)[adsorbed].tolist()
+        species.ns_catalyst = self.ns_catalyst[:, adsorbed]
+        if hasattr(self, "g_formation_ads"):
+            species.g_formation_ads = self.g_formation_ads[adsorbed]
+        species.list = (
+                species.reactants + species.products + species.adsorbed
+                + species.catalyst + ["e-"]
+        )
+        return species
+
 
 class DataReactions:
     """
@@ -407,6 +434,38 @@ class DataReactions:
             writer.message("Thermochemical reactions parameters processed.")
         # TODO: Add data recollection for more models
 
+    def subset(self, reactions, columns):
+        """
+        Copy of the reaction data restricted to some reactions and species.
+
+        Parameters
+        ----------
+        reactions : array_like of bool
+            Mask of the reactions kept.
+        columns : array_like of bool
+            Mask of the species kept, in the order of the columns of ``upsilon``.
+
+        Returns
+        -------
+        DataReactions
+            The reduced reaction data.
+        """
+        reactions = np.asarray(reactions, dtype=bool)
+        columns = np.asarray(columns, dtype=bool)
+        columns_c = columns[: self.upsilon_c.shape[1]]
+        columns_a = columns_c[len(columns_c) - self.upsilon_a.shape[1]:]
+        cstr = self.upsilonx.shape[1] == self.upsilon_c.shape[1]
+        data = copy.deepcopy(self)
+        data.list = np.array(self.list)[reactions].tolist()
+        for name in ["beta", "ne", "k_f", "k_b", "ga", "dg_reaction"]:
+            if hasattr(self, name):
+                setattr(data, name, getattr(self, name)[reactions])
+        data.upsilon = self.upsilon[reactions][:, columns]
+        data.upsilon_c = self.upsilon_c[reactions][:, columns_c]
+        data.upsilon_a = self.upsilon_a[reactions][:, columns_a]
+        data.upsilonx = data.upsilon_c if cstr else data.upsilon_a
+        return data
+
     @staticmethod
     def process_reaction(side, species_list):
         """
@@ -0,0 +1,167 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        RateControl class
+
+"""
+
+import numpy as np
+from .calculator import Calculator
+from .constants import F
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class RateControl(Calculator):
+    """
+    Degree of rate control of the transition states and intermediates.
+
+    The degree of rate control of the step :math:`i` and the degree of thermodynamic
+    rate control of the intermediate :math:`n` :cite:p:`Stegelmann2009` are
+
+    .. math::
+
+        X_{RC,i} = \\left(\\frac{\\partial \\ln |J|}{\\partial \\left(-G^{\\circ}_{TS,i}/k_BT\\right)}
+                   \\right)_{G^{\\circ}_{TS,m \\neq i},\\, G^{\\circ}_n}, \\quad
+        X_{TRC,n} = \\left(\\frac{\\partial \\ln |J|}{\\partial \\left(-G^{\\circ}_n/k_BT\\right)}
+                   \\right)_{G^{\\circ}_{TS,i},\\, G^{\\circ}_{m \\neq n}}
+
+    Stabilizing a transition state scales both rate constants of its step, and
+    stabilizing an intermediate with the transition states fixed scales them by its
+    stoichiometric coefficients as reactant or product,
+
+    .. math::
+
+        \\frac{\\partial \\ln \\overrightarrow{k_i}}{\\partial \\left(-G^{\\circ}_{TS,i}/k_BT\\right)} =
+        \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial \\left(-G^{\\circ}_{TS,i}/k_BT\\right)} = 1,
+        \\quad
+        \\frac{\\partial \\ln \\overrightarrow{k_i}}{\\partial \\left(-G^{\\circ}_n/k_BT\\right)} =
+            -\\max(-\\upsilon_{in}, 0), \\quad
+        \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial \\left(-G^{\\circ}_n/k_BT\\right)} =
+            -\\max(\\upsilon_{in}, 0)
+
+    so the sensitivities hold for experimental rate constants as well. Every step and
+    intermediate at every potential follows from the converged steady state and one
+    batched linear solve, see `BaseConcentration.sensitivity`, instead of two
+    perturbed sweeps per step. At the equilibrium potential the current vanishes and
+    the degrees of rate control are not defined.
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the analysis.
+    writer : Writer
+        Writer used for logging.
+    dnu : numpy.ndarray
+        Derivatives of the reaction rates, of shape
+        (n_potentials, n_reactions, n_reactions + n_adsorbed). The first columns are
+        the transition states and the last ones the intermediates.
+    rate_control : numpy.ndarray
+        Degree of rate control of each step, of shape (n_potentials, n_reactions).
+    thermodynamic : numpy.ndarray
+        Degree of thermodynamic rate control of each adsorbed species, of shape
+        (n_potentials, n_adsorbed).
+    """
+
+    def __init__(self, kpy, name=None):
+        """
+        Solves the steady state and its degrees of rate control.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+        name : str, optional
+            Name identifier of the analysis. Default is 'melek'.
+        """
+        super().__init__(kpy, name)
+        self.writer.message(f"*** RateControl : {self.name}  ***")
+        self.evaluate()
+
+    def perturbations(self):
+        """
+        Derivatives of the logarithm of the rate constants with respect to the
+        stabilization of each transition state and intermediate.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The derivatives of the forward and backward rate constants, each of shape
+            (n_reactions, n_reactions + n_adsorbed).
+        """
+        n_reactions = len(self.reactions.list)
+        upsilon = self.reactions.upsilon_a
+        dlnkf = np.hstack([np.eye(n_reactions), -np.maximum(-upsilon, 0)])
+        dlnkb = np.hstack([np.eye(n_reactions), -np.maximum(upsilon, 0)])
+        return dlnkf, dlnkb
+
+    def evaluate(self):
+        """
+        Computes the degrees of rate control at every solved potential.
+
+        Returns
+        -------
+        RateControl
+            The instance, with its attributes updated.
+        """
+        self.strategy.linearize()
+        dlnkf, dlnkb = self.perturbations()
+        _, self.dnu = self.strategy.sensitivity(dlnkf, dlnkb)
+        dj = F * np.einsum("r,nrp->np", self.reactions.ne, self.dnu)
+        n_reactions = len(self.reactions.list)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            control = dj / self.results.j[:, None]
+        self.rate_control = control[:, :n_reactions]
+        self.thermodynamic = control[:, n_reactions:]
+        return self
+
+    def reaction(self, reaction):
+        """
+        Degrees of rate control of the net rate of one step, the turnover frequency
+        of a product formed by that step.
+
+        Parameters
+        ----------
+        reaction : str or int
+            Identifier or position of the step.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The degree of rate control of each step, of shape
+            (n_potentials, n_reactions), and the degree of thermodynamic rate control
+            of each adsorbed species, of shape (n_potentials, n_adsorbed).
+        """
+        if isinstance(reaction, str):
+            reaction = self.reactions.list.index(reaction)
+        rate = np.sum(self.strategy.rates[:, :, reaction], axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            control = self.dnu[:, reaction, :] / rate[:, None]
+        n_reactions = len(self.reactions.list)
+        return control[:, :n_reactions], control[:, n_reactions:]
+
+    def report(self):
+        """
+        Writes the degrees of rate control at every potential.
+
+        Returns
+        -------
+        str
+            The report, one row per potential.
+        """
+        names = self.reactions.list + self.species.adsorbed
+        lines = [f"{'Potential':>10}" + "".join(f"{name:>12}" for name in names)]
+        for potential, row in zip(
+                self.potential, np.hstack([self.rate_control, self.thermodynamic])
+        ):
+            lines.append(f"{potential:>10.4f}" + "".join(f"{x:>12.4g}" for x in row))
+        report = "\n".join(lines)
+        self.writer.message(report)
+        return report
@@ -14,8 +14,13 @@ import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
 import copy
+import heapq
+import itertools
+from collections import OrderedDict
 
+from .constants import k_B, h
 from .kpynetic import Kpynetic
 from .tools import Tool
 
@@ -36,8 +41,16 @@ class Coordinator:
         and other necessary attributes for energy and pathway computations.
     data : object
         Direct access to the data contained within `Kpy`.
+    cache : collections.OrderedDict
+        Pathways of the mechanism already enumerated by `iter_paths`, with the state
+        of their search, keyed by the source, target, weights and maximum length, from
+        the least to the most recently used.
+    cache_size : int
+        Largest number of searches kept in `cache`.
     """
 
+    cache_size = 32
+
     def __init__(self, kpy):
         """
         Instantiates a new object using a deep copy of the provided `kpy` object. The copied
@@ -53,15 +66,19 @@ class Coordinator:
         """
         self.Kpy = copy.deepcopy(kpy)
         self.data = self.Kpy.data
+        self.cache = OrderedDict()
 
-    def plot_rxn_coords_potential(self, source, target, eta, fname):
+    def plot_rxn_coords_potential(
+            self, source, target, eta, fname, k=None, max_length=None, weights=None
+    ):
         """
         Plots reaction coordinates and potential energy for pathways between the source and the target.
 
         This function primarily utilizes information from the stoichiometric graph to identify
         reaction pathways and compute reaction coordinates and potentials. It produces individual
         plots for each identified pathway, illustrating the progress of reactions and corresponding
-        potential energy changes.
+        potential energy changes. For large networks, the number and length of the
+        pathways can be bounded, see `shortest_paths`.
 
         Parameters
         ----------
@@ -75,6 +92,14 @@ class Coordinator:
         fname : str
             Base file name to save the generated plots. Each pathway will be saved as an individual
             file, with a unique suffix indicating the pathway index.
+        k : int, optional
+            Number of cheapest pathways plotted. Default is None.
+        max_length : int, optional
+            Largest number of reactions of a pathway. Default is None.
+        weights : str or array_like, optional
+            Cost of each reaction, see `reaction_weights`. Default is None.
+
+        If ``k``, ``max_length`` and ``weights`` are None, every simple path is plotted.
         """
         self.upsilon = copy.deepcopy(self.data.reactions.upsilon_c)
         self.species = copy.deepcopy(self.data.species.list)
@@ -82,21 +107,99 @@ class Coordinator:
         self.grafo = self.stoichiometric_graphe(
             self.upsilon, self.species, self.reactions
         )
-        self.paths = self.get_paths(self.grafo, source, target)
-        self.pathways = self.get_pathways(self.grafo, self.paths)
-        self.sigma = self.get_sigma(self.grafo, self.paths, self.reactions)
+        if k is None and max_length is None and weights is None:
+            self.paths = self.get_paths(self.grafo, source, target)
+            self.pathways = self.get_pathways(self.grafo, self.paths)
+            self.sigma = self.get_sigma(self.grafo, self.paths, self.reactions)
+        else:
+            self.paths, self.pathways = self.shortest_paths(
+                source, target, k, weights, max_length=max_length
+            )
+            self.sigma = self.pathway_sigma(self.paths, self.pathways)
         for p, path in enumerate(self.paths):
             figname = f"{fname}_path_{p}.png"
             self.plotter_rxn_coords_potential(p, path, eta, figname)
 
+    @staticmethod
+    def incidence(upsilon):
+        """
+        Sparse species-reaction incidence matrix of the mechanism.
+
+        Parameters
+        ----------
+        upsilon : numpy.ndarray or scipy.sparse matrix
+            Stoichiometric coefficients, with rows corresponding to reactions and
+            columns to species.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The nonzero stoichiometric coefficients, negative for reactants and
+            positive for products, of shape (n_reactions, n_species).
+        """
+        return sp.csr_matrix(upsilon, dtype=float)
+
+    @staticmethod
+    def edge_list(incidence):
+        """
+        Reactant-product pairs of every reaction of an incidence matrix.
+
+        The pairs are built with vectorized operations on the sparse rows, in the
+        order of the reactions, reactants and products, so the cost is linear in the
+        number of edges.
+
+        Parameters
+        ----------
+        incidence : scipy.sparse.csr_matrix
+            Incidence matrix, see `incidence`.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The position of the reaction, reactant and product of each edge, and the
+            stoichiometric coefficients of the reactant and product.
+        """
+        incidence = sp.csr_matrix(incidence)
+        incidence.sort_indices()
+        rows = np.repeat(np.arange(incidence.shape[0]), np.diff(incidence.indptr))
+        reactant = incidence.data < 0
+        product = sp.csr_matrix(
+            (
+                incidence.data * (incidence.data > 0),
+                incidence.indices.copy(),
+                incidence.indptr.copy(),
+            ),
+            shape=incidence.shape,
+        )
+        product.eliminate_zeros()
+        n_products = np.diff(product.indptr)
+
+        reactant_entries = np.flatnonzero(reactant)
+        reaction = rows[reactant_entries]
+        repeats = n_products[reaction]
+        first = np.cumsum(repeats) - repeats
+        edge = np.repeat(reactant_entries, repeats)
+        rank = np.arange(len(edge)) - np.repeat(first, repeats)
+        product_entries = np.repeat(product.indptr[reaction], repeats) + rank
+        return (
+            rows[edge],
+            incidence.indices[edge],
+            product.indices[product_entries],
+            incidence.data[edge],
+            product.data[product_entries],
+        )
+
     def stoichiometric_graphe(self, upsilon, species, reactions):
         """
         Constructs a stoichiometric graph that represents the transformation of species through
         a series of reactions. The graph edges represent the mapping of reactants to products
         linked by a specific reaction and associated stoichiometric coefficients.
 
+        The edges are taken from the sparse incidence matrix, see `edge_list`, and
+        added in a single call.
+
         Parameters:
-            upsilon: numpy.ndarray
+            upsilon: numpy.ndarray or scipy.sparse matrix
                 A 2D array representing stoichiometric coefficients for the reactions
                 with rows corresponding to reactions and columns to species.
             species: list or array-like
@@ -109,26 +212,30 @@ class Coordinator:
         Returns:
             networkx.MultiDiGraph
                 A directed multigraph where nodes represent species and edges represent
-                the reactions. Edges are annotated with reaction IDs and their respective
-                stoichiometric coefficients.
+                the reactions. Edges are annotated with reaction IDs and the stoichiometric
+                coefficients of their reactant and product.
 
         Raises:
             None
         """
+        reaction, reactant, product, nu_reactant, nu_product = self.edge_list(
+            self.incidence(upsilon)
+        )
         graphe = nx.MultiDiGraph()
-        species = np.array(species)
-        for i, row in enumerate(upsilon):
-            reaction = reactions[i]
-            reactants = species[np.where(row < 0)].tolist()
-            products = species[np.where(row > 0)].tolist()
-            coeff = [0, 0]
-            for reactant in reactants:
-                j = np.where(species == reactant)
-                coeff[0] = upsilon[i, j].item()
-                for product in products:
-                    j = np.where(species == product)
-                    coeff[1] = upsilon[i, j].item()
-                    graphe.add_edge(reactant, product, reaction=reaction, upsilon=coeff)
+        graphe.add_edges_from(
+            (
+                species[j],
+                species[k],
+                {"reaction": reactions[i], "upsilon": (a, b)},
+            )
+            for i, j, k, a, b in zip(
+                reaction.tolist(),
+                reactant.tolist(),
+                product.tolist(),
+                nu_reactant.tolist(),
+                nu_product.tolist(),
+            )
+        )
         return graphe
 
     def get_paths(self, graphe, source, target):
@@ -158,24 +265,290 @@ class Coordinator:
             A list of paths, where each path is represented as a list of nodes that
             constitute the path from the source to the target node.
         """
-        paths = list(nx.all_simple_paths(graphe, source, target))
         # Filter to prevent "short circuits"
-        for h, nodes in enumerate(paths):
-            for n in range(len(nodes) - 1):
-                reactant, product = nodes[n], nodes[n + 1]
-                if reactant == source and product == target:
-                    graphe.remove_edge(reactant, product)
+        if graphe.has_edge(source, target):
+            graphe.remove_edges_from(
+                [(source, target, key) for key in list(graphe[source][target])]
+            )
         paths = list(nx.all_simple_paths(graphe, source, target))
         return paths
 
+    def reaction_weights(self, weights=None, eta=0.0):
+        """
+        Non-negative cost of each reaction used to rank the pathways.
+
+        Parameters
+        ----------
+        weights : str or array_like, optional
+            ``None`` counts the steps of a pathway, ``'energy'`` uses the forward
+            barrier of each reaction at the potential ``eta``, thermochemical and
+            electronic parts included, and an array gives the cost of each reaction,
+            for instance from `flux_weights`. Default is None.
+        eta : float, optional
+            Potential of the energy weights. Default is 0.0.
+
+        Returns
+        -------
+        numpy.ndarray
+            The cost of each reaction.
+
+        Raises
+        ------
+        ValueError
+            If the weights are unknown, negative, NaN or not one per reaction.
+        """
+        n_reactions = len(self.data.reactions.list)
+        if weights is None:
+            return np.ones(n_reactions)
+        if isinstance(weights, str):
+            if weights != "energy":
+                raise ValueError("The 'weights' must be None, 'energy' or an array.")
+            return np.maximum(self.Kpy.get_argument(eta)[0], 0.0)
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (n_reactions,) or not np.all(weights >= 0):
+            raise ValueError("The 'weights' must be one non-negative value per reaction.")
+        return weights
+
+    @staticmethod
+    def flux_weights(rates):
+        """
+        Cost of each reaction from its net rate, :math:`-\\ln(|\\nu_i| / \\max|\\nu|)`,
+        so the cheapest pathways carry the largest fluxes.
+
+        Parameters
+        ----------
+        rates : array_like
+            Net rate of each reaction, for instance at one potential of a `Calculator`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The cost of each reaction, infinite for reactions without flux.
+
+        Raises
+        ------
+        ValueError
+            If a rate is not finite or every rate is zero.
+        """
+        rates = np.abs(np.asarray(rates, dtype=float))
+        if not np.all(np.isfinite(rates)) or not np.any(rates > 0):
+            raise ValueError("The 'rates' must be finite and not all zero.")
+        with np.errstate(divide="ignore"):
+            return -np.log(rates / np.max(rates))
+
+    def iter_paths(
+            self, source, target, weights=None, eta=0.0, max_length=None, graphe=None
+    ):
+        """
+        Lazily enumerates the pathways from the source to the target by increasing cost.
+
+        The simple paths of the stoichiometric graph are explored best-first, as an
+        A* search whose heuristic is the exact cost from each species to the target
+        ignoring the simple-path constraint. The heuristic is a lower bound, so the
+        pathways are produced in order of increasing cost, partial paths that cannot
+        reach the target are never expanded, and the first ``k`` pathways are found
+        without enumerating the others. Parallel reactions between two species give
+        different pathways, and reactions from the source directly to the target are
+        excluded as in `get_paths`.
+
+        The pathways of the graph of the mechanism are cached per source, target,
+        weights and maximum length, so later calls replay them and resume the search
+        where it stopped. Energy weights differ at each potential, so only the
+        `cache_size` most recently used searches are kept. A given graph is searched
+        without the cache.
+
+        Parameters
+        ----------
+        source : str
+            Initial species.
+        target : str
+            Final species.
+        weights : str or array_like, optional
+            Cost of each reaction, see `reaction_weights`. Default is None, the number
+            of steps.
+        eta : float, optional
+            Potential of the energy weights. Default is 0.0.
+        max_length : int, optional
+            Largest number of reactions of a pathway. Default is None, unbounded.
+        graphe : networkx.MultiDiGraph, optional
+            Stoichiometric graph. Default is None, the graph of the mechanism.
+
+        Yields
+        ------
+        tuple
+            The species, the reactions and the cost of each pathway.
+        """
+        cost = self.reaction_weights(weights, eta)
+        if graphe is not None:
+            yield from self.search(graphe, source, target, cost, max_length)
+            return
+        key = (source, target, cost.tobytes(), max_length)
+        if key not in self.cache:
+            graphe = self.stoichiometric_graphe(
+                self.data.reactions.upsilon_c,
+                self.data.species.list,
+                self.data.reactions.list,
+            )
+            search = self.search(graphe, source, target, cost, max_length)
+            self.cache[key] = ([], search)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        self.cache.move_to_end(key)
+        found, search = self.cache[key]
+        for path in itertools.count():
+            if path < len(found):
+                yield found[path]
+                continue
+            try:
+                found.append(next(search))
+            except StopIteration:
+                return
+            yield found[path]
+
+    def search(self, graphe, source, target, cost, max_length=None):
+        """
+        Best-first search of the simple paths of a graph, see `iter_paths`.
+
+        Parameters
+        ----------
+        graphe : networkx.MultiDiGraph
+            Stoichiometric graph, with the reaction of each edge.
+        source : str
+            Initial species.
+        target : str
+            Final species.
+        cost : numpy.ndarray
+            Non-negative cost of each reaction.
+        max_length : int, optional
+            Largest number of reactions of a pathway. Default is None.
+
+        Yields
+        ------
+        tuple
+            The species, the reactions and the cost of each pathway.
+        """
+        index = {reaction: i for i, reaction in enumerate(self.data.reactions.list)}
+        successors = {}
+        for reactant, product, reaction in graphe.edges(data="reaction"):
+            if reactant == source and product == target:
+                continue
+            weight = cost[index[reaction]]
+            if np.isfinite(weight):
+                successors.setdefault(reactant, []).append((product, reaction, weight))
+
+        reverse = nx.DiGraph()
+        for reactant, edges in successors.items():
+            for product, _, weight in edges:
+                if not reverse.has_edge(product, reactant) or (
+                        weight < reverse[product][reactant]["weight"]
+                ):
+                    reverse.add_edge(product, reactant, weight=weight)
+        if target not in reverse:
+            return
+        remaining = nx.single_source_dijkstra_path_length(reverse, target)
+        if source not in remaining:
+            return
+
+        counter = itertools.count()
+        queue = [(remaining[source], next(counter), 0.0, (source,), ())]
+        while queue:
+            _, _, g, nodes, reactions = heapq.heappop(queue)
+            if nodes[-1] == target:
+                yield list(nodes), list(reactions), g
+                continue
+            if max_length is not None and len(reactions) >= max_length:
+                continue
+            for product, reaction, weight in successors.get(nodes[-1], []):
+                if product in nodes or product not in remaining:
+                    continue
+                heapq.heappush(
+                    queue,
+                    (
+                        g + weight + remaining[product],
+                        next(counter),
+                        g + weight,
+                        nodes + (product,),
+                        reactions + (reaction,),
+                    ),
+                )
+
+    def shortest_paths(
+            self, source, target, k=None, weights=None, eta=0.0, max_length=None
+    ):
+        """
+        The ``k`` cheapest pathways from the source to the target.
+
+        Parameters
+        ----------
+        source : str
+            Initial species.
+        target : str
+            Final species.
+        k : int, optional
+            Number of pathways. Default is None, every pathway within ``max_length``.
+        weights : str or array_like, optional
+            Cost of each reaction, see `reaction_weights`. Default is None.
+        eta : float, optional
+            Potential of the energy weights. Default is 0.0.
+        max_length : int, optional
+            Largest number of reactions of a pathway. Default is None.
+
+        Returns
+        -------
+        tuple of list
+            The species and the reactions of each pathway, by increasing cost.
+        """
+        found = itertools.islice(
+            self.iter_paths(source, target, weights, eta, max_length), k
+        )
+        paths, pathways = [], []
+        for nodes, reactions, _ in found:
+            paths.append(nodes)
+            pathways.append(reactions)
+        return paths, pathways
+
+    @staticmethod
+    def path_edges(graphe, paths):
+        """
+        Edge followed by each step of the paths.
+
+        Parallel reactions between two species give repeated paths. Each repetition
+        takes the last edge between the species not yet taken by a previous path, and
+        the first edge is kept for the remaining ones. The edges taken are counted
+        instead of removed, so the graph is neither copied nor modified.
+
+        Parameters
+        ----------
+        graphe : networkx.MultiDiGraph
+            Stoichiometric graph.
+        paths : list of list
+            Species of each path.
+
+        Returns
+        -------
+        list of list of dict
+            The data of the edges of each path, with its reaction and upsilon.
+        """
+        taken = {}
+        edges = []
+        for nodes in paths:
+            edges.append([])
+            for reactant, product in zip(nodes[:-1], nodes[1:]):
+                keys = list(graphe[reactant][product])
+                n_taken = taken.get((reactant, product), 0)
+                key = keys[len(keys) - 1 - n_taken]
+                edges[-1].append(graphe[reactant][product][key])
+                if key != 0:
+                    taken[(reactant, product)] = n_taken + 1
+        return edges
+
     def get_pathways(self, graphe, paths):
         """
         Generate pathways based on the provided graph and paths.
 
-        This function creates deep copies of the input graph data to avoid modifying
-        the original graph. It processes the paths to extract the sequence of reactions
-        for each path and removes certain edges based on their key values. Finally,
-        it returns the list of pathways comprising the ordered reactions.
+        This function processes the paths to extract the sequence of reactions for each
+        path, see `path_edges`, without modifying the graph. Finally, it returns the list
+        of pathways comprising the ordered reactions.
 
         Parameters
         ----------
@@ -195,31 +568,20 @@ class Coordinator:
             path in the input graph.
 
         """
-        grafo = copy.deepcopy(graphe)
-        pathways = []
-        for h, nodes in enumerate(paths):
-            pathways.append([])
-            for n in range(len(nodes) - 1):
-                reactant, product = nodes[n], nodes[n + 1]
-                edges = grafo[reactant][product]
-                key, data = list(edges.items())[-1]
-                reaction, upsilon = data["reaction"], data["upsilon"]
-                pathways[h].append(reaction)
-                if key != 0:
-                    grafo.remove_edge(reactant, product, key=key)
-        del grafo
-        return pathways
+        return [
+            [data["reaction"] for data in edges]
+            for edges in self.path_edges(graphe, paths)
+        ]
 
     def get_sigma(self, graphe, paths, reactions):
         """
         Computes the sigma matrix for the given graph, paths, and reactions.
 
         This function calculates the sigma matrix, which represents the
-        contributions of each reaction in the given paths, using a deepcopy of the
-        provided graph. It iterates through the paths, processes each pair of
-        nodes, and updates the sigma matrix accordingly by considering reaction
-        and upsilon data. Additionally, edges in the graph are removed based on
-        specific keys during the computation.
+        contributions of each reaction in the given paths. It iterates through the
+        reactions of each path, see `path_edges`, and updates the sigma matrix
+        accordingly by considering reaction and upsilon data, without modifying the
+        graph.
 
         Parameters
         ----------
@@ -240,21 +602,45 @@ class Coordinator:
             each column corresponds to a reaction. The values represent the
             contribution of each reaction within a path.
         """
-        grafo = copy.deepcopy(graphe)
+        index = {reaction: i for i, reaction in enumerate(reactions)}
+        sigma = np.zeros((len(paths), len(reactions)))
+        for h, edges in enumerate(self.path_edges(graphe, paths)):
+            factor = 1
+            for data in edges:
+                sigma[h, index[data["reaction"]]] = factor
+                factor *= data["upsilon"][1]
+        return sigma
+
+    def pathway_sigma(self, paths, pathways):
+        """
+        Computes the sigma matrix of pathways given by their species and reactions.
+
+        Each reaction of a pathway is weighted by the product of the stoichiometric
+        coefficients of the species formed by the previous reactions, as in
+        `get_sigma`.
+
+        Parameters
+        ----------
+        paths : list of list of str
+            Species of each pathway.
+        pathways : list of list of str
+            Reactions of each pathway.
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2D array with one row per pathway and one column per reaction.
+        """
+        reactions = self.data.reactions.list
+        species = self.data.species.list
+        upsilon = self.data.reactions.upsilon_c
         sigma = np.zeros((len(paths), len(reactions)))
-        for h, nodes in enumerate(paths):
+        for h, (nodes, steps) in enumerate(zip(paths, pathways)):
             factor = 1
-            for n in range(len(nodes) - 1):
-                reactant, product = nodes[n], nodes[n + 1]
-                edges = grafo[reactant][product]
-                key, data = list(edges.items())[-1]
-                reaction, upsilon = data["reaction"], data["upsilon"]
+            for product, reaction in zip(nodes[1:], steps):
                 i = reactions.index(reaction)
                 sigma[h, i] = factor
-                factor *= upsilon[1]
-                if key != 0:
-                    grafo.remove_edge(reactant, product, key=key)
-        del grafo
+                factor *= upsilon[i, species.index(product)]
         return sigma
 
     def get_energies(self, sigma, reactions, eta=0, zero=0):
@@ -299,6 +685,121 @@ class Coordinator:
         energies -= energies[zero]
         return energies
 
+    def energy_profiles(self, sigma, pathways, potentials, zero=0):
+        """
+        Energy profiles of many pathways at many potentials in one call.
+
+        The batched counterpart of `get_energies`. The arguments of the rate
+        constants of every potential are computed at once, see
+        `Kpynetic.get_arguments`, and the profiles follow from cumulative sums over
+        the steps, so free energy diagrams can be scanned over thousands of
+        potentials without plotting.
+
+        Parameters
+        ----------
+        sigma : numpy.ndarray
+            Stoichiometric numbers of the pathways, of shape (n_paths, n_reactions),
+            see `get_sigma`.
+        pathways : list of list of str
+            Reactions of each pathway, see `get_pathways`.
+        potentials : array_like
+            Potentials of the profiles.
+        zero : int, optional
+            Index of the energy level used as the reference energy. Default is 0.
+
+        Returns
+        -------
+        numpy.ndarray
+            The energy levels of the species and transition states of each pathway,
+            of shape (n_paths, n_potentials, 2 n_steps + 1), with ``n_steps`` the
+            number of reactions of the longest pathway. The levels beyond the end of
+            shorter pathways are NaN.
+        """
+        index = {reaction: i for i, reaction in enumerate(self.data.reactions.list)}
+        n_steps = max((len(reactions) for reactions in pathways), default=0)
+        steps = np.zeros((len(pathways), n_steps), dtype=int)
+        mask = np.zeros((len(pathways), n_steps), dtype=bool)
+        for h, reactions in enumerate(pathways):
+            steps[h, : len(reactions)] = [index[reaction] for reaction in reactions]
+            mask[h, : len(reactions)] = True
+        weight = np.take_along_axis(np.asarray(sigma, dtype=float), steps, axis=1) * mask
+
+        dg = self.Kpy.get_arguments(potentials)[:, :, steps] * weight
+        forward = np.moveaxis(dg[:, 0], 0, 1)
+        ddg = np.moveaxis(dg[:, 0] - dg[:, 1], 0, 1)
+        energies = np.zeros(forward.shape[:2] + (2 * n_steps + 1,))
+        energies[..., 2::2] = np.cumsum(ddg, axis=-1)
+        energies[..., 1::2] = energies[..., 0:-1:2] + forward
+        energies -= energies[..., zero: zero + 1]
+
+        beyond = np.arange(2 * n_steps + 1) > 2 * mask.sum(axis=1)[:, None]
+        return np.where(beyond[:, None], np.nan, energies)
+
+    def energy_span(self, sigma, pathways, potentials):
+        """
+        Energetic span of many pathways at many potentials.
+
+        In the energetic span model :cite:p:`Kozuch2011` the turnover frequency of a
+        pathway follows from its energy profile alone,
+
+        .. math::
+
+            TOF = \\frac{k_BT}{h} \\frac{1 - e^{\\Delta G_r/k_BT}}
+                  {\\sum_{ij} e^{(T_i - I_j + \\delta G_{ij})/k_BT}}, \\quad
+            \\delta G_{ij} = \\begin{cases} 0 & i \\geq j \\\\
+                              \\Delta G_r & i < j \\end{cases}
+
+        with :math:`T_i` the transition state of the step :math:`i`, :math:`I_j` the
+        intermediate before the step :math:`j` and :math:`\\Delta G_r` the reaction
+        energy of the pathway. The energetic span :math:`\\delta E` is the largest
+        exponent, reached at the TOF-determining transition state and intermediate, so
+        :math:`TOF \\approx k_BT/h\\, e^{-\\delta E/k_BT}` for exergonic pathways.
+        The profiles of `energy_profiles` are used, so no steady state is solved.
+
+        Parameters
+        ----------
+        sigma : numpy.ndarray
+            Stoichiometric numbers of the pathways, of shape (n_paths, n_reactions).
+        pathways : list of list of str
+            Reactions of each pathway.
+        potentials : array_like
+            Potentials of the profiles.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The energetic span in eV, the position in the pathway of the
+            TOF-determining transition state and intermediate, and the turnover
+            frequency in 1/s, negative for endergonic pathways, each of shape
+            (n_paths, n_potentials).
+        """
+        energies = self.energy_profiles(sigma, pathways, potentials)
+        n_steps = (energies.shape[-1] - 1) // 2
+        lengths = np.array([len(reactions) for reactions in pathways], dtype=int)
+        valid = np.arange(n_steps) < lengths[:, None]
+
+        states = np.where(valid[:, None], energies[..., 0:-1:2], np.inf)
+        barriers = np.where(valid[:, None], energies[..., 1::2], -np.inf)
+        final = np.take_along_axis(energies, 2 * lengths[:, None, None], axis=-1)
+        dg_r = final[..., 0] - energies[..., 0]
+
+        before = np.arange(n_steps)[:, None] < np.arange(n_steps)[None, :]
+        exponent = (
+                barriers[..., :, None]
+                - states[..., None, :]
+                + np.where(before, dg_r[..., None, None], 0.0)
+        )
+        flat = exponent.reshape(exponent.shape[:2] + (-1,))
+        determining = np.argmax(flat, axis=-1)
+        span = np.take_along_axis(flat, determining[..., None], axis=-1)[..., 0]
+        tdts, tdi = np.divmod(determining, n_steps)
+
+        kT = k_B * self.data.parameters.temperature
+        with np.errstate(over="ignore", invalid="ignore"):
+            total = np.sum(np.exp((flat - span[..., None]) / kT), axis=-1)
+            tof = kT / h * -np.expm1(dg_r / kT) * np.exp(-span / kT) / total
+        return span, tdts, tdi, tof
+
     def plotter_rxn_coords_potential(self, p, path, potential, figname):
         """
         Plots reaction coordinates against potential energies for specified pathway and potential values.
@@ -343,8 +844,9 @@ class Coordinator:
         potential_legend = []
         colors = plt.cm.viridis(np.linspace(0, 1, len(potential)))
         colors[0] = plt.cm.tab10(1)
+        profiles = self.energy_profiles(self.sigma[p: p + 1], [reactions], potential)[0]
         for j, eta in enumerate(potential):
-            energies = self.get_energies(self.sigma[p], reactions, eta)
+            energies = profiles[j]
             # print(f'eta = {eta} V, energies = {energies} eV,')
             color = colors[j]
             potential_legend.append(
@@ -0,0 +1,153 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Descriptor class
+
+"""
+
+import numpy as np
+from .calculator import Calculator
+from .constants import F, k_B
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Descriptor(Calculator):
+    """
+    Kinetic descriptors of the polarization curve.
+
+    The Tafel slope, the reaction orders and the apparent activation energy
+
+    .. math::
+
+        b = \\left(\\frac{\\partial \\log_{10} |J|}{\\partial \\eta}\\right)^{-1}, \\quad
+        \\rho_k = \\frac{\\partial \\ln |J|}{\\partial \\ln c^0_k}, \\quad
+        E_{a}^{app} = -k_B \\frac{\\partial \\ln |J|}{\\partial (1/T)}
+
+    are obtained at every potential from the linearized steady state, see
+    `BaseConcentration.response`, instead of numerical differentiation of the
+    polarization curve. They are exact for any potential grid, so coarse sweeps give
+    smooth descriptors. The explicit dependences of the rate constants are
+
+    .. math::
+
+        \\frac{\\partial \\ln \\overrightarrow{k_i}}{\\partial \\eta} = \\frac{n_i\\beta_i}{k_BT}, \\quad
+        \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial \\eta} = -\\frac{n_i(1-\\beta_i)}{k_BT}, \\quad
+        -k_B\\frac{\\partial \\ln k_i}{\\partial (1/T)} = \\Delta G^{\\ddagger}_i + m k_BT
+
+    with the sign of the electrode in the electronic terms, :math:`\\Delta G^{\\ddagger}_i`
+    the thermochemical and electronic barrier of each direction and :math:`m` the
+    exponent of the temperature in the pre-exponential factor of the transition
+    state theory. The initial concentrations enter the rates directly for static
+    concentrations and the flow term for a CSTR.
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the analysis.
+    writer : Writer
+        Writer used for logging.
+    dlogj : numpy.ndarray
+        Derivative of the decimal logarithm of the current density with respect to the
+        potential, in dec/V.
+    tafel_slope : numpy.ndarray
+        Tafel slope, in V/dec.
+    orders : numpy.ndarray
+        Reaction orders with respect to the reactants and products, of shape
+        (n_potentials, n_bulk).
+    activation_energy : numpy.ndarray
+        Apparent activation energy, in eV.
+    """
+
+    def __init__(self, kpy, name=None):
+        """
+        Solves the steady state and its kinetic descriptors.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+        name : str, optional
+            Name identifier of the analysis. Default is 'melek'.
+        """
+        super().__init__(kpy, name)
+        self.writer.message(f"*** Descriptor : {self.name}  ***")
+        self.evaluate()
+
+    def log_current(self, dnu):
+        """
+        Derivatives of the logarithm of the current density from those of the rates.
+
+        Parameters
+        ----------
+        dnu : numpy.ndarray
+            Total derivatives of the reaction rates, of shape
+            (n_potentials, n_reactions, n_parameters).
+
+        Returns
+        -------
+        numpy.ndarray
+            The derivatives of :math:`\\ln |J|`, of shape (n_potentials, n_parameters).
+        """
+        dj = F * np.einsum("r,nrp->np", self.reactions.ne, dnu)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return dj / self.results.j[:, None]
+
+    def evaluate(self):
+        """
+        Computes the descriptors at every solved potential.
+
+        Returns
+        -------
+        Descriptor
+            The instance, with its attributes updated.
+        """
+        strategy = self.strategy.linearize()
+        kT = k_B * self.operation.temperature
+
+        dlnkf, dlnkb = strategy.potential_derivatives()
+        _, dnu = strategy.sensitivity(dlnkf[:, None], dlnkb[:, None])
+        dlnj = self.log_current(dnu)[:, 0]
+        self.dlogj = dlnj / np.log(10)
+        with np.errstate(divide="ignore"):
+            self.tafel_slope = 1 / self.dlogj
+
+        dcdc0, drhsdc0 = strategy.inlet_jacobian()
+        c0 = np.concatenate([self.species.c0_reactants, self.species.c0_products])
+        _, dnu = strategy.response(strategy.dnudc @ (dcdc0 * c0), drhsdc0 * c0)
+        self.orders = self.log_current(dnu)
+
+        barrier = self.Kpy.get_arguments(self.potential)
+        if self.operation.tst:
+            barrier = barrier + self.operation.m * kT
+        _, dnu = strategy.sensitivity(barrier[:, 0, :, None], barrier[:, 1, :, None])
+        self.activation_energy = self.log_current(dnu)[:, 0]
+        return self
+
+    def report(self):
+        """
+        Writes the descriptors at every potential.
+
+        Returns
+        -------
+        str
+            The report, one row per potential.
+        """
+        names = self.species.reactants + self.species.products
+        header = f"{'Potential':>10}{'Tafel':>12}{'Ea':>12}"
+        lines = [header + "".join(f"{name:>12}" for name in names)]
+        for potential, slope, energy, orders in zip(
+                self.potential, self.tafel_slope, self.activation_energy, self.orders
+        ):
+            row = f"{potential:>10.4f}{slope:>12.4g}{energy:>12.4g}"
+            lines.append(row + "".join(f"{x:>12.4g}" for x in orders))
+        report = "\n".join(lines)
+        self.writer.message(report)
+        return report
@@ -8,12 +8,24 @@
 
 """
 
+import os
 import copy
+import json
 import numpy as np
 import matplotlib.pyplot as plt
 from IPython.display import clear_output
-from scipy.optimize import Bounds, differential_evolution
-from .calculator import Calculator
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import Bounds, OptimizeResult, differential_evolution, minimize
+from scipy.stats import qmc
+from .calculator import (
+    Calculator,
+    DynamicConcentration,
+    LinearConcentration,
+    StaticConcentration,
+)
+from .constants import k_B
+from .kpynetic import Kpynetic
+from .surrogate import Surrogate
 from .writer import Writer
 
 
@@ -23,7 +35,470 @@ from .writer import Writer
 # from .Tools import showme
 
 
-class Fitter(Calculator):
+PARAMETERS = ("k_f", "k_b", "beta", "ga", "g_formation")
+
+# State shared by the tasks of a worker process, set once by `initialize_worker`
+WORKER = {}
+
+
+class Dataset:
+    """
+    Experimental dataset for joint fitting, with its own operating conditions.
+
+    A dataset pairs a potential sweep with an observable, either the current density or
+    the coverage of an adsorbed species, measured at given temperature and bulk
+    concentrations. Conditions left as None are taken from the model data.
+
+    Attributes
+    ----------
+    potential : numpy.ndarray
+        Experimental potentials.
+    values : numpy.ndarray
+        Experimental values of the observable.
+    observable : str
+        ``'j'`` for the current density or the name of an adsorbed species.
+    temperature : float or None
+        Temperature in Kelvin.
+    c0_reactants : numpy.ndarray or None
+        Bulk concentrations of the reactants.
+    c0_products : numpy.ndarray or None
+        Bulk concentrations of the products.
+    weight : float
+        Weight of the dataset in the joint objective function.
+    name : str
+        Name identifier of the dataset.
+    grid : numpy.ndarray
+        Indices of the experimental points used by the current fitting stage.
+    strategy : StaticConcentration, LinearConcentration, DynamicConcentration or None
+        Solver of the model at the conditions of the dataset, set by the `Fitter`.
+    """
+
+    def __init__(
+            self,
+            potential,
+            values,
+            observable="j",
+            temperature=None,
+            c0_reactants=None,
+            c0_products=None,
+            weight=1.0,
+            name=None,
+    ):
+        self.potential = np.array(potential, dtype=float)
+        self.values = np.array(values, dtype=float)
+        self.observable = observable
+        self.temperature = temperature
+        self.c0_reactants = c0_reactants
+        self.c0_products = c0_products
+        self.weight = weight
+        self.name = observable if name is None else name
+        self.grid = np.arange(len(self.potential))
+        self.strategy = None
+
+    def model(self, results):
+        """
+        Extracts the modeled observable from solved results.
+
+        Parameters
+        ----------
+        results : BaseConcentration
+            Strategy after its solver has run.
+
+        Returns
+        -------
+        numpy.ndarray
+            The absolute current density or the coverage of the observed species.
+        """
+        if self.observable == "j":
+            return np.abs(results.j)
+        return results.theta[:, results.species.adsorbed.index(self.observable)]
+
+    def observed(self):
+        """
+        Experimental values of the selected points, compared with `model`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The absolute current density or the coverage of each selected point.
+        """
+        values = self.values[self.grid]
+        if self.observable == "j":
+            return np.abs(values)
+        return values
+
+    def scale(self):
+        """
+        Scale of the residuals of the dataset.
+
+        Currents are scaled by the square root of the experimental value, as in the
+        single-curve objective function, while coverages are compared directly. Both
+        are multiplied by the square root of the weight.
+
+        Returns
+        -------
+        numpy.ndarray
+            The scale of each selected experimental point.
+        """
+        values = self.observed()
+        if self.observable == "j":
+            return np.sqrt(self.weight / values)
+        return np.full(len(values), np.sqrt(self.weight))
+
+
+def update_rates(kpy, parts):
+    """
+    Replaces parts of the rate constants of a kinetic model.
+
+    Parameters
+    ----------
+    kpy : Kpynetic
+        The kinetic model.
+    parts : dict
+        New values of ``experimental_part``, ``thermochemical_part`` or ``beta``.
+    """
+    for name, value in parts.items():
+        if name == "beta":
+            kpy.reactions.beta = value
+        else:
+            setattr(kpy, name, value)
+
+
+def solve_dataset(dataset, parts):
+    """
+    Solves the model at the conditions of a dataset.
+
+    Defined at module level so that datasets can be solved in worker processes.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        Dataset with its strategy.
+    parts : dict
+        Parts of the rate constants for the evaluated parameters, see `Fitter.rate_parts`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The modeled observable at the selected potentials of the dataset.
+    """
+    update_rates(dataset.strategy.Kpy, parts)
+    return dataset.model(dataset.strategy.solver())
+
+
+def initialize_worker(state):
+    """
+    Initializer of the worker processes of a pool.
+
+    The state is sent to each worker once, when the pool starts, instead of with
+    every task, so the tasks only carry their own arguments.
+
+    Parameters
+    ----------
+    state : dict
+        Objects shared by the tasks, stored in `WORKER`.
+    """
+    WORKER.update(state)
+
+
+def evaluate_candidate(x):
+    """
+    Objective function of the fitter of the worker process.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Candidate parameters.
+
+    Returns
+    -------
+    float
+        The error of the candidate, see `Fitter.object`.
+    """
+    return WORKER["fitter"].object(x)
+
+
+def solve_indexed(index, parts):
+    """
+    Solves a dataset held by the worker process.
+
+    Parameters
+    ----------
+    index : int
+        Position of the dataset in the datasets of the worker.
+    parts : dict
+        Parts of the rate constants for the evaluated parameters.
+
+    Returns
+    -------
+    numpy.ndarray
+        The modeled observable at the selected potentials of the dataset, see
+        `solve_dataset`.
+    """
+    return solve_dataset(WORKER["datasets"][index], parts)
+
+
+def fit_start(x0):
+    """
+    Local fit of the fitter of the worker process from a starting point.
+
+    The errors evaluated during the fit are returned with the result, in
+    ``history``, and removed from the ``error_evolution`` of the worker, so the
+    calling process records the same history as a serial fit.
+
+    Parameters
+    ----------
+    x0 : numpy.ndarray
+        Starting point within the bounds.
+
+    Returns
+    -------
+    OptimizeResult
+        The result of `Fitter.local_fit`, with the errors of its evaluations.
+    """
+    fitter = WORKER["fitter"]
+    n = len(fitter.error_evolution)
+    result = fitter.local_fit(x0)
+    result.history = fitter.error_evolution[n:]
+    del fitter.error_evolution[n:]
+    return result
+
+
+class Parameterization:
+    """
+    Parameter vector of the rate constants, shared by the fitting and sensitivity
+    classes.
+
+    The parameters are any subset of the decimal logarithm of the forward and backward
+    experimental rate constants, the symmetry factors, the activation energies and the
+    formation energies of the adsorbed species. The mixin requires the ``Kpy``,
+    ``operation``, ``reactions`` and ``species`` attributes of a `Calculator`.
+
+    Attributes
+    ----------
+    fit_parameters : list of str
+        Groups of parameters, in the order of the parameter vector.
+    p_all : numpy.ndarray
+        Values of every group of parameters, varied or fixed.
+    slices : dict
+        Position of each group of parameters in ``p_all``.
+    labels : list of str
+        Label of each entry of ``p_all``.
+    index : numpy.ndarray
+        Positions of the varied parameters in ``p_all``.
+    names : list of str
+        Labels of the varied parameters.
+    bounds : Bounds
+        Bounds of the varied parameters.
+    """
+
+    def set_parameters(self, parameters, frozen=None):
+        """
+        Builds the parameter vector and its bounds.
+
+        Every group of parameters is laid out in a single vector,
+
+        .. math::
+
+            \\mathbf{p}_{all} = \\left[\\log_{10}\\overrightarrow{\\mathbf{k}}, \\,
+                \\log_{10}\\overleftarrow{\\mathbf{k}}, \\, \\boldsymbol{\\beta}, \\,
+                \\mathbf{G}_a, \\, \\mathbf{G}_f\\right]
+
+        holding the initial values of the model, and the optimizer only varies the
+        entries of the fitted groups. Rate constants are fitted in log-space, where a
+        single bound spans several orders of magnitude.
+
+        Parameters
+        ----------
+        parameters : sequence of str
+            Groups of fitted parameters.
+        frozen : sequence of str, optional
+            Labels of parameters of the fitted groups held at their initial values,
+            e.g. ``'ga[0]'`` or ``'g_formation[H*]'``. Default is None.
+
+        Raises
+        ------
+        ValueError
+            If a group is unknown, if rate constants are fitted without experimental
+            rate constants or energies without thermochemical data, if a fitted
+            rate constant is not positive or if a frozen label is unknown.
+        """
+        unknown = set(parameters) - set(PARAMETERS)
+        if unknown or len(parameters) == 0:
+            raise ValueError(f"The 'parameters' must be a subset of {PARAMETERS}.")
+        if {"k_f", "k_b"} & set(parameters) and not self.operation.experimental:
+            raise ValueError("Fitting 'k_f' or 'k_b' requires experimental rate constants.")
+        if {"ga", "g_formation"} & set(parameters) and not self.operation.thermochemical:
+            raise ValueError("Fitting 'ga' or 'g_formation' requires thermochemical data.")
+        self.fit_parameters = [name for name in PARAMETERS if name in parameters]
+
+        n_reactions = len(self.reactions.list)
+        n_adsorbed = self.reactions.upsilon_a.shape[1]
+        with np.errstate(divide="ignore"):
+            log_k = np.log10(self.Kpy.experimental_part)
+        ga, gf = np.zeros(n_reactions), np.zeros(n_adsorbed)
+        if self.operation.thermochemical:
+            ga, gf = self.reactions.ga, self.species.g_formation_ads
+        groups = [log_k[0], log_k[1], self.reactions.beta, ga, gf]
+        self.p_all = np.concatenate(groups).astype(float)
+        ends = np.cumsum([len(group) for group in groups])
+        self.slices = {
+            name: slice(end - len(group), end)
+            for name, group, end in zip(PARAMETERS, groups, ends)
+        }
+        self.labels = [
+            f"{name}[{key}]"
+            for name in PARAMETERS
+            for key in (self.species.adsorbed if name == "g_formation" else range(n_reactions))
+        ]
+        positions = np.arange(len(self.p_all))
+        self.index = np.concatenate([positions[self.slices[name]] for name in self.fit_parameters])
+        if frozen is not None:
+            unknown = set(frozen) - {self.labels[i] for i in self.index}
+            if unknown:
+                raise ValueError(f"Unknown frozen parameters: {sorted(unknown)}.")
+            self.index = np.array([i for i in self.index if self.labels[i] not in frozen])
+        self.names = [self.labels[i] for i in self.index]
+        self.p_last = np.copy(self.p_all)
+
+        p0 = self.p_all[self.index]
+        if not np.all(np.isfinite(p0)):
+            raise ValueError("Fitted rate constants must be positive.")
+        log = self.index < self.slices["beta"].start
+        lb = np.where(log, p0 - 1, p0 * 0.8)  # One decade or 80% of the initial value
+        ub = np.where(log, p0 + 1, p0 * 1.2)  # One decade or 120% of the initial value
+        lb, ub = np.minimum(lb, ub), np.maximum(lb, ub)
+        beta = (self.index >= self.slices["beta"].start) & (self.index < self.slices["beta"].stop)
+        lb[beta], ub[beta] = np.maximum(lb[beta], 0), np.minimum(ub[beta], 1)
+        self.bounds = Bounds(lb=lb, ub=ub, keep_feasible=True)
+
+    def full_vector(self, *energies):
+        """
+        Scatters a parameter vector into the full parameter vector.
+
+        Parameters
+        ----------
+        energies : tuple
+            Parameter vector evaluated.
+
+        Returns
+        -------
+        numpy.ndarray
+            The full parameter vector, with the fixed groups at their initial values.
+        """
+        values = np.copy(self.p_all)
+        values[self.index] = np.ravel(energies)
+        return values
+
+    def rate_parts(self, values, reference=None):
+        """
+        Maps a full parameter vector to the parts of the rate constants.
+
+        Each group is converted as a whole: the experimental part is
+        :math:`10^{\\log_{10} k}` and the thermochemical part follows from the
+        activation and formation energies. With a ``reference`` only the groups that
+        differ from it are returned, so `Kpynetic` keeps the exponentials of the
+        others, see `Kpynetic.rate_constants`.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Full parameter vector, see `full_vector`.
+        reference : numpy.ndarray, optional
+            Full parameter vector of the current rate constants. Default is None,
+            every fitted group is returned.
+
+        Returns
+        -------
+        dict
+            New ``experimental_part``, ``thermochemical_part`` or ``beta``.
+        """
+        differs = np.ones(len(values), dtype=bool)
+        if reference is not None:
+            differs = values != reference
+
+        def update(*names):
+            return any(
+                name in self.fit_parameters and np.any(differs[self.slices[name]])
+                for name in names
+            )
+
+        parts = {}
+        if update("k_f", "k_b"):
+            parts["experimental_part"] = 10 ** np.array(
+                [values[self.slices["k_f"]], values[self.slices["k_b"]]]
+            )
+        if update("beta"):
+            parts["beta"] = values[self.slices["beta"]]
+        if update("ga", "g_formation"):
+            parts["thermochemical_part"] = self.Kpy.thermochemical(
+                values[self.slices["ga"]],
+                values[self.slices["g_formation"]],
+                self.reactions.upsilon_a,
+            )
+        return parts
+
+    def apply_parameters(self, *energies):
+        """
+        Updates the rate constants of the model with a parameter vector.
+
+        Only the parts of the groups that changed since the last update are replaced.
+
+        Parameters
+        ----------
+        energies : tuple
+            Parameter vector evaluated.
+        """
+        values = self.full_vector(*energies)
+        update_rates(self.Kpy, self.rate_parts(values, reference=self.p_last))
+        self.p_last = values
+
+    def rate_derivatives(self, potential):
+        """
+        Derivatives of the logarithm of the rate constants with respect to the
+        parameter vector.
+
+        .. math::
+
+            \\frac{\\partial \\ln k}{\\partial \\log_{10} k} = \\ln 10, \\quad
+            \\frac{\\partial \\ln \\overrightarrow{k_i}}{\\partial \\beta_i} =
+            \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial \\beta_i} =
+                \\pm\\frac{n_i \\eta}{k_BT}, \\quad
+            \\frac{\\partial \\ln k_i}{\\partial G^{\\circ}_{a,i}} = -\\frac{1}{k_BT}, \\quad
+            \\frac{\\partial \\ln \\overleftarrow{k_i}}{\\partial G^{\\circ}_j} =
+                \\frac{\\upsilon_{ij}}{k_BT}
+
+        with the sign of the electrode in the symmetry factor term.
+
+        Parameters
+        ----------
+        potential : numpy.ndarray
+            Potentials where the derivatives are evaluated.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The derivatives of the forward and backward rate constants, each of shape
+            (n_potentials, n_reactions, n_parameters).
+        """
+        kT = k_B * self.operation.temperature
+        eta = np.asarray(potential, dtype=float)[:, None]
+        n_reactions = len(self.reactions.list)
+        reactions = np.arange(n_reactions)
+        dlnkf = np.zeros((len(eta), n_reactions, len(self.p_all)))
+        dlnkb = np.zeros((len(eta), n_reactions, len(self.p_all)))
+        dlnkf[:, reactions, reactions + self.slices["k_f"].start] = np.log(10)
+        dlnkb[:, reactions, reactions + self.slices["k_b"].start] = np.log(10)
+        electronic = self.Kpy.electrode * self.reactions.ne * eta / kT
+        dlnkf[:, reactions, reactions + self.slices["beta"].start] = electronic
+        dlnkb[:, reactions, reactions + self.slices["beta"].start] = electronic
+        dlnkf[:, reactions, reactions + self.slices["ga"].start] = -1 / kT
+        dlnkb[:, reactions, reactions + self.slices["ga"].start] = -1 / kT
+        dlnkb[:, :, self.slices["g_formation"]] = self.reactions.upsilon_a / kT
+        return dlnkf[:, :, self.index], dlnkb[:, :, self.index]
+
+
+class Fitter(Parameterization, Calculator):
     """
     A specialized class for energy fitting and optimization.
 
@@ -42,7 +517,9 @@ class Fitter(Calculator):
                                 J_{\\text{model}}(\\eta,\\mathbf{p})}{J_{\\text{exp}}(\\eta)} \\right]^2
     .. math::
 
-            \\text{w.r.t.:}\\quad \\mathbf{p} = \\{ G^{\circ}_{a,i}, \\, G^{\\circ}_j\\} \\quad \\forall \\, i, j
+            \\text{w.r.t.:}\\quad \\mathbf{p} \\subseteq \\{ \\log_{10}\\overrightarrow{k_i}, \\,
+                                \\log_{10}\\overleftarrow{k_i}, \\, \\beta_i, \\,
+                                G^{\\circ}_{a,i}, \\, G^{\\circ}_j\\} \\quad \\forall \\, i, j
 
     .. math::
 
@@ -73,9 +550,69 @@ class Fitter(Calculator):
         Optimized reaction energies derived from the fitted results.
     gf_fit : ndarray
         Optimized formation energies derived from the fitted results.
+    bounded : str or None
+        Early-abort mode of the objective function, ``'worst'``, ``'best'`` or None.
+    population_energies : ndarray or None
+        Objective function values of the last differential evolution population.
+    n_aborted : int
+        Number of objective evaluations stopped before the end of the sweep.
+    schedule : list of tuple or None
+        Coarse-to-fine fitting stages as ``(stride, maxiter)`` pairs.
+    grid : ndarray
+        Indices of the experimental points used by the current fitting stage.
+    checkpoint : str or None
+        Path of the ``.npz`` file where the optimizer state is periodically saved.
+    checkpoint_interval : int
+        Number of generations between two checkpoints.
+    rng : numpy.random.Generator
+        Random number generator driving the differential evolution.
+    optimizer : str
+        Optimization backend, ``'differential_evolution'``, ``'bayesian'`` or
+        ``'multistart'``.
+    workers : int
+        Number of processes evaluating batches of candidates in parallel.
+    max_evaluations : int
+        Budget of objective function evaluations of the Bayesian optimizer.
+    n_starts : int
+        Number of starting points of the multi-start optimizer.
+    datasets : list of Dataset
+        Datasets fitted jointly, empty when a single curve is fitted.
+    fit_parameters : list of str
+        Groups of fitted parameters, in the order of the parameter vector.
+    p_fit : dict
+        Fitted values of each group, rate constants in linear scale.
+    weights : numpy.ndarray
+        Weight of each experimental point.
+    residual : str
+        Form of the residuals, ``'relative'`` or ``'log'``.
+    model_potential : numpy.ndarray
+        Monotonic grid of potentials where the model is solved.
     """
 
-    def __init__(self, kpy, potential_data, j_data, name=None):
+    def __init__(
+            self,
+            kpy,
+            potential_data,
+            j_data,
+            name=None,
+            bounded=None,
+            bound_factor=2.0,
+            schedule=None,
+            checkpoint=None,
+            checkpoint_interval=10,
+            resume=None,
+            optimizer="differential_evolution",
+            workers=1,
+            max_evaluations=200,
+            datasets=None,
+            parameters=("ga", "g_formation"),
+            n_starts=16,
+            frozen=None,
+            weights=None,
+            residual="relative",
+            model_grid=None,
+            rng=None,
+    ):
         """
         Initializes the Fitter object and sets up necessary attributes and optimization bounds
         using provided data. This class manages data for a fitting process and performs
@@ -108,6 +645,50 @@ class Fitter(Calculator):
             Fitted energy parameters related to reactions.
         gf_fit : ndarray
             Fitted energy parameters related to species formation energies.
+        bounded : str or None
+            Early-abort mode of the objective function.
+        bound_factor : float
+            Multiplier of the best-so-far error used as threshold in ``'best'`` mode.
+        population_energies : ndarray or None
+            Objective function values of the last differential evolution population,
+            None until the first generation has been evaluated.
+        n_aborted : int
+            Number of objective evaluations stopped before the end of the sweep.
+        schedule : list of tuple or None
+            Coarse-to-fine fitting stages, the last one always uses the full dataset.
+        grid : ndarray
+            Indices of the experimental points used by the current fitting stage.
+        checkpoint : str or None
+            Path of the checkpoint file.
+        checkpoint_interval : int
+            Number of generations between two checkpoints.
+        rng : numpy.random.Generator
+            Random number generator driving the differential evolution, its state is
+            saved in the checkpoints.
+        stage : int
+            Index of the running stage of the schedule.
+        generation : int
+            Number of generations completed in the running stage.
+        optimizer : str
+            Optimization backend.
+        workers : int
+            Number of processes evaluating batches of candidates in parallel.
+        max_evaluations : int
+            Budget of objective function evaluations of the Bayesian optimizer.
+        n_starts : int
+            Number of starting points of the multi-start optimizer.
+        datasets : list of Dataset
+            Datasets fitted jointly.
+        executor : ProcessPoolExecutor or None
+            Pool solving the datasets in parallel during a differential evolution fit.
+        fit_parameters : list of str
+            Groups of fitted parameters.
+        p_all : numpy.ndarray
+            Values of every group of parameters, fitted or fixed.
+        slices : dict
+            Position of each group of parameters in ``p_all``.
+        index : numpy.ndarray
+            Positions of the fitted parameters in ``p_all``.
 
         Parameters
         ----------
@@ -116,11 +697,100 @@ class Fitter(Calculator):
             system parameters and reactions.
         potential_data : object
             Potential data used for setting up the system's parameters in the fitting process.
+            May be None when ``datasets`` are given.
         j_data : object
             Journal data used for additional calibration in the fitting process, if required.
+            May be None when ``datasets`` are given.
         name : str, optional
             An optional name identifier for the fitter. If not provided, the default name 'melek'
             will be used.
+        bounded : str, optional
+            Enables the bounded evaluation of the objective function. The squared error is
+            accumulated while the potentials are solved and the sweep is stopped as soon as
+            it exceeds the worst energy of the current population (``'worst'``) or
+            ``bound_factor`` times the best-so-far energy (``'best'``). Default is None,
+            every trial vector is solved over the whole potential range.
+        bound_factor : float, optional
+            Multiplier of the best-so-far error used as threshold when ``bounded='best'``.
+            Default is 2.0.
+        schedule : list of tuple, optional
+            Coarse-to-fine multigrid schedule as a list of ``(stride, maxiter)`` pairs. Each
+            stage fits every ``stride``-th experimental point during at most ``maxiter``
+            generations, and its final population initializes the next stage. A final stage
+            on the full dataset, ``(1, 1000)``, is appended if the last stride is not 1; a
+            ``maxiter`` of None stands for 1000 generations. Default is None, a single fit
+            on every experimental point.
+        checkpoint : str, optional
+            Path of an ``.npz`` file where the population, its energies, the state of the
+            random number generator, the error evolution and the best candidate are saved
+            every ``checkpoint_interval`` generations. Default is None, no checkpoints.
+        checkpoint_interval : int, optional
+            Number of generations between two checkpoints. Default is 10.
+        resume : str, optional
+            Path of a checkpoint file. If given, the fit continues from the saved state
+            instead of starting from a new population. See `resume`.
+        optimizer : str, optional
+            Optimization backend. ``'differential_evolution'`` (default) runs the
+            population-based fit; ``'bayesian'`` fits a Gaussian process surrogate of the
+            objective function over the bounds and only solves the model for the
+            candidates of maximum expected improvement, see `fit_bayesian`;
+            ``'multistart'`` runs local gradient-based fits from a space-filling set of
+            starting points, see `fit_multistart`.
+        workers : int, optional
+            Number of processes used by the Bayesian optimizer to evaluate each batch of
+            candidates, which is also the batch size, or by the multi-start optimizer to
+            run the local fits. Default is 1.
+        max_evaluations : int, optional
+            Budget of objective function evaluations of the Bayesian optimizer.
+            Default is 200.
+        datasets : list of Dataset, optional
+            Datasets fitted jointly with one energy vector. Each dataset is solved at its
+            own temperature and bulk concentrations, and the residuals of all of them are
+            assembled into a single weighted residual vector, see `residuals`. If
+            ``potential_data`` and ``j_data`` are also given they are fitted as the first
+            dataset, at the conditions of ``kpy``. With ``workers`` > 1 the datasets are
+            solved in parallel processes. The bounded evaluation, ``weights``,
+            ``model_grid`` and the ``'log'`` residual do not apply to joint fits, each
+            dataset is weighed by its ``weight`` instead. Default is None.
+        parameters : sequence of str, optional
+            Groups of fitted parameters, any subset of ``'k_f'``, ``'k_b'``, ``'beta'``,
+            ``'ga'`` and ``'g_formation'``. The rate constants are fitted as their
+            decimal logarithm within one decade of the initial values, the symmetry
+            factors and energies within 20 % of them. Default is
+            ``('ga', 'g_formation')``.
+        n_starts : int, optional
+            Number of starting points of the multi-start optimizer. Default is 16.
+        frozen : sequence of str, optional
+            Labels of parameters held at their initial values, for instance those that
+            a `Sensitivity` analysis finds not identifiable. Default is None.
+        weights : array_like, optional
+            Weight of each experimental point in the objective function. Default is
+            None, every point weighs 1.
+        residual : str, optional
+            ``'relative'`` (default) compares the currents as
+            :math:`(J_{exp} - |J_{model}|)^2/J_{exp}`; ``'log'`` compares their logarithms,
+            :math:`(\\ln J_{exp} - \\ln |J_{model}|)^2`, which weighs every decade of a
+            Tafel plot alike.
+        model_grid : int or array_like, optional
+            Potentials where the model is solved. An integer gives that number of
+            evenly spaced potentials over the experimental window. Default is None,
+            the experimental potentials sorted and without duplicates. The grid
+            follows the direction of the experimental sweep, and the model is
+            interpolated onto the experimental points inside the objective function.
+        rng : numpy.random.Generator or int, optional
+            Random number generator of the optimizers, or the seed of a new one, so
+            that fits and their resumed runs are reproducible. Default is None, a
+            generator seeded from the operating system.
+
+        Raises
+        ------
+        ValueError
+            If ``bounded`` is not None, ``'worst'`` or ``'best'``, if a stride of the
+            schedule is not a positive integer, if ``optimizer`` or ``residual`` are
+            unknown, if the ``parameters`` are not valid for the model, see
+            `set_parameters`, if the ``weights`` do not match the experimental data, or
+            if ``datasets`` are combined with ``weights``, ``model_grid`` or the
+            ``'log'`` residual.
 
         """
         if name is None:
@@ -131,23 +801,99 @@ class Fitter(Calculator):
         self.writer = Writer()
         self.writer.message(f"*** Fitter : {self.name}  ***")
 
+        if bounded not in (None, "worst", "best"):
+            raise ValueError("The 'bounded' parameter must be None, 'worst' or 'best'.")
+        self.bounded = bounded
+        self.bound_factor = bound_factor
+        self.population_energies = None
+        self.n_aborted = 0
+
+        if schedule is not None:
+            schedule = [(int(stride), maxiter) for stride, maxiter in schedule]
+            if any(stride < 1 for stride, _ in schedule):
+                raise ValueError("The strides of the schedule must be positive integers.")
+            if len(schedule) == 0 or schedule[-1][0] != 1:
+                schedule.append((1, 1000))
+        self.schedule = schedule
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = max(int(checkpoint_interval), 1)
+        self.rng = np.random.default_rng(rng)
+        self.stage = 0
+        self.generation = 0
+
+        if optimizer not in ("differential_evolution", "bayesian", "multistart"):
+            raise ValueError(
+                "The 'optimizer' parameter must be 'differential_evolution', 'bayesian' "
+                "or 'multistart'."
+            )
+        self.optimizer = optimizer
+        self.workers = max(int(workers), 1)
+        self.max_evaluations = max_evaluations
+        self.n_starts = max(int(n_starts), 1)
+
+        self.executor = None
+        if datasets is not None:
+            datasets = list(datasets)
+            if potential_data is not None:
+                datasets.insert(0, Dataset(potential_data, j_data))
+            potential_data, j_data = datasets[0].potential, datasets[0].values
+
+        if residual not in ("relative", "log"):
+            raise ValueError("The 'residual' parameter must be 'relative' or 'log'.")
+        if datasets is not None and (
+                residual != "relative" or weights is not None or model_grid is not None
+        ):
+            raise ValueError(
+                "Joint fits of datasets support neither 'weights', 'model_grid' nor the "
+                "'log' residual, weigh each Dataset instead."
+            )
+        self.residual = residual
+
         self.Kpy = copy.deepcopy(kpy)
         self.data = self.Kpy.data
-        self.potential_data = copy.deepcopy(potential_data)
-        self.j_data = copy.deepcopy(j_data)
-        self.data.parameters.potential = self.potential_data
+        self.potential_data = np.array(potential_data, dtype=float)
+        self.j_data = np.array(j_data, dtype=float)
+        self.weights = np.ones(len(self.j_data))
+        if weights is not None:
+            self.weights = np.array(weights, dtype=float)
+            if self.weights.shape != self.j_data.shape:
+                raise ValueError("The 'weights' must have one value per experimental point.")
+        self.model_points = model_grid
+        if np.ndim(model_grid) == 0 and model_grid is not None:
+            self.model_points = np.linspace(
+                self.potential_data[0], self.potential_data[-1], int(model_grid)
+            )
+        self.datasets = []
+        self.set_grid(1)
         super().__init__(self.Kpy)
         self.error_evolution = []
+        if datasets is not None:
+            self.datasets = [self.prepare_dataset(dataset) for dataset in datasets]
+            self.set_grid(1)
+
+        self.set_parameters(parameters, frozen)
+        if resume is None:
+            self.g_fit = self.fit_energies()
+            self.set_fit()
+        else:
+            self.resume(resume)
+
+    def set_fit(self):
+        """
+        Stores the fitted values of each group of parameters.
 
-        g0 = np.concatenate([self.data.reactions.ga, self.data.species.g_formation_ads])
-        g_lb = g0 * 0.8  # Lower limit (80% of the initial value)
-        g_ub = g0 * 1.2  # Upper limit (120% of the initial value)
-        g_lb, g_ub = np.minimum(g_lb, g_ub), np.maximum(g_lb, g_ub)
-        self.bounds = Bounds(lb=g_lb, ub=g_ub, keep_feasible=True)
-        self.g_fit = self.fit_energies()
-        self.ga_fit, self.gf_fit = self.unziper(self.g_fit.x)
+        Sets ``p_fit``, with the rate constants in linear scale, and the fitted
+        energies ``ga_fit`` and ``gf_fit``.
+        """
+        values = self.full_vector(self.g_fit.x)
+        self.p_fit = {
+            name: 10 ** values[self.slices[name]] if name in ("k_f", "k_b")
+            else values[self.slices[name]]
+            for name in self.fit_parameters
+        }
+        self.ga_fit, self.gf_fit = self.unziper(values)
 
-    def fit_energies(self):
+    def fit_energies(self, init="latinhypercube", stage=0, generation=0):
         """
         Optimize a given objective function using the Differential Evolution algorithm.
 
@@ -157,6 +903,21 @@ class Fitter(Calculator):
         population size, among others. If an error occurs during the optimization, it
         is caught and logged, and the method safely returns `None`.
 
+        When a `schedule` is given, the fit runs as a sequence of coarse-to-fine stages.
+        Early stages solve only a decimated subset of the experimental potentials, where
+        a rough population does not need the full curve to be ranked, and every stage
+        starts from the final population of the previous one. Only the last stage, on
+        the full dataset, is polished.
+
+        Parameters
+        ----------
+        init : str or ndarray, optional
+            Initialization of the first population. Default is 'latinhypercube'.
+        stage : int, optional
+            Stage of the schedule where the fit starts. Default is 0.
+        generation : int, optional
+            Generations already completed in the starting stage. Default is 0.
+
         Returns
         -------
         OptimizeResult or None
@@ -178,27 +939,421 @@ class Fitter(Calculator):
         for nonlinear and non-differentiable functions.
         """
         try:
-            g_fit = differential_evolution(
-                func=self.object,
-                bounds=self.bounds,
-                strategy="best1bin",
-                popsize=15,
-                tol=1e-3,
-                mutation=(0.5, 1.0),
-                recombination=0.7,
-                seed=None,
-                disp=False,
-                polish=True,
-                init="latinhypercube",
-                updating="immediate",
-                callback=self.display_error_evolution,
-            )
+            if self.optimizer == "bayesian":
+                return self.fit_bayesian()
+            if self.optimizer == "multistart":
+                return self.fit_multistart()
+
+            schedule = self.schedule if self.schedule is not None else [(1, 1000)]
+            for k in range(stage, len(schedule)):
+                stride, maxiter = schedule[k]
+                maxiter = 1000 if maxiter is None else maxiter
+                self.stage, self.generation = k, generation
+                self.set_grid(stride)
+                if self.workers > 1 and len(self.datasets) > 1:
+                    self.start_pool()
+                if self.schedule is not None:
+                    self.writer.message(
+                        f"Fitter stage {k + 1}/{len(schedule)}: "
+                        f"{len(self.grid)} of {len(self.j_data)} points"
+                    )
+                g_fit = self.evolve(
+                    init=init,
+                    maxiter=max(maxiter - generation, 1),
+                    polish=k == len(schedule) - 1,
+                )
+                init, generation = g_fit.population, 0
             return g_fit
 
         except Exception as e:
             print(f"Error during optimization: {e}")
             return None
 
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+    def start_pool(self):
+        """
+        Starts the pool solving the datasets in parallel.
+
+        The datasets are sent to each worker once, when the pool starts, and the
+        evaluations only send their position and the parts of the rate constants.
+        The grid of the datasets is part of the state of the workers, so a new pool
+        replaces the previous one at each stage of the schedule.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=initialize_worker,
+            initargs=({"datasets": self.datasets},),
+        )
+
+    def fit_bayesian(self, n_initial=None):
+        """
+        Surrogate-assisted Bayesian optimization of the energies.
+
+        Each objective evaluation is a full nonlinear sweep, so instead of evolving a
+        population the optimizer conditions a Gaussian process `Surrogate` on every
+        evaluated candidate and solves the model only for the candidates that maximize
+        the expected improvement. The surrogate models the logarithm of the error,
+        which spans several orders of magnitude across the bounds. Candidates are
+        proposed in batches of ``workers`` points, evaluated in parallel processes.
+
+        Parameters
+        ----------
+        n_initial : int, optional
+            Number of points of the initial Latin hypercube design. Default is
+            ``2 d + 1`` for ``d`` parameters, limited by ``max_evaluations``.
+
+        Returns
+        -------
+        OptimizeResult
+            The best evaluated candidate ``x`` and its error ``fun``, the number of
+            evaluations ``nfev`` and of batches ``nit``, and every evaluated candidate
+            and error in ``x_evaluated`` and ``fun_evaluated``.
+        """
+        lb, ub = self.bounds.lb, self.bounds.ub
+        d = len(lb)
+        if n_initial is None:
+            n_initial = 2 * d + 1
+        n_initial = min(n_initial, self.max_evaluations)
+        surrogate = Surrogate(lb, ub, rng=self.rng)
+        sampler = qmc.LatinHypercube(d=d, seed=self.rng)
+
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=initialize_worker,
+                initargs=({"fitter": self},),
+            )
+        try:
+            x = surrogate.unscale(sampler.random(n_initial))
+            y = self.evaluate(x, executor)
+            nit = 0
+            while len(y) < self.max_evaluations:
+                surrogate.fit(x, np.log(np.maximum(y, 1e-300)))
+                size = min(self.workers, self.max_evaluations - len(y))
+                batch = surrogate.propose_batch(size)
+                x = np.vstack([x, batch])
+                y = np.append(y, self.evaluate(batch, executor))
+                nit += 1
+                self.display_error_evolution(x[np.argmin(y)])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        best = np.argmin(y)
+        return OptimizeResult(
+            x=x[best],
+            fun=y[best],
+            nfev=len(y),
+            nit=nit,
+            success=bool(np.isfinite(y[best])),
+            message="Maximum number of evaluations reached.",
+            x_evaluated=x,
+            fun_evaluated=y,
+        )
+
+    def fit_multistart(self, sampling="sobol", tol=1e-3):
+        """
+        Multi-start local optimization of the parameters.
+
+        ``n_starts`` starting points are drawn from a scrambled Sobol sequence or a
+        Latin hypercube over the bounds, and a gradient-based L-BFGS-B fit is run from
+        each of them, in parallel processes when ``workers`` > 1, which receive the
+        fitter once, see `fit_start`. Every evaluation is recorded in
+        ``error_evolution``, in the order of the starts. Local fits that converge to
+        the same point, within ``tol`` of the width of the bounds in every
+        parameter, are merged, and the distinct minima are ranked by their error. On
+        smooth objective functions this reaches the global minimum with far fewer
+        evaluations than a differential evolution, and the ranked minima reveal
+        alternative parameter sets that fit the data.
+
+        Parameters
+        ----------
+        sampling : str, optional
+            ``'sobol'`` (default) or ``'latinhypercube'``.
+        tol : float, optional
+            Relative distance below which two minima are merged. Default is 1e-3.
+
+        Returns
+        -------
+        OptimizeResult
+            The best minimum ``x`` and its error ``fun``, the total number of
+            evaluations ``nfev``, the starting points ``starts`` and the distinct minima
+            and their errors, ranked, in ``minima`` and ``fun_minima``.
+
+        Raises
+        ------
+        ValueError
+            If ``sampling`` is unknown.
+        """
+        lb, ub = self.bounds.lb, self.bounds.ub
+        d = len(lb)
+        if sampling == "sobol":
+            m = int(np.ceil(np.log2(self.n_starts)))
+            u = qmc.Sobol(d=d, seed=self.rng).random_base2(m)[: self.n_starts]
+        elif sampling == "latinhypercube":
+            u = qmc.LatinHypercube(d=d, seed=self.rng).random(self.n_starts)
+        else:
+            raise ValueError("The 'sampling' parameter must be 'sobol' or 'latinhypercube'.")
+        starts = lb + u * (ub - lb)
+        self.writer.message(f"Multi-start: {self.n_starts} local fits")
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=initialize_worker,
+                    initargs=({"fitter": self},),
+            ) as executor:
+                results = list(executor.map(fit_start, starts))
+            for result in results:
+                self.error_evolution.extend(result.history)
+        else:
+            results = [self.local_fit(x0) for x0 in starts]
+
+        width = np.where(ub > lb, ub - lb, 1.0)
+        minima, fun_minima = [], []
+        for result in sorted(results, key=lambda r: r.fun):
+            if not np.isfinite(result.fun):
+                continue
+            if any(np.all(np.abs(result.x - x) <= tol * width) for x in minima):
+                continue
+            minima.append(result.x)
+            fun_minima.append(result.fun)
+        self.display_error_evolution(None)
+
+        if len(minima) == 0:
+            self.writer.logger.error("No local fit converged to a finite error")
+            minima, fun_minima = [starts[0]], [np.inf]
+        return OptimizeResult(
+            x=minima[0],
+            fun=fun_minima[0],
+            nfev=int(sum(result.nfev for result in results)),
+            nit=len(results),
+            success=bool(np.isfinite(fun_minima[0])),
+            message=f"{len(minima)} distinct minima from {len(results)} starts.",
+            starts=starts,
+            minima=np.array(minima),
+            fun_minima=np.array(fun_minima),
+        )
+
+    def local_fit(self, x0):
+        """
+        Runs a gradient-based local fit from a starting point.
+
+        Parameters
+        ----------
+        x0 : numpy.ndarray
+            Starting point within the bounds.
+
+        Returns
+        -------
+        OptimizeResult
+            The result of the L-BFGS-B optimizer.
+        """
+        return minimize(
+            self.object,
+            x0,
+            method="L-BFGS-B",
+            bounds=list(zip(self.bounds.lb, self.bounds.ub)),
+        )
+
+    def evaluate(self, candidates, executor=None):
+        """
+        Evaluates the objective function for a batch of candidates.
+
+        Parameters
+        ----------
+        candidates : numpy.ndarray
+            Candidates of shape (n, d).
+        executor : concurrent.futures.Executor, optional
+            Pool used to evaluate the candidates in parallel, initialized with
+            `initialize_worker` to hold a copy of the fitter. Only the candidates are
+            sent to the workers, and the errors are appended to ``error_evolution``
+            here. Default is None, serial evaluation.
+
+        Returns
+        -------
+        numpy.ndarray
+            The error of each candidate.
+        """
+        if executor is None:
+            return np.array([self.object(x) for x in candidates])
+        errors = np.array(list(executor.map(evaluate_candidate, candidates)))
+        self.error_evolution.extend(errors.tolist())
+        return errors
+
+    def evolve(self, init="latinhypercube", maxiter=1000, polish=True):
+        """
+        Runs the differential evolution optimizer over the current grid.
+
+        Parameters
+        ----------
+        init : str or ndarray, optional
+            Initialization of the population, a sampling method or an array with the
+            initial population. Default is 'latinhypercube'.
+        maxiter : int, optional
+            Maximum number of generations. Default is 1000.
+        polish : bool, optional
+            Whether the best member is polished with L-BFGS-B. Default is True.
+
+        Returns
+        -------
+        OptimizeResult
+            The result of the differential evolution optimization process, including
+            the final ``population``.
+        """
+        self.population_energies = None
+        return differential_evolution(
+            func=self.object,
+            bounds=self.bounds,
+            strategy="best1bin",
+            maxiter=maxiter,
+            popsize=15,
+            tol=1e-3,
+            mutation=(0.5, 1.0),
+            recombination=0.7,
+            seed=self.rng,
+            disp=False,
+            polish=polish,
+            init=init,
+            updating="immediate",
+            callback=self.monitor,
+        )
+
+    def set_grid(self, stride):
+        """
+        Selects every ``stride``-th experimental point for the objective function.
+
+        The first and last experimental points are always kept, so every stage spans
+        the whole potential window. The model grid is built from the selected points,
+        or decimated by the same stride if it was given, and sorted in the direction
+        of the experimental sweep without duplicates, so the continuation of the
+        solver never steps back or solves a potential twice. Each selected point is
+        assigned to the segment of the model grid that contains it, see
+        `bounded_object`.
+
+        Parameters
+        ----------
+        stride : int
+            Decimation factor of the experimental data, 1 selects every point.
+        """
+        n = len(self.potential_data)
+        self.grid = np.unique(np.append(np.arange(0, n, stride), n - 1))
+        potential = self.potential_data[self.grid]
+        if self.model_points is not None:
+            n = len(self.model_points)
+            potential = np.asarray(self.model_points, dtype=float)
+            potential = potential[np.unique(np.append(np.arange(0, n, stride), n - 1))]
+        self.direction = -1.0 if self.potential_data[-1] < self.potential_data[0] else 1.0
+        self.model_potential = self.direction * np.unique(self.direction * potential)
+        self.data.parameters.potential = self.model_potential
+        self.segments = np.searchsorted(
+            self.direction * self.model_potential,
+            self.direction * self.potential_data[self.grid],
+        )
+        for dataset in self.datasets:
+            n = len(dataset.potential)
+            dataset.grid = np.unique(np.append(np.arange(0, n, stride), n - 1))
+            dataset.strategy.operation.potential = dataset.potential[dataset.grid]
+        if self.datasets:
+            self.dataset_values = np.concatenate(
+                [dataset.observed() for dataset in self.datasets]
+            )
+            self.dataset_scales = np.concatenate(
+                [dataset.scale() for dataset in self.datasets]
+            )
+
+    def prepare_dataset(self, dataset):
+        """
+        Builds the solver of the model at the operating conditions of a dataset.
+
+        The model data is copied and its temperature, bulk concentrations and potential
+        are replaced by those of the dataset, then a new `Kpynetic` is created so the
+        pre-exponential factor follows the temperature.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset to prepare.
+
+        Returns
+        -------
+        Dataset
+            The dataset, with its ``strategy`` set.
+
+        Raises
+        ------
+        ValueError
+            If the observable is neither ``'j'`` nor an adsorbed species.
+        """
+        if dataset.observable != "j" and dataset.observable not in self.species.adsorbed:
+            raise ValueError(
+                f"Observable '{dataset.observable}' must be 'j' or an adsorbed species."
+            )
+        data = copy.deepcopy(self.data)
+        data.parameters.potential = dataset.potential
+        if dataset.temperature is not None:
+            data.parameters.temperature = dataset.temperature
+        if dataset.c0_reactants is not None:
+            data.species.c0_reactants = np.array(dataset.c0_reactants, dtype=float)
+        if dataset.c0_products is not None:
+            data.species.c0_products = np.array(dataset.c0_products, dtype=float)
+        kpy = Kpynetic(data, writer=self.writer)
+        if data.parameters.cstr:
+            dataset.strategy = DynamicConcentration(kpy)
+        elif LinearConcentration.applies(kpy):
+            dataset.strategy = LinearConcentration(kpy)
+        else:
+            dataset.strategy = StaticConcentration(kpy)
+        self.writer.message(
+            f"Dataset '{dataset.name}': {len(dataset.potential)} points, "
+            f"T = {data.parameters.temperature} K, "
+            f"strategy {type(dataset.strategy).__name__}"
+        )
+        return dataset
+
+    def residuals(self, *energies):
+        """
+        Weighted residual vector of the joint fit over every dataset.
+
+        .. math::
+
+            r_k = \\sqrt{w_d}\\, \\frac{y_{\\text{exp},k} - y_{\\text{model},k}(\\mathbf{p})}{s_k}
+
+        with :math:`s_k = \\sqrt{|J_{\\text{exp},k}|}` for currents and :math:`s_k = 1` for
+        coverages, so the sum of squares of a single current dataset equals the
+        single-curve objective function. The datasets are solved in parallel when a pool
+        is available, and their residuals are assembled in a single array operation.
+
+        Parameters
+        ----------
+        energies : tuple
+            Energies evaluated.
+
+        Returns
+        -------
+        numpy.ndarray
+            The residuals of the selected points of every dataset, concatenated.
+        """
+        parts = self.rate_parts(self.full_vector(*energies))
+        if self.executor is None:
+            models = [solve_dataset(d, parts) for d in self.datasets]
+        else:
+            models = list(
+                self.executor.map(
+                    solve_indexed,
+                    range(len(self.datasets)),
+                    [parts] * len(self.datasets),
+                )
+            )
+        return (self.dataset_values - np.concatenate(models)) * self.dataset_scales
+
     def object(self, *energies):
         """
         Calculate the fitting error between experimental and calculated currents.
@@ -222,13 +1377,24 @@ class Fitter(Calculator):
             experimental data (`j_data`).
         """
         try:
-            j_fit = np.abs(self.current_energies(*energies))
-            if np.any(self.j_data == 0):
+            if self.datasets:
+                error = np.sum(self.residuals(*energies) ** 2)
+                self.error_evolution.append(error)
+                return error
+
+            j_data = self.j_data[self.grid]
+            if np.any(j_data == 0):
                 print("Warning: Encountered zero in calculated currents.")
                 return np.inf
 
+            if self.bounded is not None:
+                error = self.bounded_object(*energies)
+                self.error_evolution.append(error)
+                return error
+
+            j_fit = self.interpolate(self.current_energies(*energies))
             # Calculate the squared error with respect to the experimental data
-            error = np.sum(np.pow(self.j_data - j_fit, 2) / self.j_data)
+            error = np.sum(self.point_errors(np.arange(len(j_data)), j_fit))
             # print(f"Error: {error}")
             self.error_evolution.append(error)
             return error
@@ -236,38 +1402,185 @@ class Fitter(Calculator):
             print(f"Error in fitting calculation: {e}")
             return np.inf
 
-    def unziper(self, variables):
+    def interpolate(self, j_model, n_solved=None):
+        """
+        Interpolates the modeled current onto the selected experimental potentials.
+
+        Parameters
+        ----------
+        j_model : numpy.ndarray
+            Current density at the model potentials.
+        n_solved : int, optional
+            Number of solved model potentials, the currents beyond are ignored.
+            Default is None, every model potential.
+
+        Returns
+        -------
+        numpy.ndarray
+            The absolute current density at the selected experimental potentials,
+            constant beyond the ends of the model grid.
+        """
+        n_solved = len(self.model_potential) if n_solved is None else n_solved
+        return np.interp(
+            self.direction * self.potential_data[self.grid],
+            self.direction * self.model_potential[:n_solved],
+            np.abs(j_model[:n_solved]),
+        )
+
+    def point_errors(self, positions, j_fit):
         """
-        Unzips the input tuple into two distinct parts: the first part corresponds
-        to a subset aligned with the length of a specific attribute in the object,
-        and the second part represents the remaining elements.
+        Weighted squared residuals of selected experimental points.
+
+        .. math::
 
-        The method primarily operates on tuples, extracting and splitting data
-        based on pre-determined boundaries determined by the length of a specific
-        attribute.
+            e_k = w_k \\frac{(|J_{exp,k}| - |J_{model,k}|)^2}{|J_{exp,k}|}
+            \\quad \\text{or} \\quad
+            e_k = w_k \\left(\\ln |J_{exp,k}| - \\ln |J_{model,k}|\\right)^2
+
+        for relative and log residuals respectively, so cathodic data may be given
+        with its sign.
 
         Parameters
         ----------
-        variables : tuple or any
-            The input data to be unzipped. If it's a tuple, it is divided into two
-            components based on the length of `self.data.reactions.list`. If not
-            a tuple, it is processed as a single component.
+        positions : numpy.ndarray
+            Positions of the points in the current grid.
+        j_fit : numpy.ndarray
+            Modeled absolute current density at those points.
+
+        Returns
+        -------
+        numpy.ndarray
+            The contribution of each point to the objective function.
+        """
+        j_data = np.abs(self.j_data[self.grid][positions])
+        weights = self.weights[self.grid][positions]
+        if self.residual == "log":
+            with np.errstate(divide="ignore"):
+                return weights * (np.log(j_data) - np.log(j_fit)) ** 2
+        return weights * (j_data - j_fit) ** 2 / j_data
+
+    def residual_vector(self, *energies):
+        """
+        Residuals whose sum of squares is the objective function.
+
+        Parameters
+        ----------
+        energies : tuple
+            Parameters evaluated.
+
+        Returns
+        -------
+        numpy.ndarray
+            The signed residuals of the selected points, of every dataset for a joint
+            fit.
+        """
+        if self.datasets:
+            return self.residuals(*energies)
+        j_data = self.j_data[self.grid]
+        j_fit = self.interpolate(self.current_energies(*energies))
+        errors = np.sqrt(self.point_errors(np.arange(len(j_data)), j_fit))
+        return np.sign(np.abs(j_data) - j_fit) * errors
+
+    def bounded_object(self, *energies):
+        """
+        Calculate the fitting error with early abort of the potential sweep.
+
+        The squared error is accumulated point by point while the strategy solver
+        advances along the potentials. Once the partial error exceeds the threshold
+        given by `bound_threshold` the trial vector can no longer be accepted by the
+        optimizer, so the sweep is stopped and a penalty is returned. Every experimental
+        point is evaluated as soon as the model potentials that enclose it are solved.
+        The penalty extrapolates the partial error to the full set of experimental
+        points,
+
+        .. math::
+
+            f_{\\text{penalty}} = f_{\\text{partial}} \\frac{N}{n}
+
+        where :math:`n` is the number of evaluated points out of :math:`N`.
+
+        Parameters
+        ----------
+        energies : tuple
+            Energies used to calculate the modeled current.
+
+        Returns
+        -------
+        float
+            The fitting error, or the penalty if the sweep was aborted.
+        """
+        threshold = self.bound_threshold()
+        n_points = len(self.grid)
+        last = len(self.model_potential) - 1
+        partial = 0.0
+
+        def accumulate(i, j):
+            nonlocal partial
+            positions = np.flatnonzero(
+                (self.segments == i) | ((i == last) & (self.segments > last))
+            )
+            if len(positions) > 0:
+                j_fit = self.interpolate(self.strategy.j, i + 1)[positions]
+                partial += np.sum(self.point_errors(positions, j_fit))
+            return partial > threshold
+
+        self.current_energies(*energies, callback=accumulate)
+        n_solved = self.strategy.n_solved
+        if n_solved <= last:
+            self.n_aborted += 1
+            n_evaluated = np.count_nonzero(self.segments < n_solved)
+            return partial * n_points / max(n_evaluated, 1)
+        return partial
+
+    def bound_threshold(self):
+        """
+        Threshold used by the bounded evaluation of the objective function.
+
+        In ``'worst'`` mode the threshold is the worst finite energy of the last
+        population. Since every trial vector is compared against a population member,
+        a trial above that value is always rejected, and stopping its evaluation does
+        not change the optimization path. In ``'best'`` mode the threshold is
+        ``bound_factor`` times the best energy found so far, which aborts more
+        aggressively.
+
+        Returns
+        -------
+        float
+            The threshold, or infinity while the first population is being evaluated.
+        """
+        if self.population_energies is None:
+            return np.inf
+        energies = self.population_energies[np.isfinite(self.population_energies)]
+        if len(energies) == 0:
+            return np.inf
+        if self.bounded == "best":
+            return self.bound_factor * np.min(energies)
+        return np.max(energies)
+
+    def unziper(self, variables):
+        """
+        Unzips the activation and formation energies of a full parameter vector.
+
+        Parameters
+        ----------
+        variables : tuple or numpy.ndarray
+            The full parameter vector, ``p_all`` layout. If it's a tuple, its first
+            element is used.
 
         Returns
         -------
         tuple
             A tuple containing two elements:
-                - The first element is aligned in size with the length of
-                  `self.data.reactions.list`.
-                - The second element contains the rest of the items beyond that length.
+                - The activation energies, one per reaction.
+                - The formation energies of the adsorbed species.
         """
         if isinstance(variables, tuple):
             variables = variables[0]
-        a = variables[: len(self.data.reactions.list)]
-        f = variables[len(self.data.reactions.list) :]
+        a = variables[self.slices["ga"]]
+        f = variables[self.slices["g_formation"]]
         return a, f
 
-    def current_energies(self, *energies):
+    def current_energies(self, *energies, callback=None):
         """
         Computes and updates the current energies provided as input, processes them
         with thermodynamic calculations, and computes results through a defined
@@ -284,6 +1597,9 @@ class Fitter(Calculator):
         energies : tuple
             Variable length tuple representing the input energies that are
             processed and used for calculations within the method.
+        callback : callable, optional
+            Passed to the strategy solver, it is called after each potential
+            and can stop the sweep early.
 
         Returns
         -------
@@ -301,12 +1617,9 @@ class Fitter(Calculator):
             details of the error printed for debugging.
         """
         try:
-            ga, gf = self.unziper(energies)
-            # Update Kpy with thermodynamic values
-            self.Kpy.thermochemical_part = self.Kpy.thermochemical(
-                ga, gf, self.results.data.reactions.upsilon_a
-            )
-            self.results = self.strategy.solver()
+            # Update Kpy with the changed parts of the rate constants
+            self.apply_parameters(*energies)
+            self.results = self.strategy.solver(callback=callback)
             return self.results.j
 
         except AttributeError as e:
@@ -317,6 +1630,88 @@ class Fitter(Calculator):
             print(f"Unexpected error in current_energies: {e}")
             raise
 
+    def monitor(self, intermediate_result):
+        """
+        Callback of the differential evolution optimizer.
+
+        Stores the energies of the current population, used as threshold by the
+        bounded evaluation, saves a checkpoint every ``checkpoint_interval``
+        generations and displays the error evolution.
+
+        Parameters
+        ----------
+        intermediate_result : OptimizeResult
+            Intermediate state of the optimizer, with the attributes ``x``, ``fun``,
+            ``population``, ``population_energies`` and ``convergence``.
+        """
+        self.population_energies = np.copy(intermediate_result.population_energies)
+        self.generation += 1
+        if self.checkpoint is not None and self.generation % self.checkpoint_interval == 0:
+            self.save_checkpoint(intermediate_result)
+        self.display_error_evolution(
+            intermediate_result.x, intermediate_result.get("convergence", 0)
+        )
+
+    def save_checkpoint(self, intermediate_result):
+        """
+        Saves the state of the optimizer to the ``checkpoint`` file.
+
+        The file is first written to a temporary path and then moved over the previous
+        checkpoint, so an interruption while writing never leaves a corrupted file.
+
+        Parameters
+        ----------
+        intermediate_result : OptimizeResult
+            Intermediate state of the optimizer.
+        """
+        fname = str(self.checkpoint)
+        if not fname.endswith(".npz"):
+            fname += ".npz"
+        tmp = fname + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                population=intermediate_result.population,
+                population_energies=intermediate_result.population_energies,
+                x=intermediate_result.x,
+                fun=intermediate_result.fun,
+                error_evolution=np.array(self.error_evolution),
+                rng_state=json.dumps(self.rng.bit_generator.state),
+                stage=self.stage,
+                generation=self.generation,
+            )
+        os.replace(tmp, fname)
+
+    def resume(self, path):
+        """
+        Continues a fit from a checkpoint file.
+
+        The population, the state of the random number generator, the error evolution
+        and the position in the schedule are restored, then the optimizer runs the
+        remaining generations. The population energies are evaluated once more at the
+        start, since the optimizer does not accept them as input.
+
+        Parameters
+        ----------
+        path : str
+            Path of the ``.npz`` file written by `save_checkpoint`.
+
+        Returns
+        -------
+        OptimizeResult or None
+            The result of the resumed optimization, also stored in ``g_fit``.
+        """
+        self.writer.message(f"Resuming fit from checkpoint: {path}")
+        with np.load(path) as checkpoint:
+            population = checkpoint["population"]
+            self.error_evolution = checkpoint["error_evolution"].tolist()
+            self.rng.bit_generator.state = json.loads(str(checkpoint["rng_state"]))
+            stage = int(checkpoint["stage"])
+            generation = int(checkpoint["generation"])
+        self.g_fit = self.fit_energies(init=population, stage=stage, generation=generation)
+        self.set_fit()
+        return self.g_fit
+
     def display_error_evolution(self, xk, convergence=0):
         """
         Displays the error evolution graph during the optimization process.
@@ -377,9 +1772,7 @@ class Fitter(Calculator):
             A new Calculator instance initialized with the updated `Kpy` object
             and the mode set as 'Fitter'.
         """
-        # Update Kpy with thermodynamic and potential values
+        # Update Kpy with fitted parameters and potential values
         self.data.parameters.potential = new_potential
-        self.Kpy.thermochemical_part = self.Kpy.thermochemical(
-            self.ga_fit, self.gf_fit, self.results.data.reactions.upsilon_a
-        )
+        self.apply_parameters(self.g_fit.x)
         return Calculator(self.Kpy, "Fitter")
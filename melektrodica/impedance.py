@@ -0,0 +1,183 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Impedance class
+
+"""
+
+import numpy as np
+from .calculator import Calculator
+from .constants import F
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Impedance(Calculator):
+    """
+    Electrochemical impedance spectra of the kinetic model.
+
+    The transient equations :math:`\\mathbf{M}\\, d\\mathbf{x}/dt = \\mathbf{f}(\\mathbf{x}, \\eta)`
+    are linearized at each steady state. A sinusoidal perturbation of the potential,
+    :math:`\\delta\\eta\\, e^{j\\omega t}`, gives
+
+    .. math::
+
+        \\delta \\mathbf{x} = \\left(j\\omega \\mathbf{M} - \\frac{\\partial \\mathbf{f}}{\\partial \\mathbf{x}}
+            \\right)^{-1} \\frac{\\partial \\mathbf{f}}{\\partial \\eta} \\delta\\eta, \\quad
+        Y_F = \\frac{\\partial J}{\\partial \\eta} + \\frac{\\partial J}{\\partial \\mathbf{x}}
+            \\frac{\\delta \\mathbf{x}}{\\delta \\eta}
+
+    and the impedance of the electrode, with the double layer capacitance in parallel
+    and the ohmic resistance in series,
+
+    .. math::
+
+        Z(\\omega) = R_\\Omega + \\frac{1}{Y_F(\\omega) + j\\omega C_{dl}}
+
+    The linear systems of every frequency and potential are solved in one batched
+    call, so no time-domain simulation is needed. The admittance takes the sign of the
+    electrode, so the polarization resistance :math:`Z(0)` is positive for anodes and
+    cathodes.
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the analysis.
+    writer : Writer
+        Writer used for logging.
+    frequency : numpy.ndarray
+        Frequencies, in Hz.
+    omega : numpy.ndarray
+        Angular frequencies, in rad/s.
+    site_density : float
+        Density of active sites, in mol/cm2.
+    height : float or None
+        Volume of the reactor per unit of catalyst area, in cm, for a CSTR.
+    capacitance : float
+        Double layer capacitance, in F/cm2.
+    resistance : float
+        Ohmic resistance, in Ohm cm2.
+    admittance : numpy.ndarray
+        Faradaic admittance, of shape (n_potentials, n_frequencies).
+    faradaic : numpy.ndarray
+        Faradaic impedance, of shape (n_potentials, n_frequencies).
+    impedance : numpy.ndarray
+        Impedance of the electrode, of shape (n_potentials, n_frequencies).
+    """
+
+    def __init__(
+            self,
+            kpy,
+            frequency,
+            site_density=2.2e-9,
+            height=None,
+            capacitance=0.0,
+            resistance=0.0,
+            name=None,
+    ):
+        """
+        Solves the steady state and the impedance at every potential.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+        frequency : array_like
+            Frequencies, in Hz.
+        site_density : float, optional
+            Density of active sites, in mol/cm2. Default is 2.2e-9, about
+            :math:`1.3 \\times 10^{15}` sites/cm2.
+        height : float, optional
+            Volume of the reactor per unit of catalyst area, in cm, required for a CSTR.
+            Default is None.
+        capacitance : float, optional
+            Double layer capacitance, in F/cm2. Default is 0.0, Faradaic impedance only.
+        resistance : float, optional
+            Ohmic resistance, in Ohm cm2. Default is 0.0.
+        name : str, optional
+            Name identifier of the analysis. Default is 'melek'.
+
+        Raises
+        ------
+        ValueError
+            If the model is a CSTR and the height of the reactor is not given.
+        """
+        super().__init__(kpy, name)
+        self.writer.message(f"*** Impedance : {self.name}  ***")
+        self.site_density = site_density
+        self.height = height
+        self.capacitance = capacitance
+        self.resistance = resistance
+        self.linearize()
+        self.evaluate(frequency)
+
+    def linearize(self):
+        """
+        Derivatives of the transient equations and of the current density.
+
+        Returns
+        -------
+        Impedance
+            The instance, with the mass matrix ``mass``, the Jacobian ``dfdx`` and the
+            derivatives ``dfdeta``, ``djdx`` and ``djdeta`` at every potential.
+        """
+        strategy = self.strategy.linearize()
+        self.mass = strategy.mass_matrix(self.site_density, self.height)
+        dlnkf, dlnkb = strategy.potential_derivatives()
+        dnu = strategy.rates[:, 0] * dlnkf + strategy.rates[:, 1] * dlnkb
+        self.dfdx = strategy.dfdx
+        self.dfdeta = dnu @ self.reactions.upsilonx
+        self.djdx = F * np.einsum("r,nrk->nk", self.reactions.ne, strategy.dnudx)
+        self.djdeta = F * dnu @ self.reactions.ne
+        return self
+
+    def evaluate(self, frequency):
+        """
+        Computes the impedance spectra at every potential.
+
+        Parameters
+        ----------
+        frequency : array_like
+            Frequencies, in Hz.
+
+        Returns
+        -------
+        Impedance
+            The instance, with its attributes updated.
+        """
+        self.frequency = np.atleast_1d(np.asarray(frequency, dtype=float))
+        self.omega = 2 * np.pi * self.frequency
+        jw = 1j * self.omega[None, :, None, None]
+        A = jw * np.diag(self.mass) - self.dfdx[:, None]
+        b = np.broadcast_to(self.dfdeta[:, None, :, None], A.shape[:-1] + (1,))
+        dx = np.linalg.solve(A, b)[..., 0]
+        self.admittance = self.Kpy.electrode * (
+                self.djdeta[:, None] + np.einsum("nk,nwk->nw", self.djdx, dx)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.faradaic = 1 / self.admittance
+            self.impedance = self.resistance + 1 / (
+                    self.admittance + 1j * self.omega * self.capacitance
+            )
+        return self
+
+    def polarization_resistance(self):
+        """
+        Polarization resistance, the zero-frequency limit of the Faradaic impedance.
+
+        Returns
+        -------
+        numpy.ndarray
+            The polarization resistance at every potential, in Ohm cm2.
+        """
+        dx = np.linalg.solve(-self.dfdx, self.dfdeta[..., None])[..., 0]
+        admittance = self.djdeta + np.einsum("nk,nk->n", self.djdx, dx)
+        with np.errstate(divide="ignore"):
+            return 1 / (self.Kpy.electrode * admittance)
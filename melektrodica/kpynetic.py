@@ -397,6 +397,48 @@ class ReactionRate:
             ]
         )
 
+    def rate_jacobian(
+            self, k_rate: ndarray, concentration: ndarray, upsilon: ndarray
+    ) -> ndarray:
+        """
+        Calculates the derivatives of the reaction rates with respect to the concentrations.
+
+        .. math::
+
+            \\frac{\\partial \\nu_i}{\\partial c_j} =
+                \\overrightarrow{k_i} \\, a_{ij} \\, c_j^{a_{ij}-1} \\prod_{l \\neq j} c_l^{a_{il}}
+                -
+                \\overleftarrow{k_i} \\, b_{ij} \\, c_j^{b_{ij}-1} \\prod_{l \\neq j} c_l^{b_{il}}
+
+        where :math:`a_{ij} = -\\upsilon_{ij}` for :math:`\\upsilon_{ij}<0` and
+        :math:`b_{ij} = \\upsilon_{ij}` for :math:`\\upsilon_{ij}>0`. The products are
+        evaluated without dividing by the concentrations, so empty species are allowed.
+
+        Parameters
+        ----------
+        k_rate : numpy.ndarray
+            Forward and backward rate constants, of shape (2, n_reactions).
+        concentration : numpy.ndarray
+            Concentrations of every species, as returned by `concentrate`.
+        upsilon : numpy.ndarray
+            Stoichiometric coefficients of shape (n_reactions, n_species).
+
+        Returns
+        -------
+        numpy.ndarray
+            The derivatives, of shape (n_reactions, n_species).
+        """
+        shift = np.eye(len(concentration))
+
+        def partial(orders):
+            exponents = orders[:, None, :] - shift[None, :, :]
+            exponents = np.where(orders[:, :, None] > 0, exponents, 0)
+            return orders * np.prod(concentration ** exponents, axis=2)
+
+        forward = -upsilon * (upsilon < 0)
+        backward = upsilon * (upsilon > 0)
+        return k_rate[0][:, None] * partial(forward) - k_rate[1][:, None] * partial(backward)
+
 
 class Kpynetic(FreeEnergy, RateConstants, ReactionRate):
     """
@@ -500,17 +542,22 @@ class Kpynetic(FreeEnergy, RateConstants, ReactionRate):
             Free energy of formation for adsorbed species, derived if thermochemical data is used.
         dg_reaction : numpy.ndarray or None
             Free energy of reaction, derived from thermodynamic contributions if configured.
+        cache : dict
+            Exponential factors of the rate constants and the parts they were computed
+            from, see `rate_constants`.
         """
         self.data = copy.deepcopy(data)
         if writer is None:
             writer = Writer(
                 log_file="melektrodica.log", log_directory=self.data.directory
             )
+        self.writer = writer
         writer.message(f"*** Kpynetic :  ***")
 
         super().__init__(self.data)
         self.k_rate = None
         self.electronic_part = None
+        self.cache = dict.fromkeys(["static_key", "static", "electronic_key", "electronic"])
         self.data = data
         self.parameters = data.parameters
         self.species = data.species
@@ -593,20 +640,66 @@ class Kpynetic(FreeEnergy, RateConstants, ReactionRate):
         to determine the overall reaction rate `v`.
         """
 
-        eta = potential
-        self.electronic_part = self.electrode * RateConstants.electronic(
-            eta, self.reactions.ne, self.reactions.beta
-        )
-        self.k_rate = self.constant(
-            pre_exponential=self.pre_exp,
-            experimental=self.experimental_part,
-            thermochemical=self.thermochemical_part,
-            electronic=self.electronic_part,
-        )
+        self.k_rate = self.rate_constants(potential)
         self.nu = self.rate(
             self.k_rate, c_reactants, c_products, theta, self.reactions.upsilon
         )
 
+    def rate_constants(self, potential: float) -> ndarray:
+        """
+        Calculates the rate constants, reusing the exponentials of unchanged parts.
+
+        The rate constants are factorized as
+
+        .. math::
+
+            k = \\underbrace{A \\, k_{exp} \\exp\\left(\\frac{-\\Delta G_{thermo}}{k_BT}\\right)}_{\\textit{Static}}
+                \\underbrace{\\exp\\left(\\frac{-\\Delta G_{elec}}{k_BT}\\right)}_{\\textit{Electronic}}
+
+        The static factor is recomputed only when `pre_exp`, `experimental_part`,
+        `thermochemical_part` or the temperature change, and the electronic factor only
+        when the potential, the symmetry factors or the `electrode` sign change, so the
+        repeated evaluations of a nonlinear solve at one potential cost no exponentials.
+        Parts are compared by content, so they can be replaced or modified in place.
+
+        Parameters
+        ----------
+        potential : float
+            The applied potential of the electrode.
+
+        Returns
+        -------
+        numpy.ndarray
+            Forward and backward rate constants, of shape (2, n_reactions).
+        """
+        cache = self.cache
+        key = (
+            np.asarray(self.experimental_part, dtype=float).tobytes(),
+            np.asarray(self.thermochemical_part, dtype=float).tobytes(),
+            self.parameters.temperature,
+            self.pre_exp,
+        )
+        if cache["static_key"] != key:
+            cache["static_key"] = key
+            cache["static"] = self.constant(
+                pre_exponential=self.pre_exp,
+                experimental=self.experimental_part,
+                thermochemical=self.thermochemical_part,
+            )
+            cache["electronic_key"] = None
+        key = (
+            np.asarray(self.reactions.beta, dtype=float).tobytes(),
+            potential,
+            self.electrode,
+        )
+        if cache["electronic_key"] != key:
+            cache["electronic_key"] = key
+            self.electronic_part = self.electrode * RateConstants.electronic(
+                potential, self.reactions.ne, self.reactions.beta
+            )
+            cache["electronic"] = self.constant(electronic=self.electronic_part)
+        return cache["static"] * cache["electronic"]
+
     def get_argument(self, potential: float):
         """
         Calculates and assigns the electronic part using the specified potential and reactions'
@@ -636,6 +729,30 @@ class Kpynetic(FreeEnergy, RateConstants, ReactionRate):
         )
         return self.argument
 
+    def get_arguments(self, potentials) -> ndarray:
+        """
+        Arguments of the rate constants at many potentials in one call.
+
+        Unlike `get_argument`, the electronic parts of every potential are computed
+        together and the attributes of the model are left untouched.
+
+        Parameters
+        ----------
+        potentials : array_like
+            The applied potentials of the electrode.
+
+        Returns
+        -------
+        numpy.ndarray
+            The thermochemical and electronic parts of the forward and backward
+            arguments, of shape (n_potentials, 2, n_reactions).
+        """
+        potentials = np.atleast_1d(np.asarray(potentials, dtype=float))
+        electronic = self.electrode * RateConstants.electronic(
+            potentials[:, None], self.reactions.ne, self.reactions.beta
+        )
+        return self.thermochemical_part + np.moveaxis(electronic, 0, 1)
+
     def current(
             self,
             potential: float,
@@ -0,0 +1,202 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Pruner class
+
+"""
+
+import copy
+import numpy as np
+from .calculator import Calculator
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Pruner(Calculator):
+    """
+    Flux-based reduction of the mechanism.
+
+    From one steady-state sweep, the contribution of the reaction :math:`i` is its
+    largest share of the turnover of any species :math:`k`, electrons included, over
+    the potential window,
+
+    .. math::
+
+        r_i = \\max_{\\eta, k} \\frac{|\\upsilon_{ik} \\nu_i(\\eta)|}
+                                     {\\sum_j |\\upsilon_{jk} \\nu_j(\\eta)|}
+
+    so a reaction is kept if it is a relevant route of formation or consumption of
+    any species, including a minor product. The reactions below the tolerance are
+    removed, together with the adsorbed species that no remaining reaction involves,
+    and the reduced model is solved to report its error in the current density. The
+    contribution of each intermediate is its turnover relative to the electron
+    turnover,
+
+    .. math::
+
+        s_k = \\max_{\\eta} \\frac{\\sum_i |\\upsilon_{ik} \\nu_i(\\eta)|}
+                                  {\\sum_i |n_i \\nu_i(\\eta)|}
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the analysis.
+    writer : Writer
+        Writer used for logging.
+    contribution : numpy.ndarray
+        Contribution :math:`r_i` of each reaction.
+    intermediates : numpy.ndarray
+        Contribution :math:`s_k` of each adsorbed species.
+    tolerance : float
+        Smallest contribution of a kept reaction.
+    kept : numpy.ndarray
+        Mask of the kept reactions.
+    adsorbed : numpy.ndarray
+        Mask of the kept adsorbed species.
+    model : Kpynetic
+        Reduced kinetic model.
+    reduced : BaseConcentration
+        Steady state of the reduced model.
+    error : numpy.ndarray
+        Error of the current density of the reduced model at each potential, relative
+        to the largest current density of the full model.
+    """
+
+    def __init__(self, kpy, tolerance=1e-3, name=None):
+        """
+        Ranks the reactions and intermediates and reduces the mechanism.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+        tolerance : float, optional
+            Smallest contribution of a kept reaction. Default is 1e-3.
+        name : str, optional
+            Name identifier of the analysis. Default is 'melek'.
+        """
+        super().__init__(kpy, name)
+        self.writer.message(f"*** Pruner : {self.name}  ***")
+        self.evaluate()
+        self.prune(tolerance)
+
+    def evaluate(self):
+        """
+        Computes the contributions of the reactions and intermediates from the
+        net rates of the sweep.
+
+        Returns
+        -------
+        Pruner
+            The instance, with its attributes updated.
+        """
+        nu = self.results.nu[: self.results.n_solved]
+        upsilon = np.column_stack([self.reactions.upsilon_c, self.reactions.ne])
+        flux = np.abs(upsilon * nu[:, :, None])
+        total = flux.sum(axis=1, keepdims=True)
+        share = np.divide(flux, total, out=np.zeros_like(flux), where=total > 0)
+        self.contribution = share.max(axis=(0, 2))
+
+        turnover = total[:, 0, :]
+        electrons = turnover[:, -1:]
+        n_adsorbed = len(self.species.adsorbed)
+        relative = np.divide(
+            turnover[:, -1 - n_adsorbed:-1],
+            electrons,
+            out=np.zeros((len(nu), n_adsorbed)),
+            where=electrons > 0,
+        )
+        self.intermediates = relative.max(axis=0)
+        return self
+
+    def prune(self, tolerance):
+        """
+        Reduces the mechanism to the reactions above a tolerance and solves it.
+
+        Parameters
+        ----------
+        tolerance : float
+            Smallest contribution of a kept reaction.
+
+        Returns
+        -------
+        Pruner
+            The instance, with the reduced model and its error.
+        """
+        self.tolerance = tolerance
+        self.kept = self.contribution >= tolerance
+        self.adsorbed = np.any(self.reactions.upsilon_a[self.kept] != 0, axis=0)
+        self.model = self.reduce_model(self.kept, self.adsorbed)
+        self.reduced = type(self.strategy)(self.model).solver()
+        j = self.results.j[: self.results.n_solved]
+        self.error = np.abs(self.reduced.j[: len(j)] - j) / np.max(np.abs(j))
+        self.writer.message(
+            f"Pruner: {np.sum(~self.kept)} of {len(self.kept)} reactions and "
+            f"{np.sum(~self.adsorbed)} of {len(self.adsorbed)} intermediates removed, "
+            f"largest relative current error {np.max(self.error):.3e}"
+        )
+        return self
+
+    def reduce_model(self, reactions, adsorbed):
+        """
+        Kinetic model restricted to some reactions and adsorbed species.
+
+        The parts of the rate constants are taken from the model, so parameters
+        replaced after its construction, for instance by a `Fitter`, are kept.
+
+        Parameters
+        ----------
+        reactions : numpy.ndarray
+            Mask of the kept reactions.
+        adsorbed : numpy.ndarray
+            Mask of the kept adsorbed species.
+
+        Returns
+        -------
+        Kpynetic
+            The reduced kinetic model.
+        """
+        removed = np.array(self.species.adsorbed)[~adsorbed]
+        columns = ~np.isin(self.species.list[:-1], removed)
+        kpy = copy.deepcopy(self.Kpy)
+        kpy.species = kpy.data.species = self.species.subset(adsorbed)
+        kpy.reactions = kpy.data.reactions = self.reactions.subset(reactions, columns)
+        kpy.experimental_part = self.Kpy.experimental_part[:, reactions]
+        kpy.thermochemical_part = self.Kpy.thermochemical_part[:, reactions]
+        if self.operation.thermochemical:
+            kpy.g_activation = self.Kpy.g_activation[reactions]
+            kpy.g_formation = self.Kpy.g_formation[adsorbed]
+            kpy.dg_reaction = self.Kpy.dg_reaction[reactions]
+        kpy.k_rate = None
+        kpy.cache = dict.fromkeys(kpy.cache)
+        return kpy
+
+    def report(self):
+        """
+        Writes the contributions of the reactions and intermediates.
+
+        Returns
+        -------
+        str
+            The report, reactions and intermediates by decreasing contribution.
+        """
+        lines = [f"{'Reaction':<12}{'Contribution':>14}{'Kept':>6}"]
+        for i in np.argsort(-self.contribution):
+            lines.append(
+                f"{self.reactions.list[i]:<12}{self.contribution[i]:>14.4e}"
+                f"{'yes' if self.kept[i] else 'no':>6}"
+            )
+        lines.append(f"{'Intermediate':<12}{'Contribution':>14}{'Kept':>6}")
+        for k in np.argsort(-self.intermediates):
+            lines.append(
+                f"{self.species.adsorbed[k]:<12}{self.intermediates[k]:>14.4e}"
+                f"{'yes' if self.adsorbed[k] else 'no':>6}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,416 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Sampler class
+
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import minimize
+from .fitter import WORKER, initialize_worker
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+def residuals(x):
+    """
+    Residual vector of the fitter for a set of energies.
+
+    The residuals are those of `Fitter.residual_vector`, whose sum of squares is the
+    objective function of the `Fitter`, for the fitter stored in `WORKER` by
+    `initialize_worker`.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Energies evaluated.
+
+    Returns
+    -------
+    numpy.ndarray
+        The residuals, infinite if the model could not be solved.
+    """
+    fitter = WORKER["fitter"]
+    try:
+        return fitter.residual_vector(x)
+    except Exception:
+        return np.full(len(fitter.j_data[fitter.grid]), np.inf)
+
+
+def weighted_error(x, weights):
+    """
+    Sum of weighted squared residuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Energies evaluated.
+    weights : numpy.ndarray
+        Weight of each residual.
+
+    Returns
+    -------
+    float
+        The weighted error, infinite if the model could not be solved.
+    """
+    r = residuals(x)
+    if not np.all(np.isfinite(r)):
+        return np.inf
+    return float(np.sum(weights * r ** 2))
+
+
+def bootstrap_refit(weights, x0, lb, ub):
+    """
+    Refits the energies to a bootstrap replicate of the data.
+
+    The replicate is represented by the multiplicity of each point in the resampled
+    data, so duplicated potentials are never solved twice. The local optimizer is
+    warm-started from the point estimate.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        Number of times each point was drawn.
+    x0 : numpy.ndarray
+        Point estimate of the energies.
+    lb : numpy.ndarray
+        Lower bounds of the energies.
+    ub : numpy.ndarray
+        Upper bounds of the energies.
+
+    Returns
+    -------
+    numpy.ndarray
+        The refitted energies.
+    """
+    result = minimize(
+        weighted_error,
+        x0,
+        args=(weights,),
+        method="L-BFGS-B",
+        bounds=list(zip(lb, ub)),
+    )
+    return result.x
+
+
+def log_probability(x, variance, lb, ub):
+    """
+    Logarithm of the posterior probability of a set of energies.
+
+    A uniform prior over the bounds and a Gaussian likelihood of the residuals are
+    assumed,
+
+    .. math::
+
+        \\ln p(\\mathbf{p}) = -\\frac{f(\\mathbf{p})}{2 s^2}, \\quad \\mathbf{p} \\in [\\mathbf{lb}, \\mathbf{ub}]
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Energies evaluated.
+    variance : float
+        Variance :math:`s^2` of the residuals.
+    lb : numpy.ndarray
+        Lower bounds of the energies.
+    ub : numpy.ndarray
+        Upper bounds of the energies.
+
+    Returns
+    -------
+    float
+        The log-probability, minus infinity outside the bounds.
+    """
+    if np.any(x < lb) or np.any(x > ub):
+        return -np.inf
+    r = residuals(x)
+    if not np.all(np.isfinite(r)):
+        return -np.inf
+    return -0.5 * float(np.sum(r ** 2)) / variance
+
+
+class Sampler:
+    """
+    Uncertainty quantification of the energies fitted by a `Fitter`.
+
+    Two samplers of the distribution of the energies around the point estimate
+    ``g_fit.x`` are provided:
+
+    - `bootstrap`: the data are resampled with replacement and the energies refitted
+      with a local optimizer started at the point estimate :cite:p:`Efron1993`.
+    - `mcmc`: an affine-invariant ensemble sampler with stretch moves
+      :cite:p:`Goodman2010` explores the posterior defined by the objective function.
+
+    Independent refits and half-ensemble updates run in a process pool, and the
+    samples are streamed to ``.npy`` files opened as memory maps, so the memory used
+    does not grow with the number of samples.
+
+    Attributes
+    ----------
+    fitter : Fitter
+        The fitter whose objective function is sampled.
+    workers : int
+        Number of processes.
+    writer : Writer
+        Writer used for logging.
+    x_fit : numpy.ndarray
+        Point estimate of the energies.
+    lb : numpy.ndarray
+        Lower bounds of the energies.
+    ub : numpy.ndarray
+        Upper bounds of the energies.
+    """
+
+    def __init__(self, fitter, workers=1):
+        """
+        Initializes the sampler from a fitted `Fitter`.
+
+        Parameters
+        ----------
+        fitter : Fitter
+            A fitter after the optimization, with its result in ``g_fit``.
+        workers : int, optional
+            Number of processes. Default is 1, serial sampling.
+        """
+        self.writer = fitter.writer
+        self.writer.message(f"*** Sampler : {fitter.name}  ***")
+        self.fitter = fitter
+        self.workers = max(int(workers), 1)
+        self.x_fit = np.array(fitter.g_fit.x, dtype=float)
+        self.lb = np.array(fitter.bounds.lb, dtype=float)
+        self.ub = np.array(fitter.bounds.ub, dtype=float)
+
+    def executor(self):
+        """
+        Creates the process pool, or None for serial sampling.
+
+        In serial mode the fitter is registered in the current process.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The pool, each worker holding its own copy of the fitter.
+        """
+        if self.workers == 1:
+            initialize_worker({"fitter": self.fitter})
+            return None
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=initialize_worker,
+            initargs=({"fitter": self.fitter},),
+        )
+
+    @staticmethod
+    def mapper(executor, function, *iterables):
+        """
+        Maps a function over the iterables, in the pool if available.
+
+        Parameters
+        ----------
+        executor : ProcessPoolExecutor or None
+            The pool.
+        function : callable
+            Function defined at module level.
+        iterables : iterable
+            Arguments of the function.
+
+        Returns
+        -------
+        list
+            The results, in the order of the arguments.
+        """
+        if executor is None:
+            return list(map(function, *iterables))
+        return list(executor.map(function, *iterables))
+
+    def bootstrap(self, n_samples, fname, seed=None):
+        """
+        Bootstrap distribution of the fitted energies.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of bootstrap replicates.
+        fname : str
+            Path of the ``.npy`` file where the refitted energies are streamed.
+        seed : int, optional
+            Seed of the resampling. Default is None.
+
+        Returns
+        -------
+        numpy.memmap
+            The refitted energies, of shape (n_samples, d).
+        """
+        rng = np.random.default_rng(seed)
+        initialize_worker({"fitter": self.fitter})
+        n_points = len(residuals(self.x_fit))
+        d = len(self.x_fit)
+        samples = np.lib.format.open_memmap(
+            fname, mode="w+", dtype=float, shape=(n_samples, d)
+        )
+        self.writer.message(f"Bootstrap: {n_samples} replicates of {n_points} points")
+
+        block = 4 * self.workers
+        executor = self.executor()
+        try:
+            for start in range(0, n_samples, block):
+                size = min(block, n_samples - start)
+                weights = [
+                    np.bincount(rng.integers(n_points, size=n_points), minlength=n_points)
+                    for _ in range(size)
+                ]
+                samples[start: start + size] = self.mapper(
+                    executor,
+                    bootstrap_refit,
+                    weights,
+                    [self.x_fit] * size,
+                    [self.lb] * size,
+                    [self.ub] * size,
+                )
+                samples.flush()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return samples
+
+    def mcmc(self, n_steps, fname, n_walkers=None, variance=None, stretch=2.0, seed=None):
+        """
+        Affine-invariant ensemble sampling of the posterior of the energies.
+
+        The walkers start in a small ball around the point estimate. Each step splits
+        the ensemble in two halves; every walker :math:`X_k` of one half proposes
+
+        .. math::
+
+            Y = X_j + z (X_k - X_j), \\quad g(z) \\propto \\frac{1}{\\sqrt{z}},
+            \\; z \\in \\left[\\frac{1}{a}, a\\right]
+
+        with :math:`X_j` drawn from the other half, and accepts it with probability
+        :math:`\\min\\left(1, z^{d-1} p(Y)/p(X_k)\\right)`. The proposals of a half are
+        independent, so they are evaluated in parallel.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of steps of the ensemble.
+        fname : str
+            Path of the ``.npy`` file where the chain is streamed. The log-probabilities
+            are streamed to the same path with the suffix ``_logp``.
+        n_walkers : int, optional
+            Number of walkers, even and at least ``2 d``. Default is ``2 d + 2``.
+        variance : float, optional
+            Variance of the residuals. Default is the residual variance at the point
+            estimate, :math:`f(\\hat{\\mathbf{p}})/(N - d)`.
+        stretch : float, optional
+            Scale parameter :math:`a` of the stretch move. Default is 2.0.
+        seed : int, optional
+            Seed of the sampler. Default is None.
+
+        Returns
+        -------
+        numpy.memmap
+            The chain, of shape (n_steps, n_walkers, d). The acceptance fraction of
+            each walker is stored in ``acceptance``.
+        """
+        rng = np.random.default_rng(seed)
+        initialize_worker({"fitter": self.fitter})
+        d = len(self.x_fit)
+        if n_walkers is None:
+            n_walkers = 2 * d + 2
+        n_walkers = max(n_walkers + n_walkers % 2, 2 * d)
+        if variance is None:
+            r = residuals(self.x_fit)
+            variance = np.sum(r ** 2) / max(len(r) - d, 1)
+
+        chain = np.lib.format.open_memmap(
+            fname, mode="w+", dtype=float, shape=(n_steps, n_walkers, d)
+        )
+        logp_name = fname[:-4] + "_logp.npy" if fname.endswith(".npy") else fname + "_logp"
+        log_prob = np.lib.format.open_memmap(
+            logp_name, mode="w+", dtype=float, shape=(n_steps, n_walkers)
+        )
+        self.writer.message(f"MCMC: {n_walkers} walkers, {n_steps} steps")
+
+        width = self.ub - self.lb
+        walkers = self.x_fit + 1e-3 * width * rng.standard_normal((n_walkers, d))
+        walkers = np.clip(walkers, self.lb, self.ub)
+        half = n_walkers // 2
+        accepted = np.zeros(n_walkers)
+
+        executor = self.executor()
+        try:
+            logp = np.array(
+                self.mapper(
+                    executor,
+                    log_probability,
+                    walkers,
+                    [variance] * n_walkers,
+                    [self.lb] * n_walkers,
+                    [self.ub] * n_walkers,
+                )
+            )
+            for step in range(n_steps):
+                for active, complement in [
+                    (np.arange(half), np.arange(half, n_walkers)),
+                    (np.arange(half, n_walkers), np.arange(half)),
+                ]:
+                    z = ((stretch - 1) * rng.random(half) + 1) ** 2 / stretch
+                    partners = walkers[rng.choice(complement, size=half)]
+                    proposals = partners + z[:, None] * (walkers[active] - partners)
+                    logp_new = np.array(
+                        self.mapper(
+                            executor,
+                            log_probability,
+                            proposals,
+                            [variance] * half,
+                            [self.lb] * half,
+                            [self.ub] * half,
+                        )
+                    )
+                    log_ratio = (d - 1) * np.log(z) + logp_new - logp[active]
+                    accept = np.log(rng.random(half)) < log_ratio
+                    walkers[active[accept]] = proposals[accept]
+                    logp[active[accept]] = logp_new[accept]
+                    accepted[active[accept]] += 1
+                chain[step] = walkers
+                log_prob[step] = logp
+            chain.flush()
+            log_prob.flush()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.acceptance = accepted / max(n_steps, 1)
+        return chain
+
+    @staticmethod
+    def intervals(samples, level=0.95, burn=0):
+        """
+        Equal-tailed confidence intervals of the sampled energies.
+
+        Parameters
+        ----------
+        samples : numpy.ndarray
+            Bootstrap samples of shape (n, d) or a chain of shape (n_steps, n_walkers, d).
+        level : float, optional
+            Confidence level. Default is 0.95.
+        burn : int, optional
+            Number of initial samples or steps discarded. Default is 0.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The median, lower and upper limits of each energy.
+        """
+        samples = np.asarray(samples)[burn:]
+        samples = samples.reshape(-1, samples.shape[-1])
+        samples = samples[np.all(np.isfinite(samples), axis=1)]
+        tail = 50 * (1 - level)
+        lower, median, upper = np.percentile(samples, [tail, 50, 100 - tail], axis=0)
+        return median, lower, upper
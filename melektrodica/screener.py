@@ -0,0 +1,170 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Screener class
+
+"""
+
+import numpy as np
+from .coordinator import Coordinator
+from .kpynetic import FreeEnergy
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Screener:
+    """
+    Thermodynamic screening of candidate catalysts by their limiting potentials.
+
+    Only the formation energies of the adsorbed species enter, as in the computational
+    hydrogen electrode approach. The free energy of the step :math:`i` at the potential
+    :math:`\\eta` is
+
+    .. math::
+
+        \\Delta G_i(\\eta) = -\\Delta G^\\circ_{r,i} - c_i \\eta, \\quad c_i = \\pm n_i
+
+    with :math:`\\Delta G^\\circ_{r,i}` from `FreeEnergy.reaction` and the sign of the
+    electrode in :math:`c_i`. The limiting potential of a pathway is the lowest
+    potential at which all its electrochemical steps are downhill, and its
+    overpotential is measured from the equilibrium potential of the pathway,
+
+    .. math::
+
+        \\eta_L = \\max_{i,\\, c_i > 0} \\frac{-\\Delta G^\\circ_{r,i}}{c_i}, \\quad
+        \\eta_{eq} = \\frac{-\\sum_i \\sigma_i \\Delta G^\\circ_{r,i}}{\\sum_i \\sigma_i c_i}, \\quad
+        \\eta_{TD} = \\eta_L - \\eta_{eq}
+
+    A negative overpotential means that an uphill chemical step, see ``chemical``,
+    limits the pathway instead of the potential. Every pathway of every set of
+    formation energies is evaluated in one vectorized operation, so large libraries
+    of materials can be triaged before any microkinetic model is solved.
+
+    Attributes
+    ----------
+    Kpy : Kpynetic
+        Kinetic model of the mechanism.
+    paths : list of list of str
+        Species of each pathway.
+    pathways : list of list of str
+        Reactions of each pathway.
+    sigma : numpy.ndarray
+        Stoichiometric numbers of the pathways, of shape (n_paths, n_reactions).
+    limiting_potential : numpy.ndarray
+        Limiting potential, of shape (n_materials, n_paths).
+    equilibrium : numpy.ndarray
+        Equilibrium potential, of shape (n_materials, n_paths).
+    overpotential : numpy.ndarray
+        Thermodynamic overpotential, of shape (n_materials, n_paths).
+    determining : numpy.ndarray
+        Position in the mechanism of the potential-determining step, of shape
+        (n_materials, n_paths).
+    chemical : numpy.ndarray
+        Largest free energy of the chemical steps, which no potential can drive, of
+        shape (n_materials, n_paths).
+    """
+
+    def __init__(self, kpy, source, target, k=None, max_length=None):
+        """
+        Enumerates the pathways of the mechanism from the source to the target.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+        source : str
+            Initial species.
+        target : str
+            Final species.
+        k : int, optional
+            Number of shortest pathways, see `Coordinator.shortest_paths`. Default is
+            None, every pathway.
+        max_length : int, optional
+            Largest number of reactions of a pathway. Default is None.
+        """
+        coordinator = Coordinator(kpy)
+        self.Kpy = coordinator.Kpy
+        self.paths, self.pathways = coordinator.shortest_paths(
+            source, target, k, max_length=max_length
+        )
+        self.sigma = coordinator.pathway_sigma(self.paths, self.pathways)
+
+    def evaluate(self, g_formation, block=4096):
+        """
+        Computes the limiting potentials of every pathway for a batch of materials.
+
+        Parameters
+        ----------
+        g_formation : array_like
+            Formation energies of the adsorbed species, of shape (n_adsorbed,) or
+            (n_materials, n_adsorbed), in eV.
+        block : int, optional
+            Number of materials evaluated together, which bounds the memory used.
+            Default is 4096.
+
+        Returns
+        -------
+        Screener
+            The instance, with its attributes updated.
+        """
+        g_formation = np.atleast_2d(np.asarray(g_formation, dtype=float))
+        reactions = self.Kpy.reactions
+        dg = -FreeEnergy.reaction(reactions.upsilon_a, g_formation.T).T
+        charge = self.Kpy.electrode * reactions.ne
+        member = self.sigma != 0
+        electrochemical = member & (charge > 0)
+        chemical = member & (reactions.ne == 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            onset = dg / charge
+
+        n_materials, n_paths = len(g_formation), len(self.sigma)
+        self.limiting_potential = np.empty((n_materials, n_paths))
+        self.determining = np.empty((n_materials, n_paths), dtype=int)
+        self.chemical = np.empty((n_materials, n_paths))
+        for start in range(0, n_materials, block):
+            rows = slice(start, start + block)
+            masked = np.where(electrochemical, onset[rows, None, :], -np.inf)
+            self.determining[rows] = np.argmax(masked, axis=-1)
+            self.limiting_potential[rows] = np.max(masked, axis=-1)
+            self.chemical[rows] = np.max(
+                np.where(chemical, dg[rows, None, :], -np.inf), axis=-1
+            )
+        self.limiting_potential[:, ~electrochemical.any(axis=1)] = np.nan
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.equilibrium = (dg @ self.sigma.T) / (self.sigma @ charge)
+        self.overpotential = self.limiting_potential - self.equilibrium
+        return self
+
+    def report(self, material=0):
+        """
+        Writes the screening descriptors of the pathways of one material.
+
+        Parameters
+        ----------
+        material : int, optional
+            Position of the material in the last batch. Default is 0.
+
+        Returns
+        -------
+        str
+            The report, one row per pathway.
+        """
+        header = f"{'Pathway':<24}{'U_L':>10}{'U_eq':>10}{'eta_TD':>10}{'PDS':>8}"
+        lines = [header]
+        for p, reactions in enumerate(self.pathways):
+            step = self.Kpy.reactions.list[self.determining[material, p]]
+            lines.append(
+                f"{'-'.join(reactions):<24}"
+                f"{self.limiting_potential[material, p]:>10.4f}"
+                f"{self.equilibrium[material, p]:>10.4f}"
+                f"{self.overpotential[material, p]:>10.4f}"
+                f"{step:>8}"
+            )
+        return "\n".join(lines)
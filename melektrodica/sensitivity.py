@@ -0,0 +1,353 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Sensitivity class
+
+"""
+
+import copy
+import itertools
+import numpy as np
+from scipy.optimize import minimize
+from .calculator import Calculator
+from .fitter import Parameterization
+from .writer import Writer
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Sensitivity(Parameterization, Calculator):
+    """
+    Practical identifiability analysis of the kinetic parameters.
+
+    The sensitivity matrix of the residuals of the `Fitter` objective function,
+
+    .. math::
+
+        S_{kp} = \\frac{\\partial r_k}{\\partial p}, \\quad
+        r_k = \\frac{J_{\\text{exp},k} - |J_{\\text{model},k}(\\mathbf{p})|}{\\sqrt{J_{\\text{exp},k}}}
+
+    is obtained for every experimental point and parameter from a single steady-state
+    sweep, by the analytic linearization of the steady state, instead of one perturbed
+    sweep per parameter. From it the Fisher information matrix
+    :math:`\\mathbf{FIM} = \\mathbf{S}^T\\mathbf{S}/\\sigma^2`, its eigen-decomposition, the
+    sensitivity measures :math:`\\delta^{msqr}_p = \\lVert \\mathbf{S}_{:,p} \\rVert / \\sqrt{N}`
+    and the collinearity indices of subsets of parameters :cite:p:`Brun2001` are
+    computed. Profile likelihoods :cite:p:`Raue2009` are computed on demand.
+
+    Parameters that cannot be identified can be frozen in the `Fitter`, see
+    `unidentifiable`.
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the analysis.
+    writer : Writer
+        Writer used for logging.
+    potential_data : numpy.ndarray
+        Experimental potentials.
+    j_data : numpy.ndarray
+        Magnitude of the experimental current densities, compared with that of the
+        model, as in the `Fitter`.
+    variance : float
+        Variance :math:`\\sigma^2` of the residuals.
+    x : numpy.ndarray
+        Parameters where the analysis is evaluated.
+    r : numpy.ndarray
+        Residuals at the parameters.
+    S : numpy.ndarray
+        Sensitivity matrix of the residuals, of shape (n_points, n_parameters).
+    fisher : numpy.ndarray
+        Fisher information matrix.
+    eigenvalues : numpy.ndarray
+        Eigenvalues of the Fisher information matrix, in ascending order.
+    eigenvectors : numpy.ndarray
+        Eigenvectors of the Fisher information matrix, as columns.
+    delta : numpy.ndarray
+        Sensitivity measure of each parameter.
+    """
+
+    def __init__(
+            self,
+            kpy,
+            potential_data,
+            j_data,
+            parameters=("ga", "g_formation"),
+            frozen=None,
+            variance=1.0,
+            name=None,
+    ):
+        """
+        Evaluates the sensitivities at the parameters of the kinetic model.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model, whose parameters are analyzed.
+        potential_data : array_like
+            Experimental potentials.
+        j_data : array_like
+            Experimental current densities.
+        parameters : sequence of str, optional
+            Groups of analyzed parameters, see `Fitter`. Default is
+            ``('ga', 'g_formation')``.
+        frozen : sequence of str, optional
+            Labels of parameters excluded from the analysis. Default is None.
+        variance : float, optional
+            Variance of the residuals. Default is 1.0, the Fisher information is then
+            the Gauss-Newton Hessian of half the objective function.
+        name : str, optional
+            Name identifier of the analysis. Default is 'melek'.
+
+        Raises
+        ------
+        ValueError
+            If the parameters are not valid for the model, see `set_parameters`.
+        """
+        if name is None:
+            self.name = "melek"
+        else:
+            self.name = name
+
+        self.writer = Writer()
+        self.writer.message(f"*** Sensitivity : {self.name}  ***")
+
+        self.potential_data = np.array(potential_data, dtype=float)
+        self.j_data = np.abs(np.array(j_data, dtype=float))
+        self.variance = variance
+        self.Kpy = copy.deepcopy(kpy)
+        self.data = self.Kpy.data
+        self.data.parameters.potential = self.potential_data
+        super().__init__(self.Kpy, self.name)
+        self.set_parameters(parameters, frozen)
+        self.x = self.p_all[self.index]
+        self.evaluate()
+
+    def evaluate(self):
+        """
+        Computes the sensitivity matrix and the identifiability measures at ``x``.
+
+        The derivatives of the current density follow from one batched linear solve
+        over every potential and parameter, see `BaseConcentration.sensitivity`.
+
+        Returns
+        -------
+        Sensitivity
+            The instance, with its attributes updated.
+        """
+        self.results = self.strategy.linearize()
+        dlnkf, dlnkb = self.rate_derivatives(self.operation.potential)
+        dj = self.strategy.current_sensitivity(dlnkf, dlnkb)
+        j = self.results.j
+        scale = np.sqrt(self.j_data)
+        self.r = (self.j_data - np.abs(j)) / scale
+        self.S = -np.sign(j)[:, None] * dj / scale[:, None]
+
+        self.fisher = self.S.T @ self.S / self.variance
+        self.eigenvalues, self.eigenvectors = np.linalg.eigh(self.fisher)
+        self.delta = np.sqrt(np.mean(self.S ** 2, axis=0))
+        return self
+
+    def collinearity(self, subset):
+        """
+        Collinearity index of a subset of parameters.
+
+        .. math::
+
+            \\gamma_K = \\frac{1}{\\sqrt{\\lambda_{min}\\left(\\tilde{\\mathbf{S}}_K^T
+                        \\tilde{\\mathbf{S}}_K\\right)}}
+
+        where :math:`\\tilde{\\mathbf{S}}_K` holds the columns of the subset normalized to
+        unit length. Values above 10 to 20 indicate that a change of one parameter can
+        be compensated by the others.
+
+        Parameters
+        ----------
+        subset : sequence of str or int
+            Labels or positions of the parameters.
+
+        Returns
+        -------
+        float
+            The collinearity index, infinite for a parameter without sensitivity.
+        """
+        columns = [self.names.index(p) if isinstance(p, str) else p for p in subset]
+        S = self.S[:, columns]
+        norms = np.linalg.norm(S, axis=0)
+        if np.any(norms == 0):
+            return np.inf
+        S = S / norms
+        smallest = np.linalg.eigvalsh(S.T @ S)[0]
+        return 1 / np.sqrt(smallest) if smallest > 0 else np.inf
+
+    def collinearity_indices(self, size=2):
+        """
+        Collinearity indices of every subset of parameters of a given size.
+
+        Parameters
+        ----------
+        size : int, optional
+            Number of parameters of the subsets. Default is 2.
+
+        Returns
+        -------
+        dict
+            The collinearity index of each subset, keyed by the tuple of labels.
+        """
+        return {
+            subset: self.collinearity(subset)
+            for subset in itertools.combinations(self.names, size)
+        }
+
+    def identifiable(self, threshold=1e-3, max_collinearity=20.0):
+        """
+        Selects a set of identifiable parameters.
+
+        The parameters are ranked by their sensitivity measure, and each one is kept if
+        its measure is above ``threshold`` times the largest one and the collinearity
+        index of the kept set stays below ``max_collinearity``.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            Relative sensitivity below which a parameter is not identifiable.
+            Default is 1e-3.
+        max_collinearity : float, optional
+            Largest collinearity index of the identifiable set. Default is 20.
+
+        Returns
+        -------
+        list of str
+            Labels of the identifiable parameters, by decreasing sensitivity.
+        """
+        selected = []
+        for p in np.argsort(-self.delta):
+            if self.delta[p] <= threshold * np.max(self.delta):
+                break
+            if self.collinearity(selected + [p]) <= max_collinearity:
+                selected.append(p)
+        return [self.names[p] for p in selected]
+
+    def unidentifiable(self, threshold=1e-3, max_collinearity=20.0):
+        """
+        Labels of the parameters that the data cannot constrain.
+
+        The labels can be passed as ``frozen`` to the `Fitter`, which then holds them at
+        their current values and searches a smaller space.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            Relative sensitivity below which a parameter is not identifiable.
+            Default is 1e-3.
+        max_collinearity : float, optional
+            Largest collinearity index of the identifiable set. Default is 20.
+
+        Returns
+        -------
+        list of str
+            Labels of the remaining parameters.
+        """
+        identifiable = self.identifiable(threshold, max_collinearity)
+        return [name for name in self.names if name not in identifiable]
+
+    def report(self):
+        """
+        Writes the identifiability report.
+
+        For each parameter the value, the sensitivity measure and the standard error
+        from the pseudo-inverse of the Fisher information matrix are listed, followed
+        by the eigenvalues and the collinearity index of the whole set.
+
+        Returns
+        -------
+        str
+            The report.
+        """
+        covariance = np.linalg.pinv(self.fisher)
+        error = np.sqrt(np.maximum(np.diag(covariance), 0))
+        lines = [f"{'Parameter':<20}{'Value':>12}{'Sensitivity':>14}{'Std. error':>14}"]
+        for name, value, delta, std in zip(self.names, self.x, self.delta, error):
+            lines.append(f"{name:<20}{value:>12.4g}{delta:>14.4g}{std:>14.4g}")
+        lines.append(f"FIM eigenvalues: {np.array2string(self.eigenvalues, precision=3)}")
+        lines.append(f"Collinearity index: {self.collinearity(self.names):.4g}")
+        lines.append(f"Identifiable: {self.identifiable()}")
+        report = "\n".join(lines)
+        self.writer.message(report)
+        return report
+
+    def objective(self, x):
+        """
+        Objective function of the `Fitter` at a parameter vector.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Parameters evaluated.
+
+        Returns
+        -------
+        float
+            Sum of the squared residuals, infinite if the model could not be solved.
+        """
+        try:
+            self.apply_parameters(x)
+            j = self.strategy.solver().j
+            return float(np.sum((self.j_data - np.abs(j)) ** 2 / self.j_data))
+        except Exception:
+            return np.inf
+
+    def profile(self, parameter, values=None, n_points=11):
+        """
+        Profile likelihood of a parameter.
+
+        The parameter is fixed at each value and the objective function is minimized
+        with respect to the others, starting from the previous point of the profile. A
+        flat profile means that the parameter is not identifiable :cite:p:`Raue2009`.
+        The model is restored and solved at the analyzed parameters ``x`` afterwards,
+        so `evaluate` linearizes the analyzed steady state.
+
+        Parameters
+        ----------
+        parameter : str or int
+            Label or position of the profiled parameter.
+        values : array_like, optional
+            Values of the parameter. Default is ``n_points`` values spanning its bounds.
+        n_points : int, optional
+            Number of values when ``values`` is not given. Default is 11.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The values of the parameter and the minimized objective function.
+        """
+        p = self.names.index(parameter) if isinstance(parameter, str) else parameter
+        if values is None:
+            values = np.linspace(self.bounds.lb[p], self.bounds.ub[p], n_points)
+        values = np.asarray(values, dtype=float)
+        others = np.delete(np.arange(len(self.x)), p)
+        limits = list(zip(self.bounds.lb[others], self.bounds.ub[others]))
+
+        def objective(y, value):
+            x = np.insert(y, p, value)
+            return self.objective(x)
+
+        profile = np.zeros(len(values))
+        y = self.x[others]
+        for i, value in enumerate(values):
+            if len(others) == 0:
+                profile[i] = objective(y, value)
+                continue
+            result = minimize(objective, y, args=(value,), method="L-BFGS-B", bounds=limits)
+            profile[i] = result.fun
+            y = result.x
+        self.apply_parameters(self.x)
+        self.results = self.strategy.solver()
+        return values, profile
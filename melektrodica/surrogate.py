@@ -0,0 +1,343 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Surrogate class
+
+"""
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import minimize
+from scipy.stats import norm
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Surrogate:
+    """
+    Gaussian process surrogate of an expensive objective function over a box.
+
+    The surrogate models the objective function with a zero-mean Gaussian process
+    :cite:p:`Rasmussen2006` on the unit hypercube, using an anisotropic
+    Matérn 5/2 covariance
+
+    .. math::
+
+        k(\\mathbf{u}, \\mathbf{u}') = \\sigma_f^2 \\left(1 + \\sqrt{5}r + \\frac{5}{3}r^2\\right)
+                                     \\exp\\left(-\\sqrt{5}r\\right), \\quad
+        r^2 = \\sum_d \\frac{(u_d - u'_d)^2}{\\ell_d^2}
+
+    whose hyperparameters :math:`\\{\\ell_d, \\sigma_f, \\sigma_n\\}` are fitted by maximizing
+    the log marginal likelihood. New candidates are selected by maximizing the expected
+    improvement over the best observed value :cite:p:`Jones1998`.
+
+    Attributes
+    ----------
+    lb : numpy.ndarray
+        Lower limits of the box.
+    ub : numpy.ndarray
+        Upper limits of the box.
+    rng : numpy.random.Generator
+        Random number generator used to sample candidates.
+    X : numpy.ndarray
+        Observed points, scaled to the unit hypercube.
+    y : numpy.ndarray
+        Observed objective function values.
+    hyperparameters : numpy.ndarray
+        Logarithm of the length scales, signal and noise standard deviations.
+    """
+
+    def __init__(self, lb, ub, rng=None):
+        """
+        Initializes an empty surrogate over the box ``[lb, ub]``.
+
+        Parameters
+        ----------
+        lb : array_like
+            Lower limits of the box.
+        ub : array_like
+            Upper limits of the box.
+        rng : numpy.random.Generator, optional
+            Random number generator. A new one is created if not provided.
+        """
+        self.lb = np.asarray(lb, dtype=float)
+        self.ub = np.asarray(ub, dtype=float)
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.X = np.zeros((0, len(self.lb)))
+        self.y = np.zeros(0)
+        self.hyperparameters = np.concatenate(
+            [np.full(len(self.lb), np.log(0.3)), [0.0, np.log(1e-3)]]
+        )
+        self.y_mean = 0.0
+        self.y_std = 1.0
+        self.factor = None
+        self.alpha = None
+
+    def scale(self, x):
+        """
+        Maps points of the box to the unit hypercube.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Points in the original box.
+
+        Returns
+        -------
+        numpy.ndarray
+            Points in the unit hypercube.
+        """
+        width = np.where(self.ub > self.lb, self.ub - self.lb, 1.0)
+        return (np.asarray(x, dtype=float) - self.lb) / width
+
+    def unscale(self, u):
+        """
+        Maps points of the unit hypercube back to the box.
+
+        Parameters
+        ----------
+        u : numpy.ndarray
+            Points in the unit hypercube.
+
+        Returns
+        -------
+        numpy.ndarray
+            Points in the original box.
+        """
+        return self.lb + np.asarray(u) * (self.ub - self.lb)
+
+    @staticmethod
+    def kernel(A, B, hyperparameters):
+        """
+        Evaluates the Matérn 5/2 covariance between two sets of points.
+
+        Parameters
+        ----------
+        A : numpy.ndarray
+            Points of shape (n, d) in the unit hypercube.
+        B : numpy.ndarray
+            Points of shape (m, d) in the unit hypercube.
+        hyperparameters : numpy.ndarray
+            Logarithm of the ``d`` length scales, the signal and the noise standard
+            deviations.
+
+        Returns
+        -------
+        numpy.ndarray
+            Covariance matrix of shape (n, m).
+        """
+        d = A.shape[1]
+        length = np.exp(hyperparameters[:d])
+        signal = np.exp(2 * hyperparameters[d])
+        diff = (A[:, None, :] - B[None, :, :]) / length
+        r = np.sqrt(np.sum(diff ** 2, axis=2))
+        return signal * (1 + np.sqrt(5) * r + 5 / 3 * r ** 2) * np.exp(-np.sqrt(5) * r)
+
+    def negative_log_likelihood(self, hyperparameters, X, y):
+        """
+        Negative log marginal likelihood of the standardized observations.
+
+        Parameters
+        ----------
+        hyperparameters : numpy.ndarray
+            Logarithm of the length scales, signal and noise standard deviations.
+        X : numpy.ndarray
+            Observed points in the unit hypercube.
+        y : numpy.ndarray
+            Standardized observed values.
+
+        Returns
+        -------
+        float
+            The negative log marginal likelihood, infinity if the covariance matrix is
+            not positive definite.
+        """
+        noise = np.exp(2 * hyperparameters[-1])
+        K = self.kernel(X, X, hyperparameters) + (noise + 1e-10) * np.eye(len(X))
+        try:
+            factor = cho_factor(K, lower=True)
+        except np.linalg.LinAlgError:
+            return np.inf
+        alpha = cho_solve(factor, y)
+        return 0.5 * y @ alpha + np.sum(np.log(np.diag(factor[0])))
+
+    def fit(self, x, y, optimize=True):
+        """
+        Conditions the surrogate on observed points.
+
+        Non-finite observations are replaced by the worst finite value, so failed
+        evaluations are modeled as bad regions instead of breaking the regression.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Observed points of shape (n, d) in the original box.
+        y : numpy.ndarray
+            Observed objective function values.
+        optimize : bool, optional
+            Whether the hyperparameters are refitted, starting from the previous
+            ones. Default is True.
+
+        Returns
+        -------
+        Surrogate
+            The conditioned surrogate.
+        """
+        y = np.asarray(y, dtype=float)
+        finite = np.isfinite(y)
+        worst = np.max(y[finite]) if np.any(finite) else 0.0
+        self.X = self.scale(x)
+        self.y = np.where(finite, y, worst)
+        self.y_mean = np.mean(self.y)
+        self.y_std = np.std(self.y) if np.std(self.y) > 0 else 1.0
+        y_scaled = (self.y - self.y_mean) / self.y_std
+
+        if optimize and len(self.y) > 1:
+            d = self.X.shape[1]
+            limits = [(np.log(1e-2), np.log(1e2))] * d
+            limits += [(np.log(1e-2), np.log(1e1)), (np.log(1e-5), np.log(1e-1))]
+            result = minimize(
+                self.negative_log_likelihood,
+                self.hyperparameters,
+                args=(self.X, y_scaled),
+                method="L-BFGS-B",
+                bounds=limits,
+            )
+            if np.isfinite(result.fun):
+                self.hyperparameters = result.x
+
+        noise = np.exp(2 * self.hyperparameters[-1])
+        K = self.kernel(self.X, self.X, self.hyperparameters)
+        K += (noise + 1e-10) * np.eye(len(self.X))
+        self.factor = cho_factor(K, lower=True)
+        self.alpha = cho_solve(self.factor, y_scaled)
+        return self
+
+    def predict(self, x):
+        """
+        Posterior mean and standard deviation of the surrogate.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Points of shape (m, d) in the original box.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The posterior mean and standard deviation at each point, in the units of
+            the observations.
+        """
+        u = np.atleast_2d(self.scale(x))
+        k = self.kernel(u, self.X, self.hyperparameters)
+        mean = k @ self.alpha
+        v = cho_solve(self.factor, k.T)
+        variance = np.exp(2 * self.hyperparameters[-2]) - np.sum(k * v.T, axis=1)
+        std = np.sqrt(np.maximum(variance, 1e-20))
+        return self.y_mean + self.y_std * mean, self.y_std * std
+
+    def expected_improvement(self, x, xi=0.01):
+        """
+        Expected improvement of the surrogate over the best observation.
+
+        .. math::
+
+            EI(\\mathbf{x}) = (y^* - \\mu - \\xi)\\,\\Phi(z) + \\sigma\\,\\phi(z), \\quad
+            z = \\frac{y^* - \\mu - \\xi}{\\sigma}
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Points of shape (m, d) in the original box.
+        xi : float, optional
+            Exploration margin, in units of the standard deviation of the
+            observations. Default is 0.01.
+
+        Returns
+        -------
+        numpy.ndarray
+            The expected improvement at each point.
+        """
+        mean, std = self.predict(x)
+        improvement = np.min(self.y) - mean - xi * self.y_std
+        z = improvement / std
+        return improvement * norm.cdf(z) + std * norm.pdf(z)
+
+    def propose(self, n_candidates=2000, n_polish=5):
+        """
+        Finds the point of maximum expected improvement.
+
+        Random points of the box and perturbations of the best observations are
+        screened, and the most promising ones are refined with L-BFGS-B.
+
+        Parameters
+        ----------
+        n_candidates : int, optional
+            Number of screened points. Default is 2000.
+        n_polish : int, optional
+            Number of screened points refined by the local optimizer. Default is 5.
+
+        Returns
+        -------
+        numpy.ndarray
+            The proposed point in the original box.
+        """
+        d = self.X.shape[1]
+        best = self.X[np.argsort(self.y)[: max(1, n_candidates // 200)]]
+        local = best[self.rng.integers(len(best), size=n_candidates // 2)]
+        local = np.clip(local + 0.05 * self.rng.standard_normal(local.shape), 0, 1)
+        u = np.vstack([self.rng.random((n_candidates - len(local), d)), local])
+        ei = self.expected_improvement(self.unscale(u))
+        starts = u[np.argsort(-ei)[:n_polish]]
+
+        u_best, ei_best = starts[0], -np.inf
+        for u0 in starts:
+            result = minimize(
+                lambda v: -self.expected_improvement(self.unscale(v))[0],
+                u0,
+                method="L-BFGS-B",
+                bounds=[(0, 1)] * d,
+            )
+            if -result.fun > ei_best:
+                u_best, ei_best = result.x, -result.fun
+        return self.unscale(u_best)
+
+    def propose_batch(self, size):
+        """
+        Proposes a batch of points with the constant-liar strategy.
+
+        After each proposal the surrogate is conditioned on its own posterior mean at
+        the proposed point, without refitting the hyperparameters, which pushes the
+        next proposal away from it. The surrogate is restored afterwards.
+
+        Parameters
+        ----------
+        size : int
+            Number of points of the batch.
+
+        Returns
+        -------
+        numpy.ndarray
+            The proposed points, of shape (size, d), in the original box.
+        """
+        X, y = self.unscale(self.X), np.copy(self.y)
+        batch = []
+        for _ in range(size):
+            x = self.propose()
+            batch.append(x)
+            if len(batch) < size:
+                mean, _ = self.predict(x)
+                self.fit(
+                    np.vstack([self.unscale(self.X), x]),
+                    np.append(self.y, mean),
+                    optimize=False,
+                )
+        self.fit(X, y, optimize=False)
+        return np.array(batch)
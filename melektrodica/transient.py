@@ -0,0 +1,466 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Transient class
+
+"""
+
+import copy
+import numpy as np
+from types import SimpleNamespace
+from scipy.integrate import solve_ivp
+from .calculator import Calculator
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+class Transient(Calculator):
+    """
+    Time-domain simulation of the kinetic model under a potential program.
+
+    The coverages, and the bulk concentrations of a CSTR, follow
+
+    .. math::
+
+        \\mathbf{M} \\frac{d\\mathbf{x}}{dt} = \\mathbf{f}\\left(\\mathbf{x}, \\eta(t)\\right), \\quad
+        J(t) = F \\sum_i n_i \\nu_i\\left(\\mathbf{x}, \\eta(t)\\right)
+               + s\\, C_{dl} \\frac{d\\eta}{dt}
+
+    with :math:`\\mathbf{f}` the steady-state equations, :math:`\\mathbf{M}` the mass
+    matrix, see `BaseConcentration.mass_matrix`, and :math:`s` the sign of the
+    electrode. The stiff system is integrated with an implicit method of `solve_ivp`
+    and the analytic Jacobian, see `BaseConcentration.jacobian`, with adaptive steps.
+    The solution is sampled on the requested times by the dense output of the
+    integrator, so the resolution of the output does not limit the step size.
+
+    Linear sweeps and cyclic voltammograms start from the steady state at the first
+    vertex, see `sweep`. Potential steps, holds and ramps are combined in a
+    `program`, which stops each hold once the steady state is reached. The output is
+    preallocated, or streamed to a ``.npy`` file opened as a memory map, so long
+    programs do not grow the memory used.
+
+    The potentials of the model data are kept, but the simulation does not solve
+    them: the steady state is solved only at the single potentials of the initial
+    conditions.
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the simulation.
+    writer : Writer
+        Writer used for logging.
+    potential : numpy.ndarray
+        Potentials of the model data, not simulated.
+    site_density : float
+        Density of active sites, in mol/cm2.
+    height : float or None
+        Volume of the reactor per unit of catalyst area, in cm, for a CSTR.
+    capacitance : float
+        Double layer capacitance, in F/cm2.
+    method : str
+        Implicit integration method of `solve_ivp`, 'BDF', 'Radau' or 'LSODA'.
+    rtol : float
+        Relative tolerance of the integrator.
+    atol : float
+        Absolute tolerance of the integrator.
+    mass : numpy.ndarray
+        Diagonal of the mass matrix.
+    time : numpy.ndarray
+        Sampled times, in s.
+    eta : numpy.ndarray
+        Potential at the sampled times.
+    j : numpy.ndarray
+        Current density at the sampled times.
+    state : numpy.ndarray
+        State variables at the sampled times.
+    output : numpy.ndarray or numpy.memmap
+        Sampled output, with columns time, potential, current density and state
+        variables. ``time``, ``eta``, ``j`` and ``state`` are views of it.
+    steady : numpy.ndarray
+        Time when each hold of the last `program` reached the steady state, NaN if it
+        did not.
+    """
+
+    def __init__(
+            self,
+            kpy,
+            site_density=2.2e-9,
+            height=None,
+            capacitance=0.0,
+            method="BDF",
+            rtol=1e-8,
+            atol=1e-16,
+            name=None,
+    ):
+        """
+        Initializes the simulation of a kinetic model.
+
+        Only the steady state at the first potential of the model data is solved, as
+        a check of the model.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model.
+        site_density : float, optional
+            Density of active sites, in mol/cm2. Default is 2.2e-9.
+        height : float, optional
+            Volume of the reactor per unit of catalyst area, in cm, required for a CSTR.
+            Default is None.
+        capacitance : float, optional
+            Double layer capacitance, in F/cm2. Default is 0.0, Faradaic current only.
+        method : str, optional
+            Implicit integration method of `solve_ivp`. Default is 'BDF'.
+        rtol : float, optional
+            Relative tolerance of the integrator. Default is 1e-8.
+        atol : float, optional
+            Absolute tolerance of the integrator. Default is 1e-16, well below the
+            smallest coverages that carry current at high overpotentials.
+        name : str, optional
+            Name identifier of the simulation. Default is 'melek'.
+
+        Raises
+        ------
+        ValueError
+            If the model is a CSTR and the height of the reactor is not given.
+        """
+        self.Kpy = copy.deepcopy(kpy)
+        self.data = self.Kpy.data
+        potential = np.array(self.data.parameters.potential, dtype=float)
+        self.data.parameters.potential = potential[:1]
+        super().__init__(self.Kpy, name)
+        self.data.parameters.potential = self.potential = potential
+        self.writer.message(f"*** Transient : {self.name}  ***")
+        self.site_density = site_density
+        self.height = height
+        self.capacitance = capacitance
+        self.method = method
+        self.rtol = rtol
+        self.atol = atol
+        self.mass = self.strategy.mass_matrix(site_density, height)
+        self.allocate(0)
+        self.steady = np.zeros(0)
+
+    def initial_state(self, potential):
+        """
+        Steady state at a potential, used as initial condition.
+
+        Parameters
+        ----------
+        potential : float
+            Applied potential.
+
+        Returns
+        -------
+        numpy.ndarray
+            The state variables.
+        """
+        potential_data = self.operation.potential
+        self.operation.potential = np.array([potential], dtype=float)
+        try:
+            return np.array(self.strategy.solver().state[0])
+        finally:
+            self.operation.potential = potential_data
+
+    def integrate(self, program, duration, x0, t_eval, events=None):
+        """
+        Integrates the transient equations under a potential program.
+
+        The time is counted from the start of the program, so the relaxation times
+        of fast steps, which can be far below the spacing of floating point numbers
+        at the absolute time of a long experiment, can always be resolved.
+
+        Parameters
+        ----------
+        program : callable
+            Potential as a function of the time since the start, ``program(t)``.
+        duration : float
+            Duration of the program.
+        x0 : numpy.ndarray
+            Initial state variables.
+        t_eval : numpy.ndarray
+            Times where the solution is sampled.
+        events : callable or list of callable, optional
+            Event functions ``event(t, x)`` of `solve_ivp`. Default is None.
+
+        Returns
+        -------
+        OptimizeResult
+            The solution of `solve_ivp`.
+
+        Raises
+        ------
+        RuntimeError
+            If the integration fails.
+        """
+        strategy, mass = self.strategy, self.mass
+
+        def derivatives(t, x):
+            return strategy.steady_state(x, program(t)) / mass
+
+        def jacobian(t, x):
+            return strategy.jacobian(x, program(t)) / mass[:, None]
+
+        solution = solve_ivp(
+            derivatives,
+            (0.0, duration),
+            x0,
+            method=self.method,
+            t_eval=t_eval,
+            events=events,
+            jac=jacobian,
+            rtol=self.rtol,
+            atol=self.atol,
+        )
+        if solution.status < 0:
+            raise RuntimeError(f"Transient integration failed: {solution.message}")
+        return solution
+
+    def allocate(self, n_points, fname=None):
+        """
+        Preallocates the sampled output.
+
+        Parameters
+        ----------
+        n_points : int
+            Number of sampled times.
+        fname : str, optional
+            Path of the ``.npy`` file where the output is streamed. Default is None,
+            the output is kept in memory.
+        """
+        shape = (n_points, 3 + len(self.mass))
+        if fname is None:
+            self.output = np.zeros(shape)
+        else:
+            self.output = np.lib.format.open_memmap(
+                fname, mode="w+", dtype=float, shape=shape
+            )
+        self.time = self.output[:, 0]
+        self.eta = self.output[:, 1]
+        self.j = self.output[:, 2]
+        self.state = self.output[:, 3:]
+
+    def record(self, start, solution, program, offset=0.0, rate=0.0):
+        """
+        Stores a sampled solution in the output from a given position.
+
+        Parameters
+        ----------
+        start : int
+            Position of the first sample.
+        solution : OptimizeResult
+            The solution of `integrate`.
+        program : callable
+            Potential as a function of the time since the start of the program.
+        offset : float, optional
+            Time at the start of the program. Default is 0.0.
+        rate : float, optional
+            Scan rate :math:`d\\eta/dt` for the capacitive current. Default is 0.0.
+
+        Returns
+        -------
+        int
+            The position after the last sample.
+        """
+        stop = start + len(solution.t)
+        self.time[start:stop] = offset + solution.t
+        self.state[start:stop] = solution.y.T
+        for k, (t, x) in enumerate(zip(solution.t, solution.y.T)):
+            self.eta[start + k] = program(t)
+            self.j[start + k] = self.strategy.current(x, self.eta[start + k])
+        self.j[start:stop] += self.Kpy.electrode * self.capacitance * rate
+        return stop
+
+    def sweep(self, vertices, scan_rate, cycles=1, resolution=1e-3, x0=None, fname=None):
+        """
+        Linear sweep or cyclic voltammetry.
+
+        The potential moves linearly between consecutive vertices at the scan rate.
+        Two vertices give a linear sweep; vertices that return to the first one give
+        a cycle, repeated ``cycles`` times. Each segment is integrated separately, so
+        the steps never cross the kinks of the program.
+
+        Parameters
+        ----------
+        vertices : array_like
+            Potentials of the vertices, in V.
+        scan_rate : float
+            Scan rate, in V/s.
+        cycles : int, optional
+            Number of repetitions of the vertices after the first one. Default is 1.
+        resolution : float, optional
+            Potential interval between samples, in V. Default is 1e-3.
+        x0 : numpy.ndarray, optional
+            Initial state variables. Default is None, the steady state at the first
+            vertex.
+        fname : str, optional
+            Path of the ``.npy`` file where the output is streamed. Default is None.
+
+        Returns
+        -------
+        Transient
+            The instance, with ``time``, ``eta``, ``j`` and ``state`` sampled along the
+            sweep.
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        path = np.concatenate([vertices] + [vertices[1:]] * (int(cycles) - 1))
+        if x0 is None:
+            x0 = self.initial_state(path[0])
+        samples = [
+            max(int(np.ceil(abs(b - a) / resolution)), 1)
+            for a, b in zip(path[:-1], path[1:])
+        ]
+        self.allocate(1 + sum(samples), fname)
+        self.writer.message(
+            f"Sweep: {len(path) - 1} segments at {scan_rate} V/s, {len(self.time)} points"
+        )
+
+        x, t0, position = np.asarray(x0, dtype=float), 0.0, 0
+        for (a, b), n in zip(zip(path[:-1], path[1:]), samples):
+            rate = np.sign(b - a) * scan_rate
+            duration = abs(b - a) / scan_rate
+
+            def program(t, a=a, rate=rate):
+                return a + rate * t
+
+            t_eval = np.linspace(0.0, duration, n + 1)
+            if position > 0:
+                t_eval = t_eval[1:]
+            solution = self.integrate(program, duration, x, t_eval)
+            position = self.record(position, solution, program, t0, rate)
+            x, t0 = solution.y[:, -1], t0 + duration
+        if fname is not None:
+            self.output.flush()
+        return self
+
+    def program(
+            self,
+            steps,
+            initial=None,
+            points=101,
+            tolerance=None,
+            x0=None,
+            fname=None,
+    ):
+        """
+        Simulates a piecewise potential program, for instance a chronoamperometry.
+
+        Each step is either a hold ``(potential, duration)``, reached by an
+        instantaneous potential step, or a ramp ``(start, end, duration)``. Holds are
+        sampled on logarithmically spaced times, which resolve the fast initial decay
+        and the long tail of the current alike, and ramps on evenly spaced times. Every
+        step is integrated separately in its own time, so the stiff integrator never
+        steps across a discontinuity of the program.
+
+        A hold stops early when the steady state is reached, detected by the event
+
+        .. math::
+
+            \\max_k \\left|\\frac{dx_k}{dt}\\right| = \\epsilon
+
+        located by `solve_ivp`; the remaining samples of the hold keep the steady
+        state. The capacitive current of the instantaneous steps is not included.
+
+        Parameters
+        ----------
+        steps : sequence of tuple
+            Holds ``(potential, duration)`` and ramps ``(start, end, duration)``, with
+            potentials in V and durations in s.
+        initial : float, optional
+            Potential of the steady state before the program. Default is None, the
+            potential of the first step.
+        points : int, optional
+            Number of samples per step. Default is 101.
+        tolerance : float, optional
+            Largest rate of change of the state variables :math:`\\epsilon`, in 1/s,
+            at steady state. Default is None, the holds are never stopped early.
+        x0 : numpy.ndarray, optional
+            Initial state variables. Default is None, the steady state at ``initial``.
+        fname : str, optional
+            Path of the ``.npy`` file where the output is streamed. Default is None.
+
+        Returns
+        -------
+        Transient
+            The instance, with ``time``, ``eta``, ``j`` and ``state`` sampled along the
+            program and the time of the steady state of each hold in ``steady``.
+
+        Raises
+        ------
+        ValueError
+            If a step is neither a hold nor a ramp.
+        """
+        steps = [tuple(float(value) for value in step) for step in steps]
+        if any(len(step) not in (2, 3) for step in steps):
+            raise ValueError(
+                "Each step must be (potential, duration) or (start, end, duration)."
+            )
+        if x0 is None:
+            x0 = self.initial_state(steps[0][0] if initial is None else initial)
+        self.allocate(len(steps) * points, fname)
+        self.steady = np.full(len(steps), np.nan)
+        self.writer.message(f"Program: {len(steps)} steps, {len(self.time)} points")
+
+        strategy, mass = self.strategy, self.mass
+        x, t0, position = np.asarray(x0, dtype=float), 0.0, 0
+        for k, step in enumerate(steps):
+            start, end, duration = step if len(step) == 3 else (step[0], step[0], step[1])
+            rate = (end - start) / duration
+
+            def program(t, start=start, rate=rate):
+                return start + rate * t
+
+            if len(step) == 3:
+                times = np.linspace(0.0, duration, points)
+            else:
+                times = np.append(0.0, np.geomspace(duration * 1e-9, duration, points - 1))
+
+            t_eval, events = times, None
+            if len(step) == 2 and tolerance is not None:
+                def steady(t, x, start=start):
+                    return np.max(np.abs(strategy.steady_state(x, start) / mass)) - tolerance
+
+                steady.terminal = True
+                steady.direction = -1
+                events = steady
+                if steady(0.0, x) <= 0:
+                    t_eval = times[:1]
+                    self.steady[k] = t0
+
+            if len(t_eval) > 1:
+                solution = self.integrate(program, duration, x, t_eval, events)
+            else:
+                solution = SimpleNamespace(t=t_eval, y=x[:, None], t_events=[np.zeros(0)])
+            stop = self.record(position, solution, program, t0, rate)
+            x = solution.y[:, -1]
+            if events is not None and len(solution.t_events[0]) > 0:
+                self.steady[k] = t0 + solution.t_events[0][0]
+            if stop < position + points:
+                self.time[stop:position + points] = t0 + times[stop - position:]
+                self.eta[stop:position + points] = end
+                self.state[stop:position + points] = x
+                self.j[stop:position + points] = strategy.current(x, end)
+            position, t0 = position + points, t0 + duration
+        if fname is not None:
+            self.output.flush()
+        return self
+
+    def unzip(self):
+        """
+        Concentrations and coverages at the sampled times.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The concentrations of the reactants and products and the coverages.
+        """
+        parts = [self.strategy.unzip_variables(x) for x in self.state]
+        c_reactants, c_products, theta = zip(*parts) if parts else ([], [], [])
+        return np.array(c_reactants), np.array(c_products), np.array(theta)
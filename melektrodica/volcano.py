@@ -0,0 +1,251 @@
+"""
+
+    μElektrodica© 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Volcano class
+
+"""
+
+import copy
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .calculator import Calculator
+from .fitter import update_rates
+from .kpynetic import RateConstants
+
+
+# for debugging
+# import sys
+# sys.exit()
+# from .Tools import showme
+
+
+def solve_row(strategy, thermochemical, initial=None, tolerance=1e-6):
+    """
+    Solves the steady states along one row of the descriptor grid.
+
+    Each point starts from the steady state of the previous one at the first
+    potential. A steady state is accepted if the largest residual of its balances is
+    below ``tolerance`` times its largest gross rate. Potentials that do not converge
+    are left as NaN, and if the first one fails the next point starts from the
+    default guess. Defined at module level so that rows can be solved in worker
+    processes.
+
+    Parameters
+    ----------
+    strategy : BaseConcentration
+        Strategy of the kinetic model.
+    thermochemical : numpy.ndarray
+        Thermochemical parts of the rate constants of the points, in the order they
+        are solved, of shape (n_points, 2, n_reactions).
+    initial : numpy.ndarray, optional
+        Initial guess of the state variables of the first point. Default is None.
+    tolerance : float, optional
+        Largest residual relative to the gross rates. Default is 1e-6.
+
+    Returns
+    -------
+    tuple
+        The current densities, of shape (n_points, n_potentials), the net reaction
+        rates, of shape (n_points, n_potentials, n_reactions), and the state of the
+        last converged point at the first potential.
+    """
+    n_potentials = len(strategy.operation.potential)
+    n_reactions = len(strategy.reactions.list)
+    current = np.full((len(thermochemical), n_potentials), np.nan)
+    rates = np.full((len(thermochemical), n_potentials, n_reactions), np.nan)
+    for p, part in enumerate(thermochemical):
+        update_rates(strategy.Kpy, {"thermochemical_part": part})
+        try:
+            strategy.solver(initial=initial)
+        except RuntimeError:
+            initial = None
+            continue
+        residual = np.max(np.abs(strategy.fval), axis=1)
+        scale = np.max(strategy.forward + strategy.backward, axis=1)
+        converged = residual <= tolerance * scale
+        current[p, converged] = strategy.j[converged]
+        rates[p, converged] = strategy.nu[converged]
+        initial = strategy.state[0] if converged[0] else None
+    return current, rates, initial
+
+
+class Volcano(Calculator):
+    """
+    Activity maps over one or two descriptor energies.
+
+    The formation energies of the adsorbed species follow linear scaling relations of
+    the descriptors,
+
+    .. math::
+
+        G^\\circ_n = a_n + \\sum_d b_{nd}\\, \\Delta E_d
+
+    while the activation energies of the steps are kept. The steady state is solved
+    at every point of the descriptor grid, which is traversed in boustrophedon order,
+    reversing the direction of every other row, so each point starts from the
+    solution of a neighbour. With several workers the rows are solved in parallel,
+    each row starting from the default guess.
+
+    Attributes
+    ----------
+    name : str
+        Name identifier of the analysis.
+    writer : Writer
+        Writer used for logging.
+    intercepts : numpy.ndarray
+        Intercepts :math:`a_n` of the scaling relations, in eV.
+    slopes : numpy.ndarray
+        Slopes :math:`b_{nd}` of the scaling relations, of shape
+        (n_adsorbed, n_descriptors).
+    descriptors : list of numpy.ndarray
+        Values of each descriptor, in eV.
+    workers : int
+        Number of processes.
+    current : numpy.ndarray
+        Current density map, of shape (n_1, [n_2,] n_potentials), NaN where the
+        steady state was not found.
+    rates : numpy.ndarray
+        Net rate of every step, of shape (n_1, [n_2,] n_potentials, n_reactions), in
+        the units of the rate constants, NaN where the steady state was not found.
+    """
+
+    def __init__(
+            self,
+            kpy,
+            intercepts,
+            slopes,
+            descriptors,
+            potential=None,
+            workers=1,
+            name=None,
+    ):
+        """
+        Solves the steady state over the descriptor grid.
+
+        Parameters
+        ----------
+        kpy : Kpynetic
+            Kinetic model, with thermochemical rate constants.
+        intercepts : array_like
+            Intercepts of the scaling relations, one per adsorbed species, in eV.
+        slopes : array_like
+            Slopes of the scaling relations, of shape (n_adsorbed,) for one descriptor
+            or (n_adsorbed, n_descriptors).
+        descriptors : array_like or list of array_like
+            Values of the descriptor, or one array per descriptor, in eV.
+        potential : array_like, optional
+            Potentials of the maps. Default is None, those of the model.
+        workers : int, optional
+            Number of processes. Default is 1, serial evaluation.
+        name : str, optional
+            Name identifier of the analysis. Default is 'melek'.
+
+        Raises
+        ------
+        ValueError
+            If the model has no thermochemical rate constants, or the shapes of the
+            scaling relations and descriptors do not agree.
+        """
+        if not kpy.data.parameters.thermochemical:
+            raise ValueError("Volcano maps need thermochemical rate constants.")
+        self.slopes = np.asarray(slopes, dtype=float).reshape(
+            len(kpy.data.species.adsorbed), -1
+        )
+        self.intercepts = np.asarray(intercepts, dtype=float)
+        if np.ndim(descriptors[0]) == 0:
+            descriptors = [descriptors]
+        self.descriptors = [np.asarray(values, dtype=float) for values in descriptors]
+        if len(self.descriptors) != self.slopes.shape[1] or len(self.descriptors) > 2:
+            raise ValueError("One or two descriptors, one per column of the slopes.")
+
+        if potential is not None:
+            kpy = copy.deepcopy(kpy)
+            kpy.data.parameters.potential = np.atleast_1d(
+                np.asarray(potential, dtype=float)
+            )
+        super().__init__(kpy, name)
+        self.writer.message(f"*** Volcano : {self.name}  ***")
+        self.workers = max(int(workers), 1)
+        self.evaluate()
+
+    def formation_energies(self):
+        """
+        Formation energies of the adsorbed species at every point of the grid.
+
+        Returns
+        -------
+        numpy.ndarray
+            The formation energies, of shape (n_1, n_2, n_adsorbed), with ``n_2 = 1``
+            for one descriptor.
+        """
+        axes = self.descriptors + [np.zeros(1)] * (2 - len(self.descriptors))
+        grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1)
+        slopes = np.hstack([self.slopes, np.zeros((len(self.slopes), 2))])[:, :2]
+        return self.intercepts + grid @ slopes.T
+
+    def rows(self):
+        """
+        Thermochemical parts of the rate constants of each row, in boustrophedon order.
+
+        One descriptor is solved as a single row.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The parts of each row, of shape (n_points, 2, n_reactions).
+        """
+        g_formation = self.formation_energies()
+        if len(self.descriptors) == 1:
+            g_formation = g_formation.transpose(1, 0, 2)
+        g_formation[1::2] = g_formation[1::2, ::-1]
+        return [
+            np.stack([
+                RateConstants.thermochemical(
+                    self.reactions.ga, g, self.reactions.upsilon_a
+                )
+                for g in row
+            ])
+            for row in g_formation
+        ]
+
+    def evaluate(self):
+        """
+        Computes the current density and net rate maps.
+
+        Returns
+        -------
+        Volcano
+            The instance, with its attributes updated.
+        """
+        rows = self.rows()
+        self.writer.message(
+            f"Volcano: {len(rows)} x {len(rows[0])} points, "
+            f"{len(self.potential)} potentials"
+        )
+        strategy = copy.deepcopy(self.strategy)
+        if self.workers == 1:
+            solved, initial = [], None
+            for row in rows:
+                current, rates, initial = solve_row(strategy, row, initial)
+                solved.append((current, rates))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                solved = [
+                    (current, rates)
+                    for current, rates, _ in executor.map(
+                        solve_row, [strategy] * len(rows), rows
+                    )
+                ]
+
+        current = np.stack([row[0] for row in solved])
+        rates = np.stack([row[1] for row in solved])
+        current[1::2] = current[1::2, ::-1]
+        rates[1::2] = rates[1::2, ::-1]
+        if len(self.descriptors) == 1:
+            current, rates = current[0], rates[0]
+        self.current = current
+        self.rates = rates
+        return self
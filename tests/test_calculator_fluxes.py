@@ -0,0 +1,93 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Calculator, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock
+from melektrodica import Collector, Kpynetic
+from melektrodica.calculator import StaticConcentration
+from melektrodica.constants import F
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+class TestFluxes(unittest.TestCase):
+    """
+    Unit test class for the decomposition of the current into reactions and products.
+    """
+
+    class MockSpecies:
+        def __init__(self):
+            self.reactants = ["A"]
+            self.products = ["P1", "P2"]
+
+    class MockReactions:
+        def __init__(self):
+            # A -> B* + e-, B* -> P1 + e-, B* -> P2 + 3e-
+            self.ne = np.array([1.0, 1.0, 3.0])
+            self.upsilon = np.array(
+                [[-1.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, -1.0], [0.0, 0.0, 1.0, -1.0]]
+            )
+
+    def setUp(self):
+        kpy = MagicMock()
+        kpy.data.species = self.MockSpecies()
+        kpy.data.reactions = self.MockReactions()
+        self.strategy = StaticConcentration(kpy)
+        self.strategy.forward = np.array([[4.0, 3.0, 1.0], [2.0, 1.0, 1.0]])
+        self.strategy.backward = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        self.strategy.decompose()
+        self.strategy.j = np.sum(self.strategy.j_partial, axis=1)
+
+    def test_decompose(self):
+        np.testing.assert_allclose(self.strategy.production, [[3.0, 1.0], [1.0, 1.0]])
+        np.testing.assert_allclose(
+            self.strategy.j_partial[0], F * np.array([4.0, 3.0, 3.0])
+        )
+
+    def test_selectivity(self):
+        np.testing.assert_allclose(
+            self.strategy.selectivity(), [[0.75, 0.25], [0.5, 0.5]]
+        )
+        np.testing.assert_allclose(
+            self.strategy.faradaic_efficiency([2, 4]), [[0.6, 0.4], [1 / 3, 2 / 3]]
+        )
+        np.testing.assert_allclose(self.strategy.selectivity(["P2"]), 1.0)
+
+    def test_tutorial(self):
+        strategy = StaticConcentration(tutorial("SanchezMonreal2017Ethanol")).solver()
+        for i in [0, 200, 400]:
+            state = strategy.state[i]
+            forward, backward = strategy.fluxes(state, strategy.potential[i])
+            np.testing.assert_allclose(strategy.forward[i], forward)
+            np.testing.assert_allclose(strategy.backward[i], backward)
+        np.testing.assert_allclose(strategy.nu, strategy.forward - strategy.backward)
+        np.testing.assert_allclose(
+            np.sum(strategy.j_partial, axis=1), strategy.j,
+            atol=1e-12 * np.max(np.abs(strategy.j)),
+        )
+        carbon = ["CH3CHO", "CH3COOH", "CO2", "CH4"]
+        np.testing.assert_allclose(np.sum(strategy.selectivity(carbon), axis=1), 1.0)
+        # every electron of the mechanism is released with a proton
+        np.testing.assert_allclose(strategy.faradaic_efficiency([1], ["H+"]), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Calculator, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Calculator, Collector, Kpynetic
+from melektrodica.calculator import LinearConcentration, StaticConcentration
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+class TestLinearConcentration(unittest.TestCase):
+    """
+    Unit test class for the closed-form steady state of first-order mechanisms.
+    """
+
+    class MockParameters:
+        def __init__(self):
+            self.potential = np.array([0.0, 0.0])
+            self.temperature = 298.15
+            self.cstr = False
+            self.anode = True
+            self.pre_exponential = 1.0
+            self.js = False
+            self.tst = False
+            self.experimental = True
+            self.thermochemical = False
+
+    class MockSpecies:
+        def __init__(self):
+            self.reactants = ["A"]
+            self.products = ["B"]
+            self.adsorbed = ["A*"]
+            self.catalyst = ["*"]
+            self.c0_reactants = np.array([2.0])
+            self.c0_products = np.array([0.5])
+            self.ns_catalyst = np.array([[1.0]])
+
+    class MockReactions:
+        def __init__(self):
+            # A + * <-> A*, A* <-> B + * + e-
+            self.list = ["1", "2"]
+            self.k_f = np.array([3.0, 4.0])
+            self.k_b = np.array([1.0, 2.0])
+            self.ne = np.array([0.0, 1.0])
+            self.beta = np.array([0.5, 0.5])
+            self.upsilon = np.array([[-1.0, 0.0, 1.0, -1.0], [0.0, 1.0, -1.0, 1.0]])
+            self.upsilonx = np.array([[1.0], [-1.0]])
+
+    class MockData:
+        def __init__(self):
+            self.parameters = TestLinearConcentration.MockParameters()
+            self.species = TestLinearConcentration.MockSpecies()
+            self.reactions = TestLinearConcentration.MockReactions()
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        self.writer = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.kpy = Kpynetic(self.MockData(), writer=MagicMock())
+
+    def test_applies(self):
+        self.assertTrue(LinearConcentration.applies(self.kpy))
+        self.kpy.reactions.upsilon = np.array(
+            [[-1.0, 0.0, 2.0, -2.0], [0.0, 1.0, -1.0, 1.0]]
+        )
+        self.assertFalse(LinearConcentration.applies(self.kpy))
+        self.kpy.parameters.cstr = True
+        self.assertFalse(LinearConcentration.applies(self.kpy))
+
+    def test_solver(self):
+        strategy = LinearConcentration(self.kpy).solver()
+        (k1f, k2f), (k1b, k2b) = self.kpy.experimental_part
+        theta = (k1f * 2.0 + k2b * 0.5) / (k1f * 2.0 + k1b + k2f + k2b * 0.5)
+        np.testing.assert_allclose(strategy.theta[:, 0], theta)
+        np.testing.assert_allclose(strategy.nu[:, 0], strategy.nu[:, 1])
+        np.testing.assert_allclose(
+            strategy.forward[0], [k1f * 2.0 * (1 - theta), k2f * theta]
+        )
+
+    def test_singular(self):
+        static = StaticConcentration(self.kpy).solver()
+        with patch.object(np.linalg, "solve", side_effect=np.linalg.LinAlgError):
+            strategy = LinearConcentration(self.kpy).solver()
+        self.kpy.writer.logger.warning.assert_called_once()
+        np.testing.assert_allclose(strategy.theta, static.theta)
+        np.testing.assert_allclose(strategy.j, static.j)
+
+    def test_tutorial(self):
+        kpy = tutorial("Moore2013Oxygen")
+        self.assertTrue(LinearConcentration.applies(kpy))
+        linear = LinearConcentration(kpy).solver()
+        static = StaticConcentration(kpy).solver()
+        np.testing.assert_allclose(linear.theta, static.theta, atol=1e-12)
+        np.testing.assert_allclose(linear.j, static.j, rtol=1e-5)
+        np.testing.assert_allclose(linear.nu, static.nu, rtol=1e-5)
+        np.testing.assert_allclose(
+            linear.fval, 0.0, atol=1e-12 * np.max(linear.forward + linear.backward)
+        )
+
+        calculator = Calculator(kpy)
+        self.assertIsInstance(calculator.strategy, LinearConcentration)
+        self.writer.message.assert_any_call("Strategy: LinearConcentration")
+
+
+if __name__ == "__main__":
+    unittest.main()
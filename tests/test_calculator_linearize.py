@@ -0,0 +1,86 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Calculator, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock
+from melektrodica import Collector, Kpynetic
+from melektrodica.calculator import StaticConcentration
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+class TestLinearize(unittest.TestCase):
+    """
+    Unit test class for the analytic linearization of the steady state, compared with
+    finite differences on the hydrogen tutorial.
+    """
+
+    def setUp(self):
+        self.potential = np.linspace(0.05, 0.5, 10)
+        self.strategy = self.solve()
+        self.strategy.linearize()
+
+    def solve(self, reaction=None, step=0.0):
+        kpy = tutorial("Wang2007Hydrogen")
+        kpy.data.parameters.potential = self.potential
+        if reaction is not None:
+            kpy.experimental_part = kpy.experimental_part.copy()
+            kpy.experimental_part[0, reaction] *= np.exp(step)
+        return StaticConcentration(kpy).solver()
+
+    def test_linearize(self):
+        h = 1e-6
+        for i in [0, 5, 9]:
+            x = self.strategy.state[i]
+            dfdx = np.zeros((len(x), len(x)))
+            for k in range(len(x)):
+                dx = np.zeros(len(x))
+                dx[k] = h
+                dfdx[:, k] = (
+                        self.strategy.steady_state(x + dx, self.potential[i])
+                        - self.strategy.steady_state(x - dx, self.potential[i])
+                ) / (2 * h)
+            np.testing.assert_allclose(
+                self.strategy.dfdx[i], dfdx, atol=1e-8 * np.max(np.abs(dfdx))
+            )
+            np.testing.assert_allclose(
+                self.strategy.jacobian(x, self.potential[i]), self.strategy.dfdx[i]
+            )
+
+    def test_sensitivity(self):
+        h = 1e-5
+        n = len(self.strategy.reactions.list)
+        dlnkf = np.broadcast_to(np.eye(n), (len(self.potential), n, n))
+        dlnkb = np.zeros_like(dlnkf)
+        dx, _ = self.strategy.sensitivity(dlnkf, dlnkb)
+        dj = self.strategy.current_sensitivity(dlnkf, dlnkb)
+        for r in range(n):
+            upper, lower = self.solve(r, h), self.solve(r, -h)
+            state = (upper.state - lower.state) / (2 * h)
+            j = (upper.j - lower.j) / (2 * h)
+            np.testing.assert_allclose(
+                dx[:, :, r], state, atol=1e-6 * np.max(np.abs(state))
+            )
+            np.testing.assert_allclose(dj[:, r], j, atol=1e-6 * np.max(np.abs(j)))
+
+
+if __name__ == "__main__":
+    unittest.main()
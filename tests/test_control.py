@@ -0,0 +1,74 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        RateControl, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, RateControl
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name, n_points=10):
+    """
+    Kinetic model of a tutorial mechanism on a coarse sweep of its upper potential
+    window, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    potential = data.parameters.potential
+    data.parameters.potential = potential[
+        np.linspace(len(potential) // 2, len(potential) - 1, n_points).astype(int)
+    ]
+    return Kpynetic(data, writer=writer)
+
+
+class TestRateControl(unittest.TestCase):
+    """
+    Unit test class for the degrees of rate control, compared with perturbed sweeps of
+    the forward and backward rate constants of the ethanol tutorial.
+    """
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.control = RateControl(tutorial("SanchezMonreal2017Ethanol"))
+
+    def test_sum_rule(self):
+        np.testing.assert_allclose(np.sum(self.control.rate_control, axis=1), 1.0)
+        wang = RateControl(tutorial("Wang2007Hydrogen"))
+        np.testing.assert_allclose(np.sum(wang.rate_control, axis=1), 1.0)
+
+    def test_finite_differences(self):
+        h = 1e-5
+        dlnkf, dlnkb = self.control.perturbations()
+        control = np.hstack([self.control.rate_control, self.control.thermodynamic])
+        for p in range(dlnkf.shape[1]):
+            log_j = []
+            for step in [h, -h]:
+                kpy = tutorial("SanchezMonreal2017Ethanol")
+                kpy.experimental_part = kpy.experimental_part * np.exp(
+                    step * np.vstack([dlnkf[:, p], dlnkb[:, p]])
+                )
+                strategy = type(self.control.strategy)(kpy).solver()
+                log_j.append(np.log(np.abs(strategy.j)))
+            np.testing.assert_allclose(
+                control[:, p], (log_j[0] - log_j[1]) / (2 * h), atol=1e-4
+            )
+
+    def test_report(self):
+        lines = self.control.report().splitlines()
+        self.assertEqual(len(lines), len(self.control.potential) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,297 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Coordinator, Unit test
+
+"""
+
+import os
+import unittest
+import networkx as nx
+import numpy as np
+from unittest.mock import MagicMock
+from melektrodica import Collector, Coordinator, Kpynetic
+from melektrodica.constants import k_B, h
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Coordinator of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Coordinator(Kpynetic(data, writer=writer))
+
+
+class TestEnergySpan(unittest.TestCase):
+    """
+    Unit test class for the batched energy profiles and the energetic span.
+    """
+
+    class MockParameters:
+        def __init__(self):
+            self.temperature = 298.15
+            self.anode = True
+            self.pre_exponential = 1e3
+            self.js = False
+            self.tst = False
+            self.experimental = True
+            self.thermochemical = False
+
+    class MockReactions:
+        def __init__(self):
+            self.list = ["a", "b", "c"]
+            self.k_f = np.ones(3)
+            self.k_b = np.ones(3)
+            self.ne = np.array([1.0, 0.0, 0.0])
+            self.beta = np.array([0.5, 0.5, 0.5])
+
+    class MockData:
+        def __init__(self):
+            self.parameters = TestEnergySpan.MockParameters()
+            self.reactions = TestEnergySpan.MockReactions()
+            self.species = MagicMock()
+
+    def setUp(self):
+        kpy = Kpynetic(self.MockData(), writer=MagicMock())
+        kpy.thermochemical_part = np.array([[0.8, 0.4, 0.2], [0.5, 1.0, 0.5]])
+        self.coordinator = Coordinator(kpy)
+        self.sigma = np.array([[1.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        self.pathways = [["a", "b"], ["c"]]
+
+    def test_energy_profiles(self):
+        energies = self.coordinator.energy_profiles(
+            self.sigma, self.pathways, [0.0, 0.4]
+        )
+        np.testing.assert_allclose(energies[0, 0], [0.0, 0.8, 0.3, 0.7, -0.3])
+        np.testing.assert_allclose(energies[0, 1], [0.0, 0.6, -0.1, 0.3, -0.7])
+        np.testing.assert_allclose(energies[1, 0, :3], [0.0, 0.2, -0.3])
+        self.assertTrue(np.all(np.isnan(energies[1, :, 3:])))
+
+    def test_energy_span(self):
+        span, tdts, tdi, tof = self.coordinator.energy_span(
+            self.sigma, self.pathways, [0.0]
+        )
+        np.testing.assert_allclose(span[:, 0], [0.8, 0.2])
+        np.testing.assert_array_equal(tdts[:, 0], [0, 0])
+        np.testing.assert_array_equal(tdi[:, 0], [0, 0])
+
+        kT = k_B * 298.15
+        exponents = np.array([0.8, 0.2, 0.7, 0.4])
+        expected = kT / h * (1 - np.exp(-0.3 / kT)) / np.sum(np.exp(exponents / kT))
+        self.assertAlmostEqual(tof[0, 0] / expected, 1.0)
+
+    def test_tutorial(self):
+        coordinator = tutorial("Wang2007Hydrogen")
+        paths, pathways = coordinator.shortest_paths("H2", "H+")
+        sigma = coordinator.pathway_sigma(paths, pathways)
+        potentials = np.array([-0.1, 0.0, 0.2, 0.5])
+        energies = coordinator.energy_profiles(sigma, pathways, potentials)
+        span, tdts, tdi, tof = coordinator.energy_span(sigma, pathways, potentials)
+        kT = k_B * coordinator.data.parameters.temperature
+        for p, reactions in enumerate(pathways):
+            steps = [coordinator.data.reactions.list.index(r) for r in reactions]
+            for e, potential in enumerate(potentials):
+                dg = coordinator.Kpy.get_argument(potential)[:, steps] * sigma[p, steps]
+                levels = np.concatenate([[0.0], np.cumsum(dg[0] - dg[1])])
+                np.testing.assert_allclose(energies[p, e, 0::2], levels, atol=1e-12)
+                np.testing.assert_allclose(
+                    energies[p, e, 1::2], levels[:-1] + dg[0], atol=1e-12
+                )
+                exponents = np.array([
+                    [dg[0, i] + levels[i] - levels[j] + (levels[-1] if i < j else 0.0)
+                     for j in range(len(steps))]
+                    for i in range(len(steps))
+                ])
+                i, j = np.unravel_index(np.argmax(exponents), exponents.shape)
+                self.assertAlmostEqual(span[p, e], exponents[i, j])
+                self.assertEqual((tdts[p, e], tdi[p, e]), (i, j))
+                expected = (
+                        kT / h * -np.expm1(levels[-1] / kT)
+                        / np.sum(np.exp(exponents / kT))
+                )
+                np.testing.assert_allclose(tof[p, e], expected, rtol=1e-10)
+
+
+class TestPaths(unittest.TestCase):
+    """
+    Unit test class for the best-first enumeration of the pathways, compared with
+    every simple path of the stoichiometric graph.
+    """
+
+    def setUp(self):
+        self.coordinator = tutorial("SanchezMonreal2017Ethanol")
+        self.data = self.coordinator.data
+        self.source, self.target = "CH3CH2OH", "CO2"
+
+    def graphe(self):
+        return self.coordinator.stoichiometric_graphe(
+            self.data.reactions.upsilon_c, self.data.species.list, self.data.reactions.list
+        )
+
+    def all_paths(self, cost):
+        graphe = self.graphe()
+        paths = self.coordinator.get_paths(graphe, self.source, self.target)
+        pathways = self.coordinator.get_pathways(graphe, paths)
+        index = {reaction: i for i, reaction in enumerate(self.data.reactions.list)}
+        return [
+            (tuple(nodes), tuple(reactions), sum(cost[index[r]] for r in reactions))
+            for nodes, reactions in zip(paths, pathways)
+        ]
+
+    def test_order(self):
+        rng = np.random.default_rng(0)
+        for weights in [None, rng.uniform(0.1, 1.0, len(self.data.reactions.list))]:
+            cost = self.coordinator.reaction_weights(weights)
+            found = list(self.coordinator.iter_paths(self.source, self.target, weights))
+            costs = [g for _, _, g in found]
+            self.assertEqual(costs, sorted(costs))
+            for _, reactions, g in found:
+                self.assertAlmostEqual(g, sum(
+                    cost[self.data.reactions.list.index(r)] for r in reactions
+                ))
+            expected = self.all_paths(cost)
+            self.assertEqual(
+                sorted((tuple(n), tuple(r)) for n, r, _ in found),
+                sorted((n, r) for n, r, _ in expected),
+            )
+
+    def test_max_length(self):
+        paths, pathways = self.coordinator.shortest_paths(
+            self.source, self.target, max_length=4
+        )
+        expected = [r for _, r, _ in self.all_paths(np.ones(11)) if len(r) <= 4]
+        self.assertEqual(len(expected), 4)
+        self.assertEqual(sorted(map(tuple, pathways)), sorted(expected))
+        paths, pathways = self.coordinator.shortest_paths(self.source, self.target, k=2)
+        self.assertEqual(len(pathways), 2)
+        self.assertLessEqual(len(pathways[0]), len(pathways[1]))
+
+    def test_parallel_edges(self):
+        coordinator = tutorial("Wang2007Hydrogen")
+        paths, pathways = coordinator.shortest_paths("H2", "H+")
+        self.assertEqual(paths, [["H2", "H*", "H+"], ["H2", "H*", "H+"]])
+        self.assertEqual(sorted(pathways), [["DA", "OD"], ["OA", "OD"]])
+        paths, pathways = coordinator.shortest_paths(
+            "H2", "H+", weights=np.array([3.0, 1.0, 1.0])
+        )
+        self.assertEqual(pathways, [["OA", "OD"], ["DA", "OD"]])
+        np.testing.assert_array_equal(
+            coordinator.pathway_sigma(paths, pathways), [[0, 1, 1], [1, 0, 2]]
+        )
+
+    def test_pathway_sigma(self):
+        graphe = self.graphe()
+        paths = self.coordinator.get_paths(graphe, self.source, self.target)
+        pathways = self.coordinator.get_pathways(graphe, paths)
+        np.testing.assert_array_equal(
+            self.coordinator.pathway_sigma(paths, pathways),
+            self.coordinator.get_sigma(graphe, paths, self.data.reactions.list),
+        )
+
+    def test_given_graph(self):
+        found = list(self.coordinator.iter_paths(self.source, self.target))
+        graphe = self.graphe()
+        graphe.remove_edges_from(
+            [(u, v, key) for u, v, key, reaction in graphe.edges(keys=True, data="reaction")
+             if reaction == "III"]
+        )
+        reduced = list(self.coordinator.iter_paths(self.source, self.target, graphe=graphe))
+        self.assertEqual(len(found), 6)
+        self.assertEqual(reduced, [path for path in found if "III" not in path[1]])
+        self.assertEqual(list(self.coordinator.iter_paths(self.source, self.target)), found)
+
+    def test_cache(self):
+        coordinator = tutorial("Wang2007Hydrogen")
+        coordinator.cache_size = 3
+        found = list(coordinator.iter_paths("H2", "H+", "energy", eta=0.0))
+        for eta in np.linspace(0.1, 1.0, 10):
+            next(coordinator.iter_paths("H2", "H+", "energy", eta=eta))
+        self.assertEqual(len(coordinator.cache), 3)
+        keys = list(coordinator.cache)
+        next(coordinator.iter_paths("H2", "H+", "energy", eta=0.8))
+        self.assertEqual(list(coordinator.cache), keys[1:] + keys[:1])
+        self.assertEqual(list(coordinator.iter_paths("H2", "H+", "energy")), found)
+        self.assertEqual(list(coordinator.cache)[:2], [keys[2], keys[0]])
+
+    def test_flux_weights(self):
+        np.testing.assert_allclose(
+            Coordinator.flux_weights([2.0, -1.0, 0.0]), [0.0, np.log(2), np.inf]
+        )
+        for rates in [[0.0, 0.0], [1.0, np.nan], [1.0, np.inf]]:
+            with self.assertRaises(ValueError):
+                Coordinator.flux_weights(rates)
+        with self.assertRaises(ValueError):
+            self.coordinator.reaction_weights(np.full(11, np.nan))
+
+
+class TestGraphe(unittest.TestCase):
+    """
+    Unit test class for the sparse construction of the stoichiometric graph, compared
+    with the construction reaction by reaction on the tutorials.
+    """
+
+    @staticmethod
+    def per_row_graphe(upsilon, species, reactions):
+        graphe = nx.MultiDiGraph()
+        species = np.array(species)
+        for i, row in enumerate(upsilon):
+            for reactant in species[np.flatnonzero(row < 0)]:
+                for product in species[np.flatnonzero(row > 0)]:
+                    graphe.add_edge(reactant, product, reaction=reactions[i])
+        return graphe
+
+    @staticmethod
+    def per_path_pathways(graphe, paths):
+        graphe = graphe.copy()
+        pathways = []
+        for nodes in paths:
+            pathways.append([])
+            for reactant, product in zip(nodes[:-1], nodes[1:]):
+                key, data = list(graphe[reactant][product].items())[-1]
+                pathways[-1].append(data["reaction"])
+                if key != 0:
+                    graphe.remove_edge(reactant, product, key=key)
+        return pathways
+
+    def test_tutorials(self):
+        for name in ["Wang2007Hydrogen", "Moore2013Oxygen", "SanchezMonreal2017Ethanol"]:
+            coordinator = tutorial(name)
+            species = coordinator.data.species
+            reactions = coordinator.data.reactions
+            upsilon = reactions.upsilon_c
+            args = (upsilon, species.list, reactions.list)
+            graphe = coordinator.stoichiometric_graphe(*args)
+            expected = self.per_row_graphe(*args)
+            self.assertEqual(
+                list(graphe.edges(keys=True, data="reaction")),
+                list(expected.edges(keys=True, data="reaction")),
+            )
+            for reactant, product, data in graphe.edges(data=True):
+                i = reactions.list.index(data["reaction"])
+                self.assertEqual(data["upsilon"], (
+                    upsilon[i, species.list.index(reactant)],
+                    upsilon[i, species.list.index(product)],
+                ))
+
+            for source in species.reactants:
+                for target in species.products:
+                    if source == target or not nx.has_path(expected, source, target):
+                        continue
+                    paths = coordinator.get_paths(graphe.copy(), source, target)
+                    self.assertEqual(
+                        paths, coordinator.get_paths(expected.copy(), source, target)
+                    )
+                    self.assertEqual(
+                        coordinator.get_pathways(graphe, paths),
+                        self.per_path_pathways(expected, paths),
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -83,6 +83,37 @@ class TestDataReactionsMarkdown(unittest.TestCase):
             "Thermochemical reactions parameters processed."
         )
 
+    @patch("melektrodica.collector.Collector.column_exists")
+    @patch("melektrodica.collector.Collector.raw_data")
+    def test_subset(self, mock_raw_data, mock_column_exists):
+        md_content = """
+        | id | Reactions                    |    Ga | Beta |
+        |----|------------------------------|------:|-----:|
+        | DA | 0.5O2 + Pt <->  O*           | 0.391 |  0.0 |
+        | RA | 0.5O2 + Pt + H+ + e- <-> OH* | 0.609 |  0.5 |
+        | RT | O* + H+ + e- <-> OH*         | 0.590 |  0.5 |
+        | RD | OH* + H+ + e- <-> H2O + Pt   | 0.278 |  0.5 |
+        """
+        mock_raw_data.return_value = self.parse_markdown_table(md_content)
+        self.parameters.thermochemical = True
+        self.species.list = ["O2", "H+", "H2O", "O*", "OH*", "Pt", "e-"]
+        self.species.catalyst = ["Pt"]
+        self.species.adsorbed = ["O*", "OH*"]
+        reactions = DataReactions(
+            "test_reaction_file.md", self.parameters, self.species, self.writer
+        )
+        subset = reactions.subset(
+            [False, True, False, True], [True, True, True, False, True, True]
+        )
+        self.assertEqual(subset.list, ["RA", "RD"])
+        np.testing.assert_array_equal(subset.ga, [0.609, 0.278])
+        np.testing.assert_array_equal(subset.ne, [-1.0, -1.0])
+        np.testing.assert_array_equal(
+            subset.upsilon, [[-0.5, -1.0, 0.0, 1.0, -1.0], [0.0, -1.0, 1.0, -1.0, 1.0]]
+        )
+        np.testing.assert_array_equal(subset.upsilonx, [[1.0], [-1.0]])
+        self.assertEqual(len(reactions.list), 4)
+
     def test_process_reaction_valid(self):
         side = "0.5O2 + Pt"
         species_list = self.species.list
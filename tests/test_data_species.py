@@ -159,6 +159,36 @@ class TestDataSpecies(unittest.TestCase):
 
         self.assertIn("Species file not found", str(context.exception))
 
+    @patch("melektrodica.collector.Collector.raw_data")
+    def test_subset(self, mock_raw_data):
+        """
+        Test the restriction of the species data to some adsorbed species.
+        """
+        mock_raw_data.return_value = (
+            ["Species", "RPACe", "DG_formation", "c0", "Catalyst"],
+            np.array(
+                [
+                    ["O2", "R", 0.0, 0.5307, ""],
+                    ["H+", "R", 0.0, 1.0, ""],
+                    ["H2O", "P", 0.0, 1.0, ""],
+                    ["O*", "A", -0.343, "", "Pt"],
+                    ["OH*", "A", -0.376, "", "Pt"],
+                    ["Pt", "C", "", "", ""],
+                    ["e-", "e", "", "", ""],
+                ]
+            ),
+        )
+        species = DataSpecies(
+            self.mock_species_file, self.mock_parameters, self.mock_writer
+        )
+        subset = species.subset([False, True])
+        self.assertEqual(subset.adsorbed, ["OH*"])
+        self.assertEqual(subset.list, ["O2", "H+", "H2O", "OH*", "Pt", "e-"])
+        np.testing.assert_array_equal(subset.ns_catalyst, [[1.0]])
+        np.testing.assert_array_equal(subset.g_formation_ads, [-0.376])
+        np.testing.assert_array_equal(subset.c0_reactants, species.c0_reactants)
+        self.assertEqual(species.adsorbed, ["O*", "OH*"])
+        self.assertEqual(species.ns_catalyst.shape, (1, 2))
 
 if __name__ == "__main__":
     unittest.main()
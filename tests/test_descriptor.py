@@ -0,0 +1,87 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Descriptor, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Descriptor
+from melektrodica.calculator import StaticConcentration
+from melektrodica.constants import k_B
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+POTENTIAL = np.linspace(0.1, 1.0, 8)
+
+
+def tutorial(potential=POTENTIAL, temperature=None, c0=None):
+    """
+    Kinetic model of the ethanol tutorial at given conditions, logging to a mock
+    writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, "SanchezMonreal2017Ethanol"), writer=writer)
+    data.parameters.potential = potential
+    if temperature is not None:
+        data.parameters.temperature = temperature
+    if c0 is not None:
+        n = len(data.species.c0_reactants)
+        data.species.c0_reactants, data.species.c0_products = c0[:n], c0[n:]
+    return Kpynetic(data, writer=writer)
+
+
+def log_current(**conditions):
+    return np.log(np.abs(StaticConcentration(tutorial(**conditions)).solver().j))
+
+
+class TestDescriptor(unittest.TestCase):
+    """
+    Unit test class for the kinetic descriptors, compared with finite differences of
+    the polarization curve of the ethanol tutorial.
+    """
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.descriptor = Descriptor(tutorial())
+
+    def test_tafel_slope(self):
+        h = 1e-5
+        dlnj = (log_current(potential=POTENTIAL + h)
+                - log_current(potential=POTENTIAL - h)) / (2 * h)
+        np.testing.assert_allclose(self.descriptor.dlogj, dlnj / np.log(10), rtol=1e-6)
+        np.testing.assert_allclose(self.descriptor.tafel_slope, np.log(10) / dlnj, rtol=1e-6)
+
+    def test_reaction_orders(self):
+        species = self.descriptor.species
+        c0 = np.concatenate([species.c0_reactants, species.c0_products]).astype(float)
+        h = 1e-3
+        for k in np.flatnonzero(c0):
+            upper, lower = c0.copy(), c0.copy()
+            upper[k] *= np.exp(h)
+            lower[k] *= np.exp(-h)
+            order = (log_current(c0=upper) - log_current(c0=lower)) / (2 * h)
+            np.testing.assert_allclose(self.descriptor.orders[:, k], order, atol=1e-6)
+        np.testing.assert_array_equal(self.descriptor.orders[:, c0 == 0], 0.0)
+
+    def test_activation_energy(self):
+        T = self.descriptor.operation.temperature
+        h = 1e-6
+        energy = -k_B * (
+                log_current(temperature=1 / (1 / T + h))
+                - log_current(temperature=1 / (1 / T - h))
+        ) / (2 * h)
+        np.testing.assert_allclose(
+            self.descriptor.activation_energy, energy, rtol=1e-5, atol=1e-7
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
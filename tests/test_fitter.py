@@ -0,0 +1,230 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Fitter, Unit test
+
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import numpy as np
+from scipy.optimize import OptimizeResult
+from scipy.stats import qmc
+from melektrodica import Collector, Kpynetic, Fitter, Dataset
+from melektrodica.calculator import StaticConcentration
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+def initial_fit(fitter, *args, **kwargs):
+    """
+    Stand-in for the optimizer, the fit stays at the initial parameters.
+    """
+    return OptimizeResult(x=fitter.p_all[fitter.index])
+
+
+class TestFitter(unittest.TestCase):
+    """
+    Unit test class for the objective functions of the Fitter on the hydrogen
+    tutorial, with synthetic data from the model itself.
+    """
+
+    def setUp(self):
+        for target in ["melektrodica.calculator.Writer", "melektrodica.fitter.Writer"]:
+            patcher = patch(target, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(Fitter, "display_error_evolution")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.kpy = tutorial("Wang2007Hydrogen")
+        self.potential = np.linspace(0.05, 0.5, 10)
+        self.kpy.data.parameters.potential = self.potential
+        self.j_data = np.abs(StaticConcentration(self.kpy).solver().j)
+
+    def fitter(self, **kwargs):
+        with patch.object(Fitter, "fit_energies", autospec=True, side_effect=initial_fit):
+            return Fitter(self.kpy, self.potential, self.j_data, **kwargs)
+
+    def test_bounded_threshold(self):
+        fitter = self.fitter()
+        x_true = fitter.p_all[fitter.index]
+        x_bad = fitter.bounds.lb
+        error = fitter.object(x_bad)
+        self.assertLess(fitter.object(x_true), 1e-12)
+
+        fitter.bounded = "worst"
+        self.assertEqual(fitter.object(x_bad), error)
+        self.assertEqual(fitter.n_aborted, 0)
+
+        fitter.population_energies = np.array([error / 100, np.inf])
+        penalty = fitter.object(x_bad)
+        self.assertEqual(fitter.n_aborted, 1)
+        self.assertLess(fitter.strategy.n_solved, len(fitter.model_potential))
+        self.assertGreater(penalty, error / 100)
+        self.assertLess(fitter.object(x_true), 1e-12)
+        self.assertEqual(fitter.n_aborted, 1)
+
+        fitter.bounded = "best"
+        fitter.bound_factor = 1e6
+        self.assertAlmostEqual(fitter.object(x_bad), error)
+
+    def test_decimated_stage(self):
+        fitter = self.fitter(schedule=[(3, 5)])
+        x = fitter.p_all[fitter.index]
+        fitter.set_grid(3)
+        np.testing.assert_array_equal(fitter.grid, [0, 3, 6, 9])
+        self.assertEqual(len(fitter.current_energies(x)), 4)
+        self.assertLess(fitter.object(x), 1e-12)
+        fitter.set_grid(1)
+        self.assertEqual(len(fitter.current_energies(x)), 10)
+
+    def test_resume(self):
+        j_data = 1.2 * self.j_data
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "fit")
+            fitter = Fitter(
+                self.kpy, self.potential, j_data, schedule=[(1, 3)],
+                checkpoint=path, checkpoint_interval=2, rng=7,
+            )
+            with np.load(path + ".npz") as checkpoint:
+                self.assertEqual(int(checkpoint["generation"]), 2)
+                saved = checkpoint["error_evolution"].tolist()
+            resumed = Fitter(
+                self.kpy, self.potential, j_data, schedule=[(1, 3)],
+                resume=path + ".npz", rng=1,
+            )
+        seeded = Fitter(self.kpy, self.potential, j_data, schedule=[(1, 3)], rng=7)
+        np.testing.assert_array_equal(resumed.g_fit.x, fitter.g_fit.x)
+        np.testing.assert_array_equal(seeded.g_fit.x, fitter.g_fit.x)
+        self.assertEqual(resumed.error_evolution[: len(saved)], saved)
+
+    def test_bayesian(self):
+        fitter = Fitter(
+            self.kpy, self.potential, 1.2 * self.j_data,
+            optimizer="bayesian", max_evaluations=12, workers=2, rng=3,
+        )
+        result = fitter.g_fit
+        self.assertEqual(result.nfev, 12)
+        self.assertEqual(result.x_evaluated.shape, (12, len(fitter.index)))
+        self.assertEqual(result.fun, np.min(result.fun_evaluated))
+        self.assertEqual(len(fitter.error_evolution), 12)
+        for x, error in zip(result.x_evaluated[-2:], result.fun_evaluated[-2:]):
+            self.assertAlmostEqual(fitter.object(x) / error, 1.0)
+
+    def test_multistart(self):
+        fits = []
+        for workers in [1, 2]:
+            fitter = self.fitter(optimizer="multistart", n_starts=4, workers=workers, rng=0)
+            fitter.error_evolution = []
+            fits.append((fitter, fitter.fit_multistart()))
+        (fitter, result), (parallel, parallel_result) = fits
+
+        lb, ub = fitter.bounds.lb, fitter.bounds.ub
+        u = qmc.Sobol(d=len(lb), seed=np.random.default_rng(0)).random_base2(2)
+        np.testing.assert_allclose(result.starts, lb + u * (ub - lb))
+        self.assertTrue(np.all(np.diff(result.fun_minima) >= 0))
+        np.testing.assert_array_equal(result.x, result.minima[0])
+        width = ub - lb
+        for i in range(len(result.minima)):
+            for k in range(i):
+                self.assertTrue(np.any(
+                    np.abs(result.minima[i] - result.minima[k]) > 1e-3 * width
+                ))
+        self.assertEqual(len(fitter.error_evolution), result.nfev)
+        # every start reaches the generating parameters, merged into one minimum
+        self.assertEqual(len(result.minima), 1)
+        np.testing.assert_allclose(
+            result.x, fitter.p_all[fitter.index], atol=1e-3 * np.max(width)
+        )
+
+        np.testing.assert_allclose(parallel_result.starts, result.starts)
+        np.testing.assert_allclose(parallel_result.minima, result.minima)
+        np.testing.assert_allclose(parallel_result.fun_minima, result.fun_minima)
+        self.assertEqual(parallel_result.nfev, result.nfev)
+        np.testing.assert_allclose(parallel.error_evolution, fitter.error_evolution)
+
+        fitter.rng = np.random.default_rng(1)
+        result = fitter.fit_multistart(sampling="latinhypercube")
+        self.assertEqual(len(result.starts), 4)
+        self.assertTrue(np.all((result.starts >= lb) & (result.starts <= ub)))
+        with self.assertRaises(ValueError):
+            fitter.fit_multistart(sampling="grid")
+
+    def test_parallel_datasets(self):
+        datasets = [
+            Dataset(self.potential, 1.2 * self.j_data),
+            Dataset(self.potential, 0.8 * self.j_data, temperature=320.0),
+            Dataset(self.potential, np.full(10, 0.5), observable="H*"),
+        ]
+        fitter = self.fitter(datasets=datasets, workers=2)
+        x = fitter.p_all[fitter.index]
+        try:
+            for stride in [1, 3]:
+                fitter.set_grid(stride)
+                serial = fitter.residuals(x)
+                fitter.start_pool()
+                np.testing.assert_allclose(fitter.residuals(x), serial, rtol=1e-12)
+                fitter.executor.shutdown()
+                fitter.executor = None
+        finally:
+            if fitter.executor is not None:
+                fitter.executor.shutdown()
+
+    def test_dataset_strategy(self):
+        fitter = self.fitter(datasets=[Dataset(self.potential, self.j_data)])
+        self.assertIsInstance(fitter.datasets[0].strategy, StaticConcentration)
+        messages = [call.args[0] for call in fitter.writer.message.call_args_list]
+        self.assertTrue(any("strategy StaticConcentration" in m for m in messages))
+
+    def test_signed_data(self):
+        fitter = self.fitter(residual="log")
+        x = fitter.p_all[fitter.index] + 0.01
+        for residual in ["relative", "log"]:
+            fitter.residual = residual
+            error = fitter.object(x)
+            r = fitter.residual_vector(x)
+            fitter.j_data = -self.j_data
+            self.assertAlmostEqual(fitter.object(x) / error, 1.0)
+            np.testing.assert_allclose(fitter.residual_vector(x), r)
+            self.assertAlmostEqual(np.sum(r ** 2) / error, 1.0)
+            fitter.j_data = self.j_data
+
+    def test_negative_dataset(self):
+        datasets = [
+            Dataset(self.potential, -self.j_data),
+            Dataset(self.potential, self.j_data, name="anodic"),
+        ]
+        fitter = self.fitter(datasets=datasets)
+        x = fitter.p_all[fitter.index]
+        for stride in [1, 3]:
+            fitter.set_grid(stride)
+            np.testing.assert_allclose(
+                fitter.residuals(x), 0.0, atol=1e-8 * np.max(fitter.dataset_scales)
+            )
+        self.assertTrue(np.all(fitter.dataset_scales > 0))
+
+    def test_joint_options(self):
+        datasets = [Dataset(self.potential, self.j_data)]
+        for option in [{"residual": "log"}, {"weights": np.ones(10)}, {"model_grid": 20}]:
+            with self.assertRaises(ValueError):
+                self.fitter(datasets=datasets, **option)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Impedance, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Impedance
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name, potential=None):
+    """
+    Kinetic model of a tutorial mechanism on a coarse sweep of its upper potential
+    window, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    if potential is None:
+        potential = data.parameters.potential
+        potential = potential[
+            np.linspace(len(potential) // 2, len(potential) - 1, 6).astype(int)
+        ]
+    data.parameters.potential = potential
+    return Kpynetic(data, writer=writer)
+
+
+class TestImpedance(unittest.TestCase):
+    """
+    Unit test class for the impedance spectra of the hydrogen anode and the oxygen
+    cathode tutorials.
+    """
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_zero_frequency(self):
+        h = 1e-6
+        for name, electrode in [("Wang2007Hydrogen", 1.0), ("Moore2013Oxygen", -1.0)]:
+            kpy = tutorial(name)
+            self.assertEqual(kpy.electrode, electrode)
+            impedance = Impedance(kpy, [1e-8, 1.0, 1e8], capacitance=2e-5, resistance=0.5)
+            resistance = impedance.polarization_resistance()
+            strategy = type(impedance.strategy)
+            potential = impedance.potential
+            dj = (
+                    strategy(tutorial(name, potential + h)).solver().j
+                    - strategy(tutorial(name, potential - h)).solver().j
+            ) / (2 * h)
+            self.assertTrue(np.all(resistance > 0))
+            np.testing.assert_allclose(resistance, 1 / (electrode * dj), rtol=1e-7)
+            np.testing.assert_allclose(impedance.faradaic[:, 0], resistance, rtol=1e-8)
+            np.testing.assert_allclose(
+                impedance.impedance[:, 0], 0.5 + resistance, rtol=1e-8
+            )
+            np.testing.assert_allclose(impedance.impedance[:, -1], 0.5, atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
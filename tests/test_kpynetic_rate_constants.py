@@ -0,0 +1,113 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Kpynetic, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock
+from melektrodica import Collector, Kpynetic
+from melektrodica.constants import k_B
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+class TestRateConstants(unittest.TestCase):
+    """
+    Unit test class for the cached rate constants of Kpynetic.
+    """
+
+    class MockParameters:
+        def __init__(self):
+            self.temperature = 298.15
+            self.anode = True
+            self.pre_exponential = 1e3
+            self.js = False
+            self.tst = False
+            self.experimental = True
+            self.thermochemical = False
+
+    class MockReactions:
+        def __init__(self):
+            self.list = ["R1", "R2"]
+            self.k_f = np.array([2.0, 0.5])
+            self.k_b = np.array([1.0, 1.0])
+            self.ne = np.array([1.0, 0.0])
+            self.beta = np.array([0.5, 0.5])
+
+    class MockData:
+        def __init__(self):
+            self.parameters = TestRateConstants.MockParameters()
+            self.reactions = TestRateConstants.MockReactions()
+            self.species = MagicMock()
+
+    def setUp(self):
+        self.kpy = Kpynetic(self.MockData(), writer=MagicMock())
+        self.kpy.thermochemical_part = np.array([[0.4, 0.3], [0.5, 0.1]])
+
+    def expected(self, kpy, potential):
+        electronic = kpy.electrode * kpy.electronic(
+            potential, kpy.reactions.ne, kpy.reactions.beta
+        )
+        return (
+                kpy.pre_exp
+                * kpy.experimental_part
+                * np.exp(-(kpy.thermochemical_part + electronic)
+                         / k_B / kpy.parameters.temperature)
+        )
+
+    def test_rate_constants(self):
+        for potential in [0.0, 0.1, 0.1, 0.3]:
+            np.testing.assert_allclose(
+                self.kpy.rate_constants(potential), self.expected(self.kpy, potential)
+            )
+
+    def test_replaced_parts(self):
+        kpy = self.kpy
+        kpy.rate_constants(0.2)
+        kpy.thermochemical_part = np.array([[0.2, 0.3], [0.6, 0.1]])
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+        kpy.reactions.beta = np.array([0.3, 0.5])
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+        kpy.parameters.temperature = 350.0
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+
+    def test_modified_parts(self):
+        kpy = self.kpy
+        kpy.rate_constants(0.2)
+        kpy.experimental_part[0, 1] = 4.0
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+        kpy.thermochemical_part[1, 0] = 0.7
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+        kpy.reactions.beta[0] = 0.4
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+        kpy.pre_exp = 2e3
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+        kpy.electrode = -1.0
+        np.testing.assert_allclose(kpy.rate_constants(0.2), self.expected(kpy, 0.2))
+
+    def test_get_arguments(self):
+        potentials = np.array([-0.2, 0.0, 0.3])
+        expected = [self.kpy.get_argument(potential).copy() for potential in potentials]
+        np.testing.assert_allclose(self.kpy.get_arguments(potentials), expected)
+
+    def test_tutorial(self):
+        writer = MagicMock()
+        data = Collector(os.path.join(EXAMPLES, "Wang2007Hydrogen"), writer=writer)
+        kpy = Kpynetic(data, writer=writer)
+        for potential in [0.0, 0.25, 0.25, 0.5]:
+            np.testing.assert_allclose(
+                kpy.rate_constants(potential), self.expected(kpy, potential)
+            )
+        kpy.thermochemical_part[0] += 0.05
+        np.testing.assert_allclose(kpy.rate_constants(0.5), self.expected(kpy, 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -89,6 +89,22 @@ class TestReactionRate(unittest.TestCase):
         result = self.reaction_rate.power_law(concentration, upsilon)
         np.testing.assert_array_almost_equal(result, expected_result, decimal=6)
 
+    def test_rate_jacobian(self):
+        k_rate = np.array([[2.0, 0.5], [0.3, 4.0]])
+        concentration = np.array([0.7, 0.0, 0.4, 0.9])
+        upsilon = np.array([[-1.0, 1.0, -2.0, 0.0], [0.0, -1.0, 1.0, 1.0]])
+
+        def nu(c):
+            return np.sum(k_rate * self.reaction_rate.power_law(c, upsilon), axis=0)
+
+        expected_result = np.zeros((2, 4))
+        for j in range(4):
+            dc = np.zeros(4)
+            dc[j] = 1e-6
+            expected_result[:, j] = (nu(concentration + dc) - nu(concentration - dc)) / 2e-6
+        result = self.reaction_rate.rate_jacobian(k_rate, concentration, upsilon)
+        np.testing.assert_array_almost_equal(result, expected_result, decimal=6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Pruner, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Pruner
+from melektrodica.calculator import StaticConcentration
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+class TestPruner(unittest.TestCase):
+    """
+    Unit test class for the flux-based reduction of the ethanol tutorial.
+    """
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.kpy = tutorial("SanchezMonreal2017Ethanol")
+        self.pruner = Pruner(self.kpy, tolerance=1e-2)
+
+    def test_evaluate(self):
+        pruner = self.pruner
+        nu = pruner.results.nu
+        upsilon = np.column_stack([pruner.reactions.upsilon_c, pruner.reactions.ne])
+        contribution = np.zeros(len(pruner.reactions.list))
+        for n in range(len(nu)):
+            for k in range(upsilon.shape[1]):
+                flux = np.abs(upsilon[:, k] * nu[n])
+                if flux.sum() > 0:
+                    contribution = np.maximum(contribution, flux / flux.sum())
+        np.testing.assert_allclose(pruner.contribution, contribution)
+
+        ranking = np.argsort(pruner.contribution)
+        self.assertEqual(pruner.reactions.list[ranking[0]], "2")
+        self.assertLess(pruner.contribution[ranking[0]], 1e-5)
+        self.assertTrue(np.all(pruner.contribution[ranking[1:]] > 0.4))
+        self.assertEqual(len(pruner.intermediates), len(pruner.species.adsorbed))
+        self.assertTrue(np.all(pruner.intermediates > 0))
+
+    def test_prune(self):
+        pruner = self.pruner
+        np.testing.assert_array_equal(
+            np.array(pruner.reactions.list)[~pruner.kept], ["2"]
+        )
+        self.assertTrue(np.all(pruner.adsorbed))
+        self.assertLess(np.max(pruner.error), 1e-12)
+
+        pruner.prune(0.6)
+        self.assertEqual(
+            sorted(np.array(pruner.reactions.list)[~pruner.kept]),
+            sorted(["I", "II", "III", "2", "5", "7"]),
+        )
+        np.testing.assert_array_equal(
+            np.array(pruner.species.adsorbed)[~pruner.adsorbed], ["CH3CHOH*"]
+        )
+        self.assertEqual(pruner.model.species.adsorbed, ["CH3CO*", "CO*", "CH3*", "OH*"])
+        self.assertLess(np.max(pruner.error), 1e-9)
+
+    def test_reduce_model(self):
+        pruner = self.pruner
+        model = pruner.reduce_model(pruner.kept, pruner.adsorbed)
+        self.assertIsInstance(model, Kpynetic)
+        self.assertNotIn("2", model.reactions.list)
+        self.assertEqual(len(model.reactions.list), 10)
+        self.assertEqual(len(self.kpy.reactions.list), 11)
+        reduced = StaticConcentration(model).solver()
+        np.testing.assert_allclose(reduced.j, pruner.results.j, rtol=1e-5)
+        np.testing.assert_allclose(reduced.j, pruner.reduced.j)
+
+    def test_report(self):
+        lines = self.pruner.report().splitlines()
+        self.assertEqual(len(lines), 2 + 11 + 5)
+        index = self.pruner.reactions.list.index("2")
+        self.assertEqual(
+            lines[11].split(), ["2", f"{self.pruner.contribution[index]:.4e}", "no"]
+        )
+        self.assertEqual(lines[12].split(), ["Intermediate", "Contribution", "Kept"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Sampler, Unit test
+
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from scipy.optimize import Bounds, OptimizeResult
+from melektrodica import Collector, Kpynetic, Fitter
+from melektrodica.calculator import StaticConcentration
+from melektrodica.sampler import Sampler
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+def initial_fit(fitter, *args, **kwargs):
+    """
+    Stand-in for the optimizer, the fit stays at the initial parameters.
+    """
+    return OptimizeResult(x=fitter.p_all[fitter.index])
+
+
+class LinearFitter:
+    """
+    Stand-in for a fitted Fitter with the linear model j = a + b E.
+    """
+
+    def __init__(self):
+        rng = np.random.default_rng(1)
+        self.name = "linear"
+        self.writer = MagicMock()
+        self.potential = np.linspace(0.0, 1.0, 20)
+        self.j_data = 1.0 + 2.0 * self.potential + 0.01 * rng.standard_normal(20)
+        self.grid = np.arange(20)
+        self.datasets = []
+        self.bounds = Bounds(lb=[0.0, 0.0], ub=[3.0, 4.0])
+        self.g_fit = OptimizeResult(x=np.array([1.0, 2.0]))
+
+    def current_energies(self, x):
+        return x[0] + x[1] * self.potential[self.grid]
+
+    def residual_vector(self, x):
+        j_data = self.j_data[self.grid]
+        return (j_data - np.abs(self.current_energies(x))) / np.sqrt(j_data)
+
+
+class TestSampler(unittest.TestCase):
+    """
+    Unit test class for the bootstrap and ensemble samplers.
+    """
+
+    def setUp(self):
+        self.sampler = Sampler(LinearFitter())
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_bootstrap(self):
+        fname = os.path.join(self.directory, "bootstrap.npy")
+        samples = self.sampler.bootstrap(20, fname, seed=0)
+        self.assertEqual(samples.shape, (20, 2))
+        np.testing.assert_array_equal(np.load(fname), samples)
+        median, lower, upper = Sampler.intervals(samples)
+        np.testing.assert_allclose(median, [1.0, 2.0], atol=0.05)
+        self.assertTrue(np.all(lower <= median) and np.all(median <= upper))
+
+    def test_mcmc(self):
+        fname = os.path.join(self.directory, "chain.npy")
+        chain = self.sampler.mcmc(200, fname, n_walkers=8, seed=0)
+        self.assertEqual(chain.shape, (200, 8, 2))
+        self.assertEqual(np.load(fname[:-4] + "_logp.npy").shape, (200, 8))
+        self.assertTrue(np.all(self.sampler.acceptance > 0))
+        self.assertTrue(np.all((chain >= 0) & (chain <= np.array([3.0, 4.0]))))
+        median, lower, upper = Sampler.intervals(chain, burn=50)
+        np.testing.assert_allclose(median, [1.0, 2.0], atol=0.05)
+
+
+class TestSamplerTutorial(unittest.TestCase):
+    """
+    Unit test class for the bootstrap of a Fitter of the hydrogen tutorial, serial
+    and in a process pool.
+    """
+
+    def setUp(self):
+        for target in ["melektrodica.calculator.Writer", "melektrodica.fitter.Writer"]:
+            patcher = patch(target, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(Fitter, "display_error_evolution")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+        kpy = tutorial("Wang2007Hydrogen")
+        potential = np.linspace(0.05, 0.5, 10)
+        kpy.data.parameters.potential = potential
+        j_data = np.abs(StaticConcentration(kpy).solver().j)
+        with patch.object(Fitter, "fit_energies", autospec=True, side_effect=initial_fit):
+            self.fitter = Fitter(kpy, potential, j_data)
+
+    def test_bootstrap(self):
+        samples = []
+        for workers in [1, 2]:
+            sampler = Sampler(self.fitter, workers=workers)
+            fname = os.path.join(self.directory, f"bootstrap_{workers}.npy")
+            samples.append(np.array(sampler.bootstrap(4, fname, seed=0)))
+        self.assertEqual(samples[0].shape, (4, len(sampler.x_fit)))
+        np.testing.assert_allclose(samples[1], samples[0])
+        # the data are generated by the fitted energies, so every replicate is exact
+        np.testing.assert_allclose(
+            samples[0], np.tile(sampler.x_fit, (4, 1)), atol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
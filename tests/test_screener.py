@@ -0,0 +1,87 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Screener, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Screener
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+class TestScreener(unittest.TestCase):
+    """
+    Unit test class for the limiting potentials of the Screener.
+    """
+
+    class MockReactions:
+        def __init__(self):
+            # O2 -> O* (chemical), O* -> OH* and OH* -> H2O (electrochemical),
+            # O2 -> OH* (electrochemical)
+            self.list = ["DA", "RA", "RT", "RD"]
+            self.ne = np.array([0.0, -1.0, -1.0, -1.0])
+            self.upsilon_a = np.array(
+                [[1.0, 0.0], [0.0, 1.0], [-1.0, 1.0], [0.0, -1.0]]
+            )
+
+    class MockKpynetic:
+        def __init__(self):
+            self.reactions = TestScreener.MockReactions()
+            self.electrode = -1.0
+
+    @patch("melektrodica.screener.Coordinator")
+    def test_limiting_potential(self, mock_coordinator):
+        coordinator = mock_coordinator.return_value
+        coordinator.Kpy = self.MockKpynetic()
+        coordinator.shortest_paths.return_value = (
+            [["O2", "OH*", "H2O"], ["O2", "O*", "OH*", "H2O"]],
+            [["RA", "RD"], ["DA", "RT", "RD"]],
+        )
+        coordinator.pathway_sigma.return_value = np.array(
+            [[0.0, 1.0, 0.0, 1.0], [1.0, 0.0, 1.0, 1.0]]
+        )
+        screener = Screener(MagicMock(), "O2", "H2O")
+        coordinator.shortest_paths.assert_called_once_with(
+            "O2", "H2O", None, max_length=None
+        )
+
+        g_formation = np.array([[-0.343, -0.376], [0.2, -0.5]])
+        screener.evaluate(g_formation, block=1)
+        np.testing.assert_allclose(
+            screener.limiting_potential, [[0.376, 0.376], [0.5, 0.5]]
+        )
+        np.testing.assert_allclose(screener.equilibrium, 0.0, atol=1e-12)
+        np.testing.assert_array_equal(screener.determining, [[3, 3], [3, 3]])
+        np.testing.assert_allclose(screener.chemical[:, 1], [-0.343, 0.2])
+        self.assertTrue(np.all(np.isneginf(screener.chemical[:, 0])))
+
+    def test_tutorial(self):
+        writer = MagicMock()
+        data = Collector(os.path.join(EXAMPLES, "Wang2007Hydrogen"), writer=writer)
+        screener = Screener(Kpynetic(data, writer=writer), "H2", "H+")
+        self.assertEqual(screener.pathways, [["DA", "OD"], ["OA", "OD"]])
+
+        g_formation = np.array([-0.2, 0.1, 0.3])
+        screener.evaluate(g_formation[:, None], block=2)
+        # H* formed on Pt from H2 is oxidized at the hydrogen equilibrium potential
+        np.testing.assert_allclose(screener.equilibrium, 0.0, atol=1e-12)
+        np.testing.assert_allclose(
+            screener.limiting_potential,
+            np.stack([-g_formation, np.abs(g_formation)], axis=1),
+        )
+        np.testing.assert_array_equal(screener.determining, [[2, 2], [2, 1], [2, 1]])
+        np.testing.assert_allclose(screener.chemical[:, 0], 2 * g_formation)
+        self.assertTrue(np.all(np.isneginf(screener.chemical[:, 1])))
+        self.assertIn("DA-OD", screener.report(material=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
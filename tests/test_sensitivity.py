@@ -0,0 +1,81 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Sensitivity, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Sensitivity
+from melektrodica.calculator import StaticConcentration
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+class TestSensitivity(unittest.TestCase):
+    """
+    Unit test class for the sensitivity matrix of the hydrogen tutorial, compared
+    with finite differences of the residuals.
+    """
+
+    def setUp(self):
+        for target in ["melektrodica.sensitivity.Writer", "melektrodica.calculator.Writer"]:
+            patcher = patch(target, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.kpy = tutorial("Wang2007Hydrogen")
+        self.potential = np.linspace(0.05, 0.5, 10)
+        self.kpy.data.parameters.potential = self.potential
+        self.j_data = 1.1 * np.abs(StaticConcentration(self.kpy).solver().j)
+        self.sensitivity = Sensitivity(self.kpy, self.potential, self.j_data)
+
+    def residuals(self, x):
+        self.sensitivity.apply_parameters(x)
+        j = self.sensitivity.strategy.solver().j
+        return (self.j_data - np.abs(j)) / np.sqrt(self.j_data)
+
+    def test_sensitivity_matrix(self):
+        sensitivity = self.sensitivity
+        S = sensitivity.S.copy()
+        np.testing.assert_allclose(sensitivity.r, self.residuals(sensitivity.x))
+        h = 1e-6
+        for p in range(len(sensitivity.x)):
+            dx = np.zeros(len(sensitivity.x))
+            dx[p] = h
+            dr = (self.residuals(sensitivity.x + dx) - self.residuals(sensitivity.x - dx))
+            np.testing.assert_allclose(
+                S[:, p], dr / (2 * h), atol=1e-6 * np.max(np.abs(S))
+            )
+        np.testing.assert_allclose(sensitivity.fisher, S.T @ S)
+
+    def test_signed_data(self):
+        cathodic = Sensitivity(self.kpy, self.potential, -self.j_data)
+        np.testing.assert_allclose(cathodic.r, self.sensitivity.r)
+        np.testing.assert_allclose(cathodic.S, self.sensitivity.S)
+
+    def test_profile(self):
+        S = self.sensitivity.S.copy()
+        values, profile = self.sensitivity.profile(0, n_points=3)
+        self.assertEqual(len(profile), 3)
+        self.assertTrue(np.all(np.isfinite(profile)))
+        self.sensitivity.evaluate()
+        np.testing.assert_allclose(self.sensitivity.S, S, rtol=1e-8)
+
+
+if __name__ == "__main__":
+    unittest.main()
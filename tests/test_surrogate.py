@@ -0,0 +1,61 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Surrogate, Unit test
+
+"""
+
+import unittest
+import numpy as np
+from melektrodica.surrogate import Surrogate
+
+
+class TestSurrogate(unittest.TestCase):
+    """
+    Unit test class for the Gaussian process Surrogate used by the Bayesian optimizer.
+    """
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.lb = np.array([0.0, -1.0])
+        self.ub = np.array([2.0, 1.0])
+        self.x = self.lb + self.rng.random((25, 2)) * (self.ub - self.lb)
+        self.y = np.sum((self.x - np.array([1.2, 0.3])) ** 2, axis=1)
+        self.surrogate = Surrogate(self.lb, self.ub, rng=self.rng).fit(self.x, self.y)
+
+    def test_scale_unscale(self):
+        u = self.surrogate.scale(self.x)
+        self.assertTrue(np.all((u >= 0) & (u <= 1)))
+        np.testing.assert_array_almost_equal(self.surrogate.unscale(u), self.x)
+
+    def test_predict_interpolates_observations(self):
+        mean, std = self.surrogate.predict(self.x)
+        np.testing.assert_allclose(mean, self.y, atol=5e-2)
+        self.assertTrue(np.all(std >= 0))
+
+    def test_expected_improvement_nonnegative(self):
+        x = self.lb + self.rng.random((50, 2)) * (self.ub - self.lb)
+        self.assertTrue(np.all(self.surrogate.expected_improvement(x) >= 0))
+
+    def test_propose_within_bounds(self):
+        x = self.surrogate.propose()
+        self.assertTrue(np.all(x >= self.lb) and np.all(x <= self.ub))
+        self.assertLess(np.sum((x - np.array([1.2, 0.3])) ** 2), 0.2)
+
+    def test_propose_batch_restores_observations(self):
+        batch = self.surrogate.propose_batch(3)
+        self.assertEqual(batch.shape, (3, 2))
+        self.assertEqual(len(self.surrogate.y), len(self.y))
+
+    def test_non_finite_observations(self):
+        y = np.copy(self.y)
+        y[0] = np.inf
+        surrogate = Surrogate(self.lb, self.ub, rng=self.rng).fit(self.x, y)
+        self.assertEqual(surrogate.y[0], np.max(self.y[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
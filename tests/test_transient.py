@@ -0,0 +1,111 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Transient, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Transient
+from melektrodica.calculator import StaticConcentration
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(potential=None):
+    """
+    Kinetic model of the hydrogen tutorial, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, "Wang2007Hydrogen"), writer=writer)
+    if potential is not None:
+        data.parameters.potential = np.array(potential, dtype=float)
+    return Kpynetic(data, writer=writer)
+
+
+def polarization(potential):
+    return StaticConcentration(tutorial(potential)).solver().j
+
+
+class TestTransient(unittest.TestCase):
+    """
+    Unit test class for the time-domain simulation of the hydrogen tutorial.
+    """
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.kpy = tutorial()
+        self.transient = Transient(self.kpy)
+
+    def test_potential(self):
+        np.testing.assert_array_equal(
+            self.transient.potential, self.kpy.data.parameters.potential
+        )
+        self.transient.initial_state(0.2)
+        np.testing.assert_array_equal(
+            self.transient.operation.potential, self.kpy.data.parameters.potential
+        )
+
+    def test_slow_sweep(self):
+        transient = self.transient.sweep([0.05, 0.5], 1e-3, resolution=0.05)
+        np.testing.assert_allclose(transient.eta, np.linspace(0.05, 0.5, 10))
+        np.testing.assert_allclose(transient.time, np.linspace(0.0, 450.0, 10))
+        np.testing.assert_allclose(transient.j, polarization(transient.eta), rtol=1e-4)
+
+    def test_jacobian(self):
+        strategy = self.transient.strategy
+        h = 1e-7
+        for x in [np.array([0.3]), np.array([0.05]), np.array([0.9])]:
+            for potential in [0.0, 0.25, 0.5]:
+                jacobian = np.zeros((len(x), len(x)))
+                for k in range(len(x)):
+                    dx = np.zeros(len(x))
+                    dx[k] = h
+                    jacobian[:, k] = (
+                            strategy.steady_state(x + dx, potential)
+                            - strategy.steady_state(x - dx, potential)
+                    ) / (2 * h)
+                np.testing.assert_allclose(
+                    strategy.jacobian(x, potential), jacobian, rtol=1e-6
+                )
+
+    def test_program(self):
+        transient = self.transient.program(
+            [(0.1, 1.0), (0.1, 0.3, 10.0), (0.3, 1.0)], tolerance=1e-6
+        )
+        self.assertEqual(len(transient.time), 303)
+        self.assertEqual(transient.steady[0], 0.0)
+        self.assertTrue(np.isnan(transient.steady[1]))
+        self.assertTrue(11.0 < transient.steady[2] < 12.0)
+
+        ramp = slice(101, 202)
+        np.testing.assert_allclose(transient.eta[ramp], np.linspace(0.1, 0.3, 101))
+        np.testing.assert_allclose(transient.time[ramp], np.linspace(1.0, 11.0, 101))
+        np.testing.assert_allclose(
+            transient.j[ramp], polarization(transient.eta[ramp]), rtol=1e-4
+        )
+
+        steady = polarization([0.1, 0.3])
+        np.testing.assert_allclose(transient.j[:101], steady[0], rtol=1e-8)
+        tail = transient.time[202:] > transient.steady[2]
+        self.assertTrue(np.any(tail))
+        np.testing.assert_allclose(transient.eta[202:], 0.3)
+        np.testing.assert_allclose(transient.j[202:][tail], steady[1], rtol=1e-6)
+
+    def test_malformed_step(self):
+        with self.assertRaises(ValueError):
+            self.transient.program([(0.1, 1.0), (0.2,)])
+        with self.assertRaises(ValueError):
+            self.transient.program([(0.1, 0.2, 0.3, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+
+    μElektrodica © 2025
+        by C. Baqueiro Basto, M. Secanell, L.C. Ordoñez
+        is licensed under CC BY-NC-SA 4.0
+
+        Volcano, Unit test
+
+"""
+
+import os
+import unittest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from melektrodica import Collector, Kpynetic, Volcano
+from melektrodica.calculator import StaticConcentration
+from melektrodica.constants import F
+from melektrodica.kpynetic import RateConstants
+from melektrodica.volcano import solve_row
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "tutorials", "examples")
+
+
+def tutorial(name):
+    """
+    Kinetic model of a tutorial mechanism, logging to a mock writer.
+    """
+    writer = MagicMock()
+    data = Collector(os.path.join(EXAMPLES, name), writer=writer)
+    return Kpynetic(data, writer=writer)
+
+
+class TestSolveRow(unittest.TestCase):
+    """
+    Unit test class for the convergence check of the points of a row.
+    """
+
+    class MockStrategy:
+        def __init__(self, residuals):
+            self.residuals = iter(residuals)
+            self.operation = MagicMock(potential=np.array([0.1, 0.2]))
+            self.reactions = MagicMock(list=["R1", "R2"])
+            self.Kpy = MagicMock()
+            self.initial = []
+
+        def solver(self, callback=None, initial=None):
+            self.initial.append(initial)
+            part = self.Kpy.thermochemical_part
+            self.fval = np.array(next(self.residuals), dtype=float)[:, None]
+            self.forward = np.full((2, 2), 1.0)
+            self.backward = np.full((2, 2), 0.5)
+            self.j = np.array([1.0, 2.0]) * part
+            self.nu = np.full((2, 2), 0.5) * part
+            self.state = np.array([[part], [-part]])
+            return self
+
+    def test_convergence(self):
+        strategy = self.MockStrategy([[0.0, 1e-9], [1e-9, 1e-3], [1e-3, 0.0], [0.0, 0.0]])
+        current, rates, initial = solve_row(strategy, [1.0, 2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(
+            current, [[1.0, 2.0], [2.0, np.nan], [np.nan, 6.0], [4.0, 8.0]]
+        )
+        np.testing.assert_array_equal(rates[1, 1], [np.nan, np.nan])
+        np.testing.assert_array_equal(rates[3, 0], [2.0, 2.0])
+        self.assertEqual(strategy.initial[:3], [None, 1.0, 2.0])
+        self.assertIsNone(strategy.initial[3])
+        np.testing.assert_array_equal(initial, [4.0])
+
+
+class TestVolcano(unittest.TestCase):
+    """
+    Unit test class for the volcano map of the hydrogen tutorial, compared with
+    independent steady states.
+    """
+
+    def setUp(self):
+        patcher = patch("melektrodica.calculator.Writer", MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.kpy = tutorial("Wang2007Hydrogen")
+
+    def test_tutorial(self):
+        descriptor = np.linspace(-0.3, 0.3, 5)
+        potential = np.array([0.05, 0.2])
+        volcano = Volcano(self.kpy, [0.0], [1.0], descriptor, potential=potential)
+        self.assertEqual(volcano.current.shape, (5, 2))
+        self.assertEqual(volcano.rates.shape, (5, 2, 3))
+        self.assertTrue(np.all(np.isfinite(volcano.current)))
+        np.testing.assert_allclose(
+            volcano.current, F * volcano.rates @ volcano.reactions.ne
+        )
+        for p, g in enumerate(descriptor):
+            kpy = tutorial("Wang2007Hydrogen")
+            kpy.data.parameters.potential = potential
+            kpy.thermochemical_part = RateConstants.thermochemical(
+                kpy.reactions.ga, np.array([g]), kpy.reactions.upsilon_a
+            )
+            strategy = StaticConcentration(kpy).solver()
+            np.testing.assert_allclose(volcano.current[p], strategy.j, rtol=1e-6)
+            np.testing.assert_allclose(volcano.rates[p], strategy.nu, rtol=1e-6)
+
+    def test_two_descriptors(self):
+        volcano = Volcano(
+            self.kpy, [0.0], [[0.5, 0.5]], [[-0.2, 0.2], [-0.2, 0.0, 0.2]],
+            potential=0.1,
+        )
+        self.assertEqual(volcano.current.shape, (2, 3, 1))
+        np.testing.assert_allclose(volcano.current[0, 2], volcano.current[1, 0])
+
+    def test_without_thermochemistry(self):
+        self.kpy.data.parameters.thermochemical = False
+        with self.assertRaises(ValueError):
+            Volcano(self.kpy, [0.0], [1.0], [0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()